@@ -9,23 +9,22 @@ from homeassistant.config_entries import SOURCE_IMPORT, ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.storage import Store
 from pydanfossally import DanfossAlly, exceptions
 
 from .const import (
-    API_TIMEOUT,
     CONF_KEY,
     CONF_SECRET,
     DOMAIN,
-    HOT_REFRESH_TIMEOUT,
     PLATFORMS,
-    REFRESH_DEVICE_CONCURRENCY,
-    REFRESH_DEVICE_MIN_INTERVAL,
-    USER_AGENT_PREFIX,
 )
 from .coordinator import (
+    SNAPSHOT_STORE_KEY,
+    SNAPSHOT_STORE_VERSION,
     DanfossConfigEntry,
     DanfossAllyDataUpdateCoordinator,
     DanfossAllyRuntimeData,
+    async_get_transport,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -68,13 +67,9 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
 
 async def async_setup_entry(hass: HomeAssistant, entry: DanfossConfigEntry) -> bool:
     """Set up Danfoss Ally from a config entry."""
-    client = DanfossAlly(
-        timeout=API_TIMEOUT,
-        refresh_device_concurrency=REFRESH_DEVICE_CONCURRENCY,
-        refresh_device_min_interval=REFRESH_DEVICE_MIN_INTERVAL,
-        hot_refresh_timeout=HOT_REFRESH_TIMEOUT,
-        user_agent_prefix=USER_AGENT_PREFIX,
-    )
+    # Entries share one HTTP session and in-flight request budget.
+    transport = async_get_transport(hass)
+    client = transport.async_create_client(entry.entry_id)
 
     try:
         authorized = await client.initialize(
@@ -82,55 +77,66 @@ async def async_setup_entry(hass: HomeAssistant, entry: DanfossConfigEntry) -> b
             entry.data[CONF_SECRET],
         )
     except TimeoutError as err:
-        await client.aclose()
+        await _async_release_client(hass, entry, client)
         raise ConfigEntryNotReady(
             "Danfoss Ally API timeout. Opening an issue will not help with this error."
         ) from err
     except ConnectionError as err:
-        await client.aclose()
+        await _async_release_client(hass, entry, client)
         raise ConfigEntryNotReady("Could not reach the Danfoss Ally API.") from err
     except exceptions.ForbiddenError as err:
-        await client.aclose()
+        await _async_release_client(hass, entry, client)
         raise ConfigEntryNotReady("Danfoss Ally API denied access (HTTP 403).") from err
     except exceptions.RateLimitError as err:
-        await client.aclose()
+        await _async_release_client(hass, entry, client)
         raise ConfigEntryNotReady(
             "Danfoss Ally API rate limit reached (HTTP 429)."
         ) from err
     except exceptions.InternalServerError as err:
-        await client.aclose()
+        await _async_release_client(hass, entry, client)
         raise ConfigEntryNotReady("Danfoss Ally API server error (HTTP 5xx).") from err
     except exceptions.APIError as err:
-        await client.aclose()
+        await _async_release_client(hass, entry, client)
         raise ConfigEntryNotReady(f"Unexpected Danfoss Ally API error: {err}") from err
     except exceptions.UnexpectedError as err:
-        await client.aclose()
+        await _async_release_client(hass, entry, client)
         raise ConfigEntryNotReady(
             f"Unexpected Danfoss Ally API error: {err or err.__class__.__name__}"
         ) from err
     except Exception as err:  # pylint: disable=broad-except
-        await client.aclose()
+        await _async_release_client(hass, entry, client)
         raise ConfigEntryNotReady(
             f"Unexpected Danfoss Ally setup error: {err or err.__class__.__name__}"
         ) from err
 
     if not authorized:
-        await client.aclose()
+        await _async_release_client(hass, entry, client)
         raise ConfigEntryAuthFailed(AUTH_FAILED_MESSAGE)
 
-    coordinator = DanfossAllyDataUpdateCoordinator(hass, client, entry)
+    coordinator = DanfossAllyDataUpdateCoordinator(
+        hass, client, entry, transport.request_slots
+    )
 
-    try:
-        await coordinator.async_config_entry_first_refresh()
-    except Exception:
-        await client.aclose()
-        raise
+    if await coordinator.async_load_snapshot_cache():
+        # Start from the cached snapshot and reconcile with the cloud afterwards.
+        entry.async_create_background_task(
+            hass,
+            coordinator.async_refresh(),
+            name=f"{DOMAIN} snapshot reconcile",
+        )
+    else:
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except Exception:
+            await _async_release_client(hass, entry, client)
+            raise
 
     entry.runtime_data = DanfossAllyRuntimeData(client=client, coordinator=coordinator)
 
     # Setup runtime listeners
     await coordinator.async_setup_external_temp_listeners()
     await coordinator.async_setup_window_sensor_listeners()
+    coordinator.async_setup_device_discovery()
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
@@ -158,13 +164,32 @@ async def async_unload_entry(hass: HomeAssistant, entry: DanfossConfigEntry) ->
     # Cleanup runtime listeners
     await entry.runtime_data.coordinator.async_unload_external_temp_listeners()
     await entry.runtime_data.coordinator.async_unload_window_sensor_listeners()
+    entry.runtime_data.coordinator.async_unload_source_index()
+    entry.runtime_data.coordinator.async_cancel_hot_refreshes()
+    entry.runtime_data.coordinator.async_cancel_queued_writes()
 
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        await entry.runtime_data.client.aclose()
+        await _async_release_client(hass, entry, entry.runtime_data.client)
     return unload_ok
 
 
+async def _async_release_client(
+    hass: HomeAssistant, entry: ConfigEntry, client: DanfossAlly
+) -> None:
+    """Close the client of a config entry and release the shared session."""
+    await async_get_transport(hass).async_release_client(entry.entry_id, client)
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: DanfossConfigEntry) -> None:
+    """Remove the cached snapshot of a deleted config entry."""
+    await Store(
+        hass,
+        SNAPSHOT_STORE_VERSION,
+        f"{SNAPSHOT_STORE_KEY}.{entry.entry_id}",
+    ).async_remove()
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: DanfossConfigEntry) -> None:
     """Reload a config entry."""
     await hass.config_entries.async_reload(entry.entry_id)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 
 from homeassistant.components.binary_sensor import (
@@ -23,6 +23,7 @@ class DanfossAllyBinarySensorDescription(BinarySensorEntityDescription):
 
     exists_fn: Callable[[dict[str, object]], bool]
     value_fn: Callable[[dict[str, object]], bool]
+    device_keys: tuple[str, ...]
     unique_prefix: str
 
 
@@ -33,6 +34,7 @@ BINARY_SENSORS: tuple[DanfossAllyBinarySensorDescription, ...] = (
         device_class=BinarySensorDeviceClass.WINDOW,
         exists_fn=lambda device: "window_open" in device,
         value_fn=lambda device: bool(device["window_open"]),
+        device_keys=("window_open", "window_toggle"),
         unique_prefix="open window",
     ),
     DanfossAllyBinarySensorDescription(
@@ -41,6 +43,7 @@ BINARY_SENSORS: tuple[DanfossAllyBinarySensorDescription, ...] = (
         device_class=BinarySensorDeviceClass.LOCK,
         exists_fn=lambda device: "child_lock" in device,
         value_fn=lambda device: not bool(device["child_lock"]),
+        device_keys=("child_lock",),
         unique_prefix="child lock",
     ),
     DanfossAllyBinarySensorDescription(
@@ -50,6 +53,7 @@ BINARY_SENSORS: tuple[DanfossAllyBinarySensorDescription, ...] = (
         entity_category=EntityCategory.DIAGNOSTIC,
         exists_fn=lambda device: "online" in device,
         value_fn=lambda device: bool(device["online"]),
+        device_keys=("online",),
         unique_prefix="connectivity",
     ),
     DanfossAllyBinarySensorDescription(
@@ -62,6 +66,7 @@ BINARY_SENSORS: tuple[DanfossAllyBinarySensorDescription, ...] = (
             device.get("setpointchangesource", device.get("SetpointChangeSource"))
             == "Manual"
         ),
+        device_keys=("setpointchangesource", "SetpointChangeSource"),
         unique_prefix="Setpoint Change Source",
     ),
     DanfossAllyBinarySensorDescription(
@@ -72,6 +77,7 @@ BINARY_SENSORS: tuple[DanfossAllyBinarySensorDescription, ...] = (
         value_fn=lambda device: (
             bool(device["switch_state"]) and bool(device.get("switch", False))
         ),
+        device_keys=("switch_state", "switch"),
         unique_prefix="Pre-Heating",
     ),
     DanfossAllyBinarySensorDescription(
@@ -82,6 +88,7 @@ BINARY_SENSORS: tuple[DanfossAllyBinarySensorDescription, ...] = (
         entity_registry_enabled_default=False,
         exists_fn=lambda device: "mounting_mode_active" in device,
         value_fn=lambda device: bool(device["mounting_mode_active"]),
+        device_keys=("mounting_mode_active",),
         unique_prefix="mounting mode active",
     ),
     DanfossAllyBinarySensorDescription(
@@ -91,6 +98,7 @@ BINARY_SENSORS: tuple[DanfossAllyBinarySensorDescription, ...] = (
         entity_registry_enabled_default=False,
         exists_fn=lambda device: "heat_supply_request" in device,
         value_fn=lambda device: bool(device["heat_supply_request"]),
+        device_keys=("heat_supply_request",),
         unique_prefix="heat supply request",
     ),
     DanfossAllyBinarySensorDescription(
@@ -100,6 +108,7 @@ BINARY_SENSORS: tuple[DanfossAllyBinarySensorDescription, ...] = (
         icon="mdi:pipe-valve",
         exists_fn=lambda device: "output_status" in device,
         value_fn=lambda device: bool(device["output_status"]),
+        device_keys=("output_status",),
         unique_prefix="Thermal actuator",
     ),
     DanfossAllyBinarySensorDescription(
@@ -111,6 +120,7 @@ BINARY_SENSORS: tuple[DanfossAllyBinarySensorDescription, ...] = (
         entity_registry_enabled_default=False,
         exists_fn=lambda device: "adaptation_runstatus" in device,
         value_fn=lambda device: bool(int(device["adaptation_runstatus"]) & 0x01),
+        device_keys=("adaptation_runstatus",),
         unique_prefix="adaptation run status",
     ),
     DanfossAllyBinarySensorDescription(
@@ -124,6 +134,7 @@ BINARY_SENSORS: tuple[DanfossAllyBinarySensorDescription, ...] = (
             bool(int(device["adaptation_runstatus"]) & 0x02)
             and not bool(int(device["adaptation_runstatus"]) & 0x04)
         ),
+        device_keys=("adaptation_runstatus",),
         unique_prefix="adaptation run valve characteristic found",
     ),
 )
@@ -138,10 +149,13 @@ async def async_setup_entry(
     async_setup_dynamic_platform_entities(entry, async_add_entities, _build_entities)
 
 
-def _build_entities(coordinator) -> list[DanfossAllyBinarySensor]:
-    """Build binary sensor entities for currently discovered devices."""
+def _build_entities(
+    coordinator, device_ids: Iterable[str]
+) -> list[DanfossAllyBinarySensor]:
+    """Build binary sensor entities for the given discovered devices."""
     entities: list[DanfossAllyBinarySensor] = []
-    for device_id, device in (coordinator.data or {}).items():
+    for device_id in device_ids:
+        device = coordinator.data[device_id]
         for description in BINARY_SENSORS:
             if description.exists_fn(device):
                 entities.append(
@@ -162,7 +176,7 @@ class DanfossAllyBinarySensor(DanfossAllyEntity, BinarySensorEntity):
         description: DanfossAllyBinarySensorDescription,
     ) -> None:
         """Initialize the binary sensor."""
-        super().__init__(coordinator, device_id)
+        super().__init__(coordinator, device_id, description.device_keys)
         self.entity_description = description
         self._attr_translation_key = description.translation_key
         self._attr_unique_id = f"{description.unique_prefix}_{device_id}_ally"
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from datetime import UTC, datetime, timedelta
 import logging
 from typing import Any
@@ -43,6 +44,30 @@ PRESET_TO_MODE = {
 
 MODE_TO_PRESET = {value: key for key, value in PRESET_TO_MODE.items()}
 
+CLIMATE_DEVICE_KEYS = (
+    "model",
+    "mode",
+    "work_state",
+    "output_status",
+    "valve_opening",
+    "valveOpening",
+    "temperature",
+    "ext_measured_rs",
+    "external_sensor_temperature",
+    "radiator_covered",
+    "window_toggle",
+    "setpointchangesource",
+    "SetpointChangeSource",
+    "temp_set",
+    "manual_mode_fast",
+    "at_home_setting",
+    "leaving_home_setting",
+    "pause_setting",
+    "holiday_setting",
+    "lower_temp",
+    "upper_temp",
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -72,12 +97,12 @@ async def async_setup_entry(
     async_setup_dynamic_platform_entities(entry, async_add_entities, _build_entities)
 
 
-def _build_entities(coordinator) -> list[DanfossAllyClimate]:
-    """Build climate entities for currently discovered thermostats."""
+def _build_entities(coordinator, device_ids: Iterable[str]) -> list[DanfossAllyClimate]:
+    """Build climate entities for the given discovered thermostats."""
     return [
         DanfossAllyClimate(coordinator, device_id)
-        for device_id, device in (coordinator.data or {}).items()
-        if device.get("isThermostat")
+        for device_id in device_ids
+        if coordinator.data[device_id].get("isThermostat")
     ]
 
 
@@ -94,7 +119,7 @@ class DanfossAllyClimate(DanfossAllyEntity, ClimateEntity):
 
     def __init__(self, coordinator, device_id: str) -> None:
         """Initialize the climate entity."""
-        super().__init__(coordinator, device_id)
+        super().__init__(coordinator, device_id, CLIMATE_DEVICE_KEYS)
         self._attr_unique_id = f"climate_{device_id}_ally"
         self._last_external_temperature_write: datetime | None = None
 
@@ -18,11 +18,29 @@ DEFAULT_NAME = "Danfoss"
 DOMAIN = "danfoss_ally"
 API_TIMEOUT = 30.0
 SCAN_INTERVAL = timedelta(seconds=60)
+FAST_SCAN_INTERVAL = timedelta(seconds=15)
+MAX_SCAN_INTERVAL = timedelta(minutes=10)
+FAST_POLL_WINDOW = 120.0
+API_REQUESTS_PER_HOUR = 600
 REFRESH_DEVICE_CONCURRENCY = 5
 REFRESH_DEVICE_MIN_INTERVAL = 0.10
+SHARED_REQUEST_CONCURRENCY = 8
 DEVICE_DISCOVERY_INTERVAL = 600.0
+DEVICE_REMOVAL_DISCOVERY_ROUNDS = 3
 DEGRADED_REFRESH_COOLDOWN = 600.0
+DEGRADED_FAILURE_THRESHOLD = 3
 HOT_REFRESH_TIMEOUT = 300.0
+STALE_DEVICE_MERGE = True
+WRITE_COALESCE_DELAY = 0.25
+WRITE_MAX_LATENCY = 1.0
+REQUEST_RATE_LIMIT = 2.0
+REQUEST_BURST = 5
+MIN_REQUEST_RATE = 0.05
+SNAPSHOT_CACHE_MAX_AGE = 86400.0
+SNAPSHOT_CACHE_SAVE_DELAY = 300.0
+CIRCUIT_FAILURE_THRESHOLD = 3
+MAX_RETRY_AFTER = 3600.0
+RETRY_JITTER = 0.2
 
 PLATFORMS: list[Platform] = [
     Platform.BINARY_SENSOR,
@@ -2,33 +2,78 @@
 
 from __future__ import annotations
 
+import asyncio
+import bisect
+import heapq
 import logging
 import math
+import random
+import sys
 import time
-from collections.abc import Awaitable
-from dataclasses import dataclass
+from collections import deque
+from collections.abc import Awaitable, Coroutine, Iterator, Mapping, Reversible
+from dataclasses import asdict, dataclass, field
+from datetime import timedelta
 from typing import Any
 
+import aiohttp
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     EVENT_HOMEASSISTANT_STARTED,
+    EVENT_STATE_CHANGED,
     STATE_OFF,
     STATE_ON,
     STATE_OPEN,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
 )
-from homeassistant.core import CoreState, HomeAssistant
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    CoreState,
+    Event,
+    HomeAssistant,
+    callback,
+)
 from homeassistant.exceptions import ConfigEntryAuthFailed, HomeAssistantError
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from pydanfossally import DanfossAlly, exceptions
+from pydanfossally import DanfossAlly, DanfossAllyAPI, exceptions
+from pydanfossally.danfossallyapi import API_HOST
 
 from .const import (
+    API_REQUESTS_PER_HOUR,
+    API_TIMEOUT,
+    CIRCUIT_FAILURE_THRESHOLD,
     CONF_EXTERNAL_SENSORS,
     CONF_WINDOW_SENSORS,
+    DEGRADED_FAILURE_THRESHOLD,
+    DEGRADED_REFRESH_COOLDOWN,
+    DEVICE_DISCOVERY_INTERVAL,
+    DEVICE_REMOVAL_DISCOVERY_ROUNDS,
     DOMAIN,
+    FAST_POLL_WINDOW,
+    FAST_SCAN_INTERVAL,
+    HOT_REFRESH_TIMEOUT,
+    MAX_RETRY_AFTER,
+    MAX_SCAN_INTERVAL,
+    MIN_REQUEST_RATE,
+    REFRESH_DEVICE_CONCURRENCY,
+    REFRESH_DEVICE_MIN_INTERVAL,
+    REQUEST_BURST,
+    REQUEST_RATE_LIMIT,
+    RETRY_JITTER,
     SCAN_INTERVAL,
+    SHARED_REQUEST_CONCURRENCY,
+    SNAPSHOT_CACHE_MAX_AGE,
+    SNAPSHOT_CACHE_SAVE_DELAY,
+    STALE_DEVICE_MERGE,
+    USER_AGENT_PREFIX,
+    WRITE_COALESCE_DELAY,
+    WRITE_MAX_LATENCY,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -40,12 +85,67 @@ RATE_LIMIT_RETRY_AFTER = 900.0
 SERVER_ERROR_RETRY_AFTER = 600.0
 GENERIC_API_RETRY_AFTER = 300.0
 RATE_LIMIT_ERROR_MESSAGE = "Danfoss Ally API rate limit reached (HTTP 429)."
+CIRCUIT_OPEN_MESSAGE = (
+    "Danfoss Ally API is unavailable after repeated failures; "
+    "requests are paused until it recovers."
+)
 AUTH_FAILED_MESSAGE = (
     "Authentication failed. Check your Consumer Key and Consumer Secret."
 )
+WRITE_CANCELLED_MESSAGE = "the write was cancelled before it was sent"
 WINDOW_SENSOR_DELAY = 60.0
 WINDOW_RESTORE_STORE_KEY = f"{DOMAIN}_window_restore"
 WINDOW_RESTORE_STORE_VERSION = 1
+SNAPSHOT_STORE_KEY = f"{DOMAIN}_snapshot"
+SNAPSHOT_STORE_VERSION = 1
+SOURCE_ENTITY_DOMAINS = frozenset({"sensor", "binary_sensor", "group"})
+SNAPSHOT_DIFF_IGNORED_KEYS = frozenset({"last_response_time"})
+API_BUDGET_WINDOW = 3600.0
+API_FORECAST_WINDOW = 600.0
+RATE_LIMIT_FORECAST_HORIZON = RATE_LIMIT_RETRY_AFTER
+MIN_POLL_BUDGET_SHARE = 0.1
+REQUEST_KIND_POLL = "poll"
+REQUEST_KIND_WRITE = "write"
+REQUEST_KIND_DISCOVERY = "discovery"
+REQUEST_PRIORITY_USER_WRITE = 0
+REQUEST_PRIORITY_WINDOW = 1
+REQUEST_PRIORITY_EXTERNAL_TEMPERATURE = 2
+REQUEST_PRIORITY_POLL = 3
+REQUEST_RATE_RECOVERY_STEP = 0.05
+MAX_RECORD_LAYOUTS = 256
+MAX_IDLE_BACKOFF_STEPS = 10
+MAX_RETRY_BACKOFF_STEPS = 16
+DEVICE_RETRY_AFTER = 30.0
+HOT_REFRESH_DELAYS = (2.0, 3.0, 5.0, 8.0, 13.0)
+MAX_DEVICE_RETRY_AFTER = 900.0
+POLL_DURATION_BUCKETS = (0.5, 1.0, 2.0, 5.0, 10.0, 30.0)
+WRITE_LATENCY_BUCKETS = (0.25, 0.5, 1.0, 2.0, 5.0, 10.0)
+ERROR_CLASS_TIMEOUT = "timeout"
+ERROR_CLASS_CONNECTION = "connection"
+ERROR_CLASS_FORBIDDEN = "forbidden"
+ERROR_CLASS_RATE_LIMIT = "rate_limit"
+ERROR_CLASS_SERVER = "server_error"
+ERROR_CLASS_API = "api_error"
+RETRY_AFTER_BY_ERROR_CLASS = {
+    ERROR_CLASS_TIMEOUT: TIMEOUT_RETRY_AFTER,
+    ERROR_CLASS_CONNECTION: CONNECTION_RETRY_AFTER,
+    ERROR_CLASS_FORBIDDEN: FORBIDDEN_RETRY_AFTER,
+    ERROR_CLASS_RATE_LIMIT: RATE_LIMIT_RETRY_AFTER,
+    ERROR_CLASS_SERVER: SERVER_ERROR_RETRY_AFTER,
+    ERROR_CLASS_API: GENERIC_API_RETRY_AFTER,
+}
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+CIRCUIT_ERROR_CLASSES = frozenset(
+    {
+        ERROR_CLASS_TIMEOUT,
+        ERROR_CLASS_CONNECTION,
+        ERROR_CLASS_FORBIDDEN,
+        ERROR_CLASS_SERVER,
+    }
+)
+_MISSING = object()
 
 
 class _CoordinatorLoggerAdapter(logging.LoggerAdapter):
@@ -111,19 +211,640 @@ def _describe_api_error(err: BaseException) -> str:
     return "Unexpected Danfoss Ally API error."
 
 
-def _retry_after_for_error(err: BaseException) -> float:
-    """Return the retry delay in seconds for common API failures."""
+def _error_class(err: BaseException) -> str:
+    """Return the retry class used to pick delays and count common API failures."""
     if isinstance(err, TimeoutError):
-        return TIMEOUT_RETRY_AFTER
+        return ERROR_CLASS_TIMEOUT
     if isinstance(err, ConnectionError):
-        return CONNECTION_RETRY_AFTER
+        return ERROR_CLASS_CONNECTION
     if isinstance(err, exceptions.ForbiddenError):
-        return FORBIDDEN_RETRY_AFTER
+        return ERROR_CLASS_FORBIDDEN
     if isinstance(err, exceptions.RateLimitError):
-        return RATE_LIMIT_RETRY_AFTER
+        return ERROR_CLASS_RATE_LIMIT
     if isinstance(err, exceptions.InternalServerError):
-        return SERVER_ERROR_RETRY_AFTER
-    return GENERIC_API_RETRY_AFTER
+        return ERROR_CLASS_SERVER
+    return ERROR_CLASS_API
+
+
+def _resolve_write_waiters(
+    waiters: list[asyncio.Future[None]],
+    device_id: str,
+    error: BaseException | None,
+) -> None:
+    """Release callers waiting on a batched write with its outcome."""
+    if isinstance(error, asyncio.CancelledError):
+        error = HomeAssistantError(
+            f"Failed to send command for {device_id}: {WRITE_CANCELLED_MESSAGE}"
+        )
+    for waiter in waiters:
+        if waiter.done():
+            continue
+        if error is None:
+            waiter.set_result(None)
+        else:
+            waiter.set_exception(error)
+
+
+def _count_device_values(devices: Mapping[str, Mapping[str, Any]]) -> int:
+    """Return how many device values a poll response carried."""
+    return sum(len(device) for device in devices.values())
+
+
+class DeviceRecord(Mapping[str, Any]):
+    """Read-only device state sharing its key layout with similar devices."""
+
+    __slots__ = ("_layout", "_values")
+
+    def __init__(self, layout: dict[str, int], values: tuple[Any, ...]) -> None:
+        """Initialize the record from a shared layout and its values."""
+        self._layout = layout
+        self._values = values
+
+    def __getitem__(self, key: str) -> Any:
+        """Return one device value."""
+        return self._values[self._layout[key]]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the device keys."""
+        return iter(self._layout)
+
+    def __len__(self) -> int:
+        """Return the number of device keys."""
+        return len(self._layout)
+
+    def __contains__(self, key: object) -> bool:
+        """Return whether the device reports a key."""
+        return key in self._layout
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return one device value or a default."""
+        index = self._layout.get(key)
+        return default if index is None else self._values[index]
+
+    def __repr__(self) -> str:
+        """Return a dict-like representation for logs and diagnostics."""
+        return f"DeviceRecord({dict(self)!r})"
+
+
+_RECORD_LAYOUTS: dict[tuple[str, ...], dict[str, int]] = {}
+
+
+def _device_record(device: Mapping[str, Any]) -> DeviceRecord:
+    """Pack one device mapping into a compact record with a shared layout."""
+    if isinstance(device, DeviceRecord):
+        return device
+
+    keys = tuple(device)
+    layout = _RECORD_LAYOUTS.get(keys)
+    if layout is None:
+        if len(_RECORD_LAYOUTS) >= MAX_RECORD_LAYOUTS:
+            _RECORD_LAYOUTS.clear()
+        layout = _RECORD_LAYOUTS[keys] = {
+            sys.intern(key): index for index, key in enumerate(keys)
+        }
+    return DeviceRecord(layout, tuple(device.values()))
+
+
+def _merge_device_record(
+    device: Mapping[str, Any],
+    updates: Mapping[str, Any],
+) -> DeviceRecord:
+    """Return a record with updates applied, reusing its layout when possible."""
+    if isinstance(device, DeviceRecord) and device._layout.keys() >= updates.keys():
+        values = list(device._values)
+        for key, value in updates.items():
+            values[device._layout[key]] = value
+        return DeviceRecord(device._layout, tuple(values))
+
+    return _device_record({**device, **updates})
+
+
+class DeviceSnapshot(Mapping[str, Mapping[str, Any]]):
+    """Read-only snapshot sharing unchanged devices with the polled snapshot."""
+
+    __slots__ = ("_base", "_changes", "_added")
+
+    def __init__(
+        self,
+        base: dict[str, Mapping[str, Any]],
+        changes: dict[str, Mapping[str, Any]],
+    ) -> None:
+        """Initialize the snapshot from a shared base and replaced devices."""
+        self._base = base
+        self._changes = changes
+        self._added = sum(device_id not in base for device_id in changes)
+
+    def __getitem__(self, device_id: str) -> Mapping[str, Any]:
+        """Return one device record."""
+        try:
+            return self._changes[device_id]
+        except KeyError:
+            return self._base[device_id]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over device ids."""
+        yield from self._base
+        if self._added:
+            yield from (
+                device_id for device_id in self._changes if device_id not in self._base
+            )
+
+    def __len__(self) -> int:
+        """Return the number of devices."""
+        return len(self._base) + self._added
+
+    def __contains__(self, device_id: object) -> bool:
+        """Return whether a device is part of the snapshot."""
+        return device_id in self._changes or device_id in self._base
+
+    def get(self, device_id: str, default: Any = None) -> Any:
+        """Return one device record or a default."""
+        device = self._changes.get(device_id, _MISSING)
+        if device is _MISSING:
+            return self._base.get(device_id, default)
+        return device
+
+    def __repr__(self) -> str:
+        """Return a dict-like representation for logs."""
+        return f"DeviceSnapshot({dict(self)!r})"
+
+
+def _snapshot_with_device(
+    snapshot: Mapping[str, Mapping[str, Any]],
+    device_id: str,
+    device: Mapping[str, Any],
+) -> DeviceSnapshot:
+    """Return a snapshot with one device replaced, sharing all other devices."""
+    if isinstance(snapshot, DeviceSnapshot):
+        # Only devices written since the last poll are copied, never the fleet.
+        return DeviceSnapshot(snapshot._base, {**snapshot._changes, device_id: device})
+
+    return DeviceSnapshot(snapshot, {device_id: device})
+
+
+def _diff_device(
+    previous_device: Mapping[str, Any],
+    device: Mapping[str, Any],
+) -> frozenset[str]:
+    """Return the keys whose values differ between two device records."""
+    if previous_device is device:
+        return frozenset()
+
+    if (
+        isinstance(previous_device, DeviceRecord)
+        and isinstance(device, DeviceRecord)
+        and previous_device._layout is device._layout
+    ):
+        previous_values = previous_device._values
+        values = device._values
+        return frozenset(
+            key
+            for key, index in device._layout.items()
+            if key not in SNAPSHOT_DIFF_IGNORED_KEYS
+            and previous_values[index] != values[index]
+        )
+
+    return frozenset(
+        key
+        for key in previous_device.keys() | device.keys()
+        if key not in SNAPSHOT_DIFF_IGNORED_KEYS
+        and previous_device.get(key, _MISSING) != device.get(key, _MISSING)
+    )
+
+
+def _diff_device_snapshots(
+    previous: Mapping[str, Mapping[str, Any]],
+    current: Mapping[str, Mapping[str, Any]],
+) -> dict[str, frozenset[str]]:
+    """Return changed keys per device between two coordinator snapshots."""
+    changes: dict[str, frozenset[str]] = {}
+    for device_id, device in current.items():
+        previous_device = previous.get(device_id)
+        if previous_device is None:
+            changes[device_id] = frozenset(device)
+            continue
+
+        if changed_keys := _diff_device(previous_device, device):
+            changes[device_id] = changed_keys
+
+    for device_id in previous.keys() - current.keys():
+        changes[device_id] = frozenset(previous[device_id])
+
+    return changes
+
+
+def _snapshot_changed(
+    previous: Mapping[str, Mapping[str, Any]] | None,
+    current: Mapping[str, Mapping[str, Any]] | None,
+) -> bool:
+    """Return whether any device changed between two snapshots."""
+    if previous is current:
+        return False
+    if previous is None or current is None or previous.keys() != current.keys():
+        return True
+    return any(
+        _diff_device(previous[device_id], device)
+        for device_id, device in current.items()
+    )
+
+
+def _has_capability_change(
+    previous: Mapping[str, Mapping[str, Any]],
+    current: Mapping[str, Mapping[str, Any]],
+    device_changes: dict[str, frozenset[str]],
+) -> bool:
+    """Return whether changed devices were added, removed or gained/lost keys."""
+    for device_id in device_changes:
+        previous_device = previous.get(device_id)
+        device = current.get(device_id)
+        if previous_device is None or device is None:
+            return True
+        if previous_device.keys() != device.keys():
+            return True
+    return False
+
+
+@callback
+def _is_source_domain_event(event_data: dict[str, Any]) -> bool:
+    """Return whether a state change may affect the source option lists."""
+    return event_data["entity_id"].split(".", 1)[0] in SOURCE_ENTITY_DOMAINS
+
+
+@dataclass(frozen=True, slots=True)
+class DeviceKeySubscription:
+    """Listener context binding an entity to the device keys it reads."""
+
+    device_id: str
+    keys: frozenset[str] | None = None
+
+    def matches(self, changed_keys: frozenset[str]) -> bool:
+        """Return whether a device change touches the subscribed keys."""
+        return self.keys is None or not self.keys.isdisjoint(changed_keys)
+
+
+@dataclass(slots=True)
+class AdaptivePollScheduler:
+    """Pick poll intervals from recent activity and the hourly API budget."""
+
+    base_interval: float
+    fast_interval: float
+    max_interval: float
+    requests_per_hour: int
+    fast_until: float = 0.0
+    idle_polls: int = 0
+    poll_cost: int = 1
+    request_times: deque[float] = field(default_factory=deque)
+    kind_request_times: dict[str, deque[float]] = field(default_factory=dict)
+
+    def note_activity(self, now: float, window: float) -> None:
+        """Poll fast for a while after local activity."""
+        self.fast_until = max(self.fast_until, now + window)
+        self.idle_polls = 0
+
+    def record_requests(
+        self, now: float, count: int = 1, kind: str = REQUEST_KIND_WRITE
+    ) -> None:
+        """Count API requests of one endpoint kind against the rolling budget."""
+        self.request_times.extend([now] * count)
+        self.kind_request_times.setdefault(kind, deque()).extend([now] * count)
+
+    def record_poll(
+        self,
+        now: float,
+        *,
+        changed: bool,
+        requests: int,
+        kind: str = REQUEST_KIND_POLL,
+    ) -> None:
+        """Track the outcome and cost of one successful poll."""
+        self.record_requests(now, requests, kind)
+        self.poll_cost = max(1, requests)
+        self.idle_polls = 0 if changed else self.idle_polls + 1
+
+    def seconds_until_limit(self, now: float) -> float | None:
+        """Forecast when the hourly budget runs out at the recent request rate."""
+        self._prune(now)
+        rate = _count_since(self.request_times, now - API_FORECAST_WINDOW)
+        rate /= API_FORECAST_WINDOW
+        if rate * API_BUDGET_WINDOW <= self.requests_per_hour:
+            return None
+        remaining = self.requests_per_hour - len(self.request_times)
+        return max(0.0, remaining / rate)
+
+    def budget_diagnostics(self, now: float) -> dict[str, Any]:
+        """Return rolling request counts and the rate-limit forecast."""
+        forecast = self.seconds_until_limit(now)
+        return {
+            "window": API_BUDGET_WINDOW,
+            "limit": self.requests_per_hour,
+            "used": len(self.request_times),
+            "used_by_kind": {
+                kind: len(times)
+                for kind, times in sorted(self.kind_request_times.items())
+            },
+            "seconds_until_limit": forecast,
+        }
+
+    def next_interval(self, now: float) -> float:
+        """Return the delay in seconds until the next poll."""
+        forecast = self.seconds_until_limit(now)
+
+        if now < self.fast_until:
+            interval = self.fast_interval
+        else:
+            backoff = 2 ** min(self.idle_polls, MAX_IDLE_BACKOFF_STEPS)
+            interval = min(self.base_interval * backoff, self.max_interval)
+
+        # Spread the remaining hourly budget, waiting for old requests to age out.
+        interval = max(
+            interval,
+            API_BUDGET_WINDOW * self.poll_cost / self.requests_per_hour,
+        )
+        if len(self.request_times) + self.poll_cost > self.requests_per_hour:
+            overflow = len(self.request_times) + self.poll_cost
+            overflow -= self.requests_per_hour
+            release_at = self.request_times[overflow - 1] + API_BUDGET_WINDOW
+            interval = max(interval, release_at - now)
+        if forecast is not None and forecast <= RATE_LIMIT_FORECAST_HORIZON:
+            # Leave polls only the budget that writes and discovery do not use.
+            since = now - API_FORECAST_WINDOW
+            budget_rate = self.requests_per_hour / API_BUDGET_WINDOW
+            other_rate = _count_since(self.request_times, since) - _count_since(
+                self.kind_request_times.get(REQUEST_KIND_POLL, ()), since
+            )
+            other_rate /= API_FORECAST_WINDOW
+            spare_rate = max(
+                budget_rate - other_rate, budget_rate * MIN_POLL_BUDGET_SHARE
+            )
+            interval = max(interval, self.poll_cost / spare_rate)
+        return interval
+
+    def _prune(self, now: float) -> None:
+        """Forget requests that left the rolling budget window."""
+        cutoff = now - API_BUDGET_WINDOW
+        for times in (self.request_times, *self.kind_request_times.values()):
+            while times and times[0] <= cutoff:
+                times.popleft()
+
+
+def _count_since(times: Reversible[float], since: float) -> int:
+    """Count the timestamps of an ascending sequence newer than ``since``."""
+    count = 0
+    for timestamp in reversed(times):
+        if timestamp <= since:
+            break
+        count += 1
+    return count
+
+
+class RetryBackoff:
+    """Grow retry delays per error class with jitter until a request succeeds."""
+
+    def __init__(
+        self,
+        base_delays: Mapping[str, float],
+        max_delay: float,
+        jitter: float,
+    ) -> None:
+        """Initialize the backoff with no failures recorded."""
+        self.base_delays = base_delays
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.attempts: dict[str, int] = {}
+        self.last_delays: dict[str, float] = {}
+
+    def next_delay(self, error_class: str) -> float:
+        """Return the delay before retrying after another failure of one class."""
+        attempt = self.attempts.get(error_class, 0)
+        self.attempts[error_class] = attempt + 1
+        delay = self.base_delays[error_class] * 2 ** min(
+            attempt, MAX_RETRY_BACKOFF_STEPS
+        )
+        # Stretch each delay randomly so entries sharing a host do not retry together.
+        delay = min(self.max_delay, delay * random.uniform(1.0, 1.0 + self.jitter))
+        self.last_delays[error_class] = delay
+        return delay
+
+    def reset(self) -> None:
+        """Forget all failures after a request succeeded."""
+        self.attempts.clear()
+        self.last_delays.clear()
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return the current backoff per error class for diagnostics."""
+        return {
+            "max_delay": self.max_delay,
+            "jitter": self.jitter,
+            "classes": {
+                error_class: {
+                    "attempts": attempts,
+                    "last_delay": self.last_delays.get(error_class),
+                }
+                for error_class, attempts in sorted(self.attempts.items())
+            },
+        }
+
+
+class CircuitBreaker:
+    """Stop calling the cloud after repeated failures and probe for recovery."""
+
+    def __init__(self, failure_threshold: int, probe_timeout: float) -> None:
+        """Initialize a closed circuit."""
+        self.failure_threshold = failure_threshold
+        self.probe_timeout = probe_timeout
+        self.state = CIRCUIT_CLOSED
+        self.consecutive_failures = 0
+        self.opened = 0
+        self.rejected = 0
+        self._open_until = 0.0
+        self._probe_deadline = 0.0
+
+    def allow_request(self, now: float) -> bool:
+        """Return whether a request may be sent, admitting one probe when due."""
+        if self.state == CIRCUIT_CLOSED:
+            return True
+        if self.state == CIRCUIT_OPEN and now >= self._open_until:
+            self.state = CIRCUIT_HALF_OPEN
+        if self.state == CIRCUIT_HALF_OPEN and now >= self._probe_deadline:
+            # A probe that never reported back must not block recovery.
+            self._probe_deadline = now + self.probe_timeout
+            return True
+        self.rejected += 1
+        return False
+
+    def is_open(self, now: float) -> bool:
+        """Return whether requests are still blocked, without admitting a probe."""
+        return self.state == CIRCUIT_OPEN and now < self._open_until
+
+    def retry_in(self, now: float) -> float:
+        """Return the seconds until the next probe may be sent."""
+        if self.state == CIRCUIT_OPEN:
+            return max(0.0, self._open_until - now)
+        if self.state == CIRCUIT_HALF_OPEN:
+            return max(0.0, self._probe_deadline - now)
+        return 0.0
+
+    def record_success(self) -> None:
+        """Close the circuit after the cloud answered."""
+        self.state = CIRCUIT_CLOSED
+        self.consecutive_failures = 0
+        self._probe_deadline = 0.0
+
+    def record_failure(self, now: float, open_for: float) -> None:
+        """Count a cloud failure and open the circuit once it keeps failing."""
+        self.consecutive_failures += 1
+        if (
+            self.state == CIRCUIT_HALF_OPEN
+            or self.consecutive_failures >= self.failure_threshold
+        ):
+            if self.state != CIRCUIT_OPEN:
+                self.opened += 1
+            self.state = CIRCUIT_OPEN
+            self._open_until = now + open_for
+            self._probe_deadline = 0.0
+
+    def diagnostics(self, now: float) -> dict[str, Any]:
+        """Return the circuit state for diagnostics."""
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "retry_in": self.retry_in(now),
+            "opened": self.opened,
+            "rejected": self.rejected,
+        }
+
+
+class RequestLimiter:
+    """Token bucket shared by all outbound requests, served by priority."""
+
+    def __init__(self, rate: float, burst: int, min_rate: float) -> None:
+        """Initialize the limiter with a full bucket."""
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.rate_limited = 0
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = 0
+        self._wakeup: asyncio.TimerHandle | None = None
+
+    async def acquire(self, priority: int) -> None:
+        """Wait until a request with the given priority may be sent."""
+        self._refill()
+        if not self._waiters and self._tokens >= 1:
+            self._tokens -= 1
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, self._sequence, future))
+        self._sequence += 1
+        self._schedule_dispatch()
+        await future
+
+    def note_success(self) -> None:
+        """Recover the request rate slowly after successful requests."""
+        self.rate = min(self.max_rate, self.rate + REQUEST_RATE_RECOVERY_STEP)
+
+    def note_rate_limited(self) -> None:
+        """Halve the request rate after the API answered with HTTP 429."""
+        self._refill()
+        self.rate_limited += 1
+        self.rate = max(self.min_rate, self.rate / 2)
+        self._tokens = min(self._tokens, 0.0)
+
+    @property
+    def queued(self) -> int:
+        """Return how many requests are waiting for a token."""
+        return sum(not future.done() for _, _, future in self._waiters)
+
+    def _refill(self) -> None:
+        """Add the tokens earned since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(
+            float(self.burst), self._tokens + (now - self._updated_at) * self.rate
+        )
+        self._updated_at = now
+
+    def _schedule_dispatch(self) -> None:
+        """Wake up when the next token becomes available."""
+        if self._wakeup is not None:
+            return
+        delay = max(0.0, (1 - self._tokens) / self.rate)
+        self._wakeup = asyncio.get_running_loop().call_later(delay, self._dispatch)
+
+    def _dispatch(self) -> None:
+        """Hand out available tokens to the highest-priority waiters."""
+        self._wakeup = None
+        self._refill()
+        while self._waiters and self._tokens >= 1:
+            _, _, future = heapq.heappop(self._waiters)
+            if future.done():
+                continue
+            self._tokens -= 1
+            future.set_result(None)
+
+        while self._waiters and self._waiters[0][2].done():
+            heapq.heappop(self._waiters)
+        if self._waiters:
+            self._schedule_dispatch()
+
+
+class DanfossAllyTransport:
+    """HTTP session and request budget shared by all config entries."""
+
+    def __init__(self, hass: HomeAssistant, max_requests: int) -> None:
+        """Initialize the transport without opening a session."""
+        self.hass = hass
+        self.request_slots = asyncio.Semaphore(max_requests)
+        self._session: aiohttp.ClientSession | None = None
+        self._entries: set[str] = set()
+
+    def async_create_client(self, entry_id: str) -> DanfossAlly:
+        """Return a new API client for an entry on the shared session."""
+        api = DanfossAllyAPI(
+            client=self._async_get_session(),
+            timeout=API_TIMEOUT,
+            user_agent_prefix=USER_AGENT_PREFIX,
+        )
+        self._entries.add(entry_id)
+        return DanfossAlly(
+            api=api,
+            refresh_device_concurrency=REFRESH_DEVICE_CONCURRENCY,
+            refresh_device_min_interval=REFRESH_DEVICE_MIN_INTERVAL,
+            hot_refresh_timeout=HOT_REFRESH_TIMEOUT,
+        )
+
+    async def async_release_client(self, entry_id: str, client: DanfossAlly) -> None:
+        """Close an entry's client and the session once no entry uses it."""
+        await client.aclose()
+        self._entries.discard(entry_id)
+        if not self._entries and self._session is not None:
+            self._session.detach()
+            self._session = None
+
+    def _async_get_session(self) -> aiohttp.ClientSession:
+        """Return the pooled keep-alive session, creating it on first use."""
+        if self._session is None:
+            self._session = async_create_clientsession(
+                self.hass,
+                auto_cleanup=False,
+                base_url=API_HOST,
+                timeout=aiohttp.ClientTimeout(total=API_TIMEOUT),
+            )
+        return self._session
+
+
+@callback
+def async_get_transport(hass: HomeAssistant) -> DanfossAllyTransport:
+    """Return the transport shared by all Danfoss Ally config entries."""
+    transport = hass.data.get(DOMAIN)
+    if transport is None:
+        transport = hass.data[DOMAIN] = DanfossAllyTransport(
+            hass, SHARED_REQUEST_CONCURRENCY
+        )
+    return transport
 
 
 @dataclass(slots=True)
@@ -141,6 +862,163 @@ class PendingWrite:
     updates: dict[str, Any]
     expires_at: float
     baseline_response_time: int | None
+    written_at: float = 0.0
+
+
+@dataclass(slots=True)
+class DeviceRefreshStats:
+    """Refresh failures of one device and when it may be retried."""
+
+    failures: int = 0
+    total_failures: int = 0
+    last_error: str | None = None
+    retry_at: float = 0.0
+
+
+@dataclass(slots=True)
+class PendingWriteStats:
+    """Counters describing how long optimistic writes took to be confirmed."""
+
+    confirmed_writes: int = 0
+    expired_writes: int = 0
+    last_confirmation_latency: float = 0.0
+    max_confirmation_latency: float = 0.0
+    total_confirmation_latency: float = 0.0
+
+
+@dataclass(slots=True)
+class DurationHistogram:
+    """Bucketed durations in seconds with running totals."""
+
+    bounds: tuple[float, ...]
+    counts: list[int] = field(default_factory=list)
+    count: int = 0
+    total: float = 0.0
+    last: float = 0.0
+    maximum: float = 0.0
+
+    def observe(self, duration: float) -> None:
+        """Add one duration to the histogram."""
+        if not self.counts:
+            self.counts = [0] * (len(self.bounds) + 1)
+        self.counts[bisect.bisect_left(self.bounds, duration)] += 1
+        self.count += 1
+        self.total += duration
+        self.last = duration
+        self.maximum = max(self.maximum, duration)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram in a diagnostics-friendly form."""
+        counts = self.counts or [0] * (len(self.bounds) + 1)
+        buckets = {
+            f"le_{bound:g}": count
+            for bound, count in zip(self.bounds, counts, strict=False)
+        }
+        buckets["inf"] = counts[-1]
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "last": self.last,
+            "max": self.maximum,
+            "buckets": buckets,
+        }
+
+
+@dataclass(slots=True)
+class CoordinatorTelemetry:
+    """Performance counters for polls, writes and retried API failures."""
+
+    poll_duration: DurationHistogram = field(
+        default_factory=lambda: DurationHistogram(POLL_DURATION_BUCKETS)
+    )
+    polls: int = 0
+    api_calls: int = 0
+    last_poll_api_calls: int = 0
+    values_parsed: int = 0
+    last_poll_values_parsed: int = 0
+    devices_changed: int = 0
+    last_poll_devices_changed: int = 0
+    write_latency: dict[str, DurationHistogram] = field(default_factory=dict)
+    retry_events: dict[str, int] = field(default_factory=dict)
+
+    def record_poll(self, duration: float, api_calls: int, values_parsed: int) -> None:
+        """Record the cost of one poll cycle."""
+        self.poll_duration.observe(duration)
+        self.polls += 1
+        self.api_calls += api_calls
+        self.last_poll_api_calls = api_calls
+        self.values_parsed += values_parsed
+        self.last_poll_values_parsed = values_parsed
+
+    def record_devices_changed(self, count: int) -> None:
+        """Record how many devices changed in the last poll cycle."""
+        self.devices_changed += count
+        self.last_poll_devices_changed = count
+
+    def record_write(self, method: str, duration: float) -> None:
+        """Record the latency of one write request."""
+        histogram = self.write_latency.get(method)
+        if histogram is None:
+            histogram = self.write_latency[method] = DurationHistogram(
+                WRITE_LATENCY_BUCKETS
+            )
+        histogram.observe(duration)
+
+    def record_retry(self, error_class: str) -> None:
+        """Count one failed request by its retry class."""
+        self.retry_events[error_class] = self.retry_events.get(error_class, 0) + 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return all counters in a diagnostics-friendly form."""
+        return {
+            "poll_duration": self.poll_duration.as_dict(),
+            "polls": self.polls,
+            "api_calls": self.api_calls,
+            "last_poll_api_calls": self.last_poll_api_calls,
+            "values_parsed": self.values_parsed,
+            "last_poll_values_parsed": self.last_poll_values_parsed,
+            "devices_changed": self.devices_changed,
+            "last_poll_devices_changed": self.last_poll_devices_changed,
+            "write_latency": {
+                method: histogram.as_dict()
+                for method, histogram in sorted(self.write_latency.items())
+            },
+            "retry_events": dict(sorted(self.retry_events.items())),
+        }
+
+
+@dataclass(slots=True)
+class OptimisticRollback:
+    """Pending and cached values an optimistic write replaced."""
+
+    updates: dict[str, Any]
+    pending: dict[str, Any]
+    values: dict[str, Any]
+
+
+@dataclass(slots=True)
+class QueuedDeviceWrite:
+    """Commands for one device waiting to be sent as a single request."""
+
+    first_queued_at: float
+    commands: dict[str, Any] = field(default_factory=dict)
+    waiters: list[asyncio.Future[None]] = field(default_factory=list)
+    rollbacks: list[OptimisticRollback] = field(default_factory=list)
+    unsub_flush: Any | None = None
+
+
+@dataclass(slots=True)
+class WriteQueueStats:
+    """Counters describing how writes were coalesced or skipped."""
+
+    skipped_writes: int = 0
+    queued_commands: int = 0
+    superseded_commands: int = 0
+    flushes: int = 0
+    flushed_commands: int = 0
+    max_batch_size: int = 0
+    last_flush_latency: float = 0.0
+    max_flush_latency: float = 0.0
 
 
 @dataclass(slots=True)
@@ -172,6 +1050,17 @@ class WindowRestoreState:
     target_temperature: float | None
 
 
+@dataclass(slots=True)
+class EntitySourceIndex:
+    """Track Home Assistant entities offered as thermostat sources."""
+
+    temperature: set[str] = field(default_factory=set)
+    window: set[str] = field(default_factory=set)
+    temperature_options: tuple[str, ...] | None = None
+    window_options: tuple[str, ...] | None = None
+    unsub_listeners: list[Any] = field(default_factory=list)
+
+
 DanfossConfigEntry = ConfigEntry
 
 
@@ -185,6 +1074,7 @@ class DanfossAllyDataUpdateCoordinator(
         hass: HomeAssistant,
         client: DanfossAlly,
         entry: DanfossConfigEntry,
+        request_slots: asyncio.Semaphore,
     ) -> None:
         """Initialize the coordinator."""
         super().__init__(
@@ -193,9 +1083,13 @@ class DanfossAllyDataUpdateCoordinator(
             config_entry=entry,
             name=DOMAIN,
             update_interval=SCAN_INTERVAL,
+            always_update=False,
         )
         self.client = client
+        self._request_slots = request_slots
         self._pending_writes: dict[str, PendingWrite] = {}
+        self._pending_expiry: list[tuple[float, str]] = []
+        self.pending_write_stats = PendingWriteStats()
         self._external_temp_states: dict[str, ExternalTempState] = {}
         self._window_sensor_states: dict[str, WindowSensorState] = {}
         self._window_restore_store = Store[dict[str, dict[str, str | float | None]]](
@@ -205,8 +1099,56 @@ class DanfossAllyDataUpdateCoordinator(
         )
         self._window_restore_states: dict[str, WindowRestoreState] = {}
         self._window_restore_loaded = False
+        self._snapshot_store = Store[dict[str, Any]](
+            hass,
+            SNAPSHOT_STORE_VERSION,
+            f"{SNAPSHOT_STORE_KEY}.{entry.entry_id}",
+        )
         self._refresh_in_progress = False
         self._runtime_refresh_logging = False
+        self._refresh_previous_data: dict[str, dict[str, Any]] | None = None
+        self._refresh_previous_success = True
+        self._device_changes: dict[str, frozenset[str]] | None = None
+        self._listener_index: dict[Any, list[tuple[CALLBACK_TYPE, Any]]] | None = None
+        self.discovery_revision = 0
+        self._devices_discovered = False
+        self._device_missing_rounds: dict[str, int] = {}
+        self._device_polled_at: dict[str, float] = {}
+        self._device_failures: dict[str, DeviceRefreshStats] = {}
+        self._hot_refresh_unsubs: dict[str, CALLBACK_TYPE] = {}
+        self._last_good_poll_at: float | None = None
+        self._failed_polls = 0
+        self._failure_retry_after: float | None = None
+        self._degraded_since: float | None = None
+        self._source_index: EntitySourceIndex | None = None
+        self.stale_device_merge = STALE_DEVICE_MERGE
+        self._device_response_marks: dict[str, int] = {}
+        self._response_high_water: int | None = None
+        self._poll_scheduler = AdaptivePollScheduler(
+            base_interval=SCAN_INTERVAL.total_seconds(),
+            fast_interval=FAST_SCAN_INTERVAL.total_seconds(),
+            max_interval=MAX_SCAN_INTERVAL.total_seconds(),
+            requests_per_hour=API_REQUESTS_PER_HOUR,
+        )
+        self._polling = False
+        self._poll_requests = 1
+        self._write_queue: dict[str, QueuedDeviceWrite] = {}
+        self.write_queue_stats = WriteQueueStats()
+        self.telemetry = CoordinatorTelemetry()
+        self._telemetry_listeners: list[CALLBACK_TYPE] = []
+        self._source_option_listeners: list[CALLBACK_TYPE] = []
+        self._poll_values_parsed = 0
+        self._circuit_breaker = CircuitBreaker(CIRCUIT_FAILURE_THRESHOLD, API_TIMEOUT)
+        self._retry_backoff = RetryBackoff(
+            RETRY_AFTER_BY_ERROR_CLASS,
+            MAX_RETRY_AFTER,
+            RETRY_JITTER,
+        )
+        self._request_limiter = RequestLimiter(
+            REQUEST_RATE_LIMIT,
+            REQUEST_BURST,
+            MIN_REQUEST_RATE,
+        )
         self.logger = _CoordinatorLoggerAdapter(_LOGGER, self)
 
     async def _async_refresh(
@@ -218,6 +1160,9 @@ class DanfossAllyDataUpdateCoordinator(
     ) -> None:
         """Track whether refresh logging is happening during runtime."""
         self._runtime_refresh_logging = not raise_on_entry_error
+        previous_data = self._refresh_previous_data = self.data
+        self._refresh_previous_success = self.last_update_success
+        self._polling = True
         try:
             await super()._async_refresh(
                 log_failures=log_failures,
@@ -226,36 +1171,482 @@ class DanfossAllyDataUpdateCoordinator(
                 raise_on_entry_error=raise_on_entry_error,
             )
         finally:
+            self._polling = False
             self._runtime_refresh_logging = False
+            self._refresh_previous_data = None
+            self._device_changes = None
+            self._async_update_telemetry_listeners()
+
+        if self.last_update_success and self.data and self.data is not previous_data:
+            self._async_schedule_snapshot_save()
+
+    @callback
+    def _schedule_refresh(self) -> None:
+        """Adapt the poll interval before the next refresh is scheduled."""
+        now = time.monotonic()
+        if self._polling and self.last_update_success:
+            self._poll_scheduler.record_poll(
+                now,
+                changed=_snapshot_changed(self._refresh_previous_data, self.data),
+                requests=self._poll_requests,
+                kind=(
+                    REQUEST_KIND_DISCOVERY
+                    if self._refresh_previous_data is None
+                    else REQUEST_KIND_POLL
+                ),
+            )
+        interval = self._poll_scheduler.next_interval(now)
+        if self._failure_retry_after is not None:
+            interval = max(interval, self._failure_retry_after)
+            if self.degraded:
+                # Probe slowly with a single request until the API recovers.
+                interval = max(interval, DEGRADED_REFRESH_COOLDOWN)
+        self.update_interval = timedelta(seconds=interval)
+        super()._schedule_refresh()
+
+    @callback
+    def async_note_activity(self) -> None:
+        """Switch to fast polling after a write or sensor-driven action."""
+        self._poll_scheduler.note_activity(time.monotonic(), FAST_POLL_WINDOW)
+        if self._unsub_refresh is not None and not self._polling:
+            # Pull an already scheduled slow poll forward.
+            self._schedule_refresh()
+
+    @callback
+    def _async_refresh_finished(self) -> None:
+        """Record which devices changed before listeners are notified."""
+        self._device_changes = None
+        previous_data = self._refresh_previous_data
+        if self.data is None or self.data is previous_data:
+            self.telemetry.record_devices_changed(0)
+            return
+
+        if (
+            previous_data is None
+            or not self.last_update_success
+            or not self._refresh_previous_success
+        ):
+            # Availability or the whole snapshot changed, notify everyone.
+            self.telemetry.record_devices_changed(len(self.data))
+            self.discovery_revision += 1
+            return
+
+        device_changes = _diff_device_snapshots(previous_data, self.data)
+        self.telemetry.record_devices_changed(len(device_changes))
+        if _has_capability_change(previous_data, self.data, device_changes):
+            self.discovery_revision += 1
+        self._device_changes = device_changes
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify device-bound listeners only when their keys changed."""
+        device_changes = self._device_changes
+        self._device_changes = None
+        if device_changes is None:
+            super().async_update_listeners()
+            return
+
+        devices = self.data or {}
+        listener_index = self._async_get_listener_index()
+        for update_callback, _context in listener_index.get(None, ()):
+            update_callback()
+
+        for device_id, changed_keys in device_changes.items():
+            for update_callback, context in listener_index.get(device_id, ()):
+                if (
+                    not isinstance(context, DeviceKeySubscription)
+                    or device_id not in devices
+                    or context.matches(changed_keys)
+                ):
+                    update_callback()
+
+    @callback
+    def async_add_listener(
+        self,
+        update_callback: CALLBACK_TYPE,
+        context: Any = None,
+    ) -> CALLBACK_TYPE:
+        """Listen for data updates and keep the device listener index current."""
+        remove_listener = super().async_add_listener(update_callback, context)
+        self._listener_index = None
+
+        @callback
+        def remove() -> None:
+            remove_listener()
+            self._listener_index = None
+
+        return remove
+
+    @callback
+    def _async_get_listener_index(
+        self,
+    ) -> dict[Any, list[tuple[CALLBACK_TYPE, Any]]]:
+        """Return listeners grouped by the device they are bound to."""
+        if self._listener_index is None:
+            listener_index: dict[Any, list[tuple[CALLBACK_TYPE, Any]]] = {}
+            for update_callback, context in self._listeners.values():
+                device_id = (
+                    context.device_id
+                    if isinstance(context, DeviceKeySubscription)
+                    else context
+                )
+                listener_index.setdefault(device_id, []).append(
+                    (update_callback, context)
+                )
+            self._listener_index = listener_index
+        return self._listener_index
 
     async def _async_update_data(self) -> dict[str, dict[str, Any]]:
         """Fetch the latest device list."""
         self._refresh_in_progress = True
+        started = time.monotonic()
+        self._poll_requests = 1
+        self._poll_values_parsed = 0
         try:
+            if not self._circuit_breaker.allow_request(started):
+                retry_after = self._circuit_breaker.retry_in(started)
+                cached = self._serve_cached_snapshot(CIRCUIT_OPEN_MESSAGE, retry_after)
+                if cached is not None:
+                    return cached
+                raise UpdateFailed(CIRCUIT_OPEN_MESSAGE, retry_after=retry_after)
             try:
-                if self.data is None:
-                    devices = await self.client.get_devices()
+                await self._request_limiter.acquire(REQUEST_PRIORITY_POLL)
+                if self.data is None or self.degraded:
+                    async with self._request_slots:
+                        devices = self._known_devices(await self.client.get_devices())
+                    self._poll_values_parsed = _count_device_values(devices)
                 else:
-                    devices = await self.client.refresh_devices()
+                    async with self._request_slots:
+                        devices = dict(
+                            self._known_devices(await self.client.get_devices())
+                        )
+                    # Written devices the listing lags on get a read of their own.
+                    await self._async_refresh_single_devices(
+                        self._hot_device_ids(devices), devices
+                    )
+                    self._poll_values_parsed = _count_device_values(devices)
             except exceptions.UnauthorizedError as err:
                 raise ConfigEntryAuthFailed(AUTH_FAILED_MESSAGE) from err
+            except exceptions.RateLimitError as err:
+                self._request_limiter.note_rate_limited()
+                retry_after = self._note_api_failure(err)
+                # Slow down and keep serving the last snapshot until retry_after.
+                cached = self._serve_cached_snapshot(
+                    RATE_LIMIT_ERROR_MESSAGE, retry_after
+                )
+                if cached is None:
+                    raise UpdateFailed(
+                        _describe_api_error(err),
+                        retry_after=retry_after,
+                    ) from err
+                _LOGGER.warning(
+                    "%s; lowering the request rate to %.2f/s",
+                    RATE_LIMIT_ERROR_MESSAGE,
+                    self._request_limiter.rate,
+                )
+                return cached
             except (
                 TimeoutError,
                 ConnectionError,
                 exceptions.APIError,
                 exceptions.UnexpectedError,
             ) as err:
+                retry_after = self._note_api_failure(err)
+                cached = self._serve_cached_snapshot(
+                    _describe_api_error(err), retry_after
+                )
+                if cached is not None:
+                    return cached
                 raise UpdateFailed(
                     _describe_api_error(err),
-                    retry_after=_retry_after_for_error(err),
+                    retry_after=retry_after,
                 ) from err
 
+            self._note_api_success()
+            self._note_poll_recovered()
+            # The first poll after startup doubles as the initial discovery.
+            self._devices_discovered = True
             if self._is_stale_snapshot(devices):
                 return self.data or devices
+            if self.stale_device_merge:
+                devices = self._keep_lagging_devices(devices)
 
-            return self._apply_pending_writes(devices)
+            self._advance_response_marks(devices)
+            return self._compact_snapshot(self._apply_pending_writes(devices))
         finally:
             self._refresh_in_progress = False
+            self.telemetry.record_poll(
+                time.monotonic() - started,
+                self._poll_requests,
+                self._poll_values_parsed,
+            )
+
+    def _hot_device_ids(self, devices: dict[str, dict[str, Any]]) -> list[str]:
+        """Return written devices the listing shows no report for since the write."""
+        hot_device_ids: list[str] = []
+        for device_id, device in devices.items():
+            pending_write = self._pending_writes.get(device_id)
+            if pending_write is None:
+                continue
+            response_time = self._coerce_response_time(device.get("last_response_time"))
+            baseline = pending_write.baseline_response_time
+            if (
+                response_time is not None
+                and baseline is not None
+                and response_time > baseline
+            ):
+                # The listing already carries the device's report after the write.
+                continue
+            hot_device_ids.append(device_id)
+        return hot_device_ids
+
+    async def _async_refresh_single_devices(
+        self,
+        device_ids: list[str],
+        devices: dict[str, dict[str, Any]],
+    ) -> int:
+        """Refresh devices one by one, keeping the listed record of failed ones."""
+        now = time.monotonic()
+        failures = self._device_failures
+        device_ids = [
+            device_id
+            for device_id in device_ids
+            if device_id not in failures or failures[device_id].retry_at <= now
+        ]
+        if not device_ids:
+            return 0
+
+        self._poll_requests += len(device_ids)
+        semaphore = asyncio.Semaphore(REFRESH_DEVICE_CONCURRENCY)
+
+        async def refresh_one(device_id: str) -> None:
+            async with semaphore:
+                await self._request_limiter.acquire(REQUEST_PRIORITY_POLL)
+                try:
+                    async with self._request_slots:
+                        device = await self.client.refresh_device(device_id)
+                except exceptions.UnauthorizedError:
+                    raise
+                except (
+                    TimeoutError,
+                    ConnectionError,
+                    exceptions.APIError,
+                    exceptions.UnexpectedError,
+                ) as err:
+                    self._note_device_failure(device_id, err)
+                    return
+            if (stats := failures.get(device_id)) is not None:
+                stats.failures = 0
+            if device is not None:
+                devices[device_id] = device
+
+        await asyncio.gather(*(refresh_one(device_id) for device_id in device_ids))
+        return len(device_ids)
+
+    def _note_device_failure(self, device_id: str, err: BaseException) -> None:
+        """Back off one device after its refresh failed."""
+        stats = self._device_failures.setdefault(device_id, DeviceRefreshStats())
+        stats.failures += 1
+        stats.total_failures += 1
+        stats.last_error = _error_class(err)
+        stats.retry_at = time.monotonic() + min(
+            MAX_DEVICE_RETRY_AFTER,
+            DEVICE_RETRY_AFTER * 2 ** min(stats.failures - 1, MAX_RETRY_BACKOFF_STEPS),
+        )
+        if isinstance(err, exceptions.RateLimitError):
+            self._request_limiter.note_rate_limited()
+        _LOGGER.debug(
+            "Refreshing device %s failed (%s); keeping its previous record",
+            device_id,
+            _describe_api_error(err),
+        )
+
+    def _known_devices(
+        self,
+        devices: dict[str, dict[str, Any]],
+    ) -> dict[str, dict[str, Any]]:
+        """Note when listed devices were polled and keep to the published ones."""
+        now = time.time()
+        current = self.data
+        if not self._devices_discovered or current is None:
+            self._device_polled_at = dict.fromkeys(devices, now)
+            return devices
+
+        polled_at = self._device_polled_at
+        for device_id in devices:
+            if device_id in current:
+                polled_at[device_id] = now
+        if devices.keys() == current.keys():
+            return devices
+        # Devices missing from the listing keep their record until discovery.
+        return {
+            device_id: devices.get(device_id, device)
+            for device_id, device in current.items()
+        }
+
+    @callback
+    def async_setup_device_discovery(self) -> None:
+        """Look for added and removed devices on their own slow schedule."""
+        self.config_entry.async_on_unload(
+            async_track_time_interval(
+                self.hass,
+                self._async_discover_devices,
+                timedelta(seconds=DEVICE_DISCOVERY_INTERVAL),
+            )
+        )
+
+    async def _async_discover_devices(self, _now: Any = None) -> None:
+        """Add devices new to the account and drop devices that left it."""
+        if (
+            self.data is None
+            or self._refresh_in_progress
+            or not self._circuit_breaker.allow_request(time.monotonic())
+        ):
+            return
+
+        try:
+            await self._request_limiter.acquire(REQUEST_PRIORITY_POLL)
+            async with self._request_slots:
+                devices = await self.client.get_devices()
+        except exceptions.UnauthorizedError:
+            self.config_entry.async_start_reauth(self.hass)
+            return
+        except exceptions.RateLimitError as err:
+            self._request_limiter.note_rate_limited()
+            self._note_api_failure(err)
+            return
+        except (
+            TimeoutError,
+            ConnectionError,
+            exceptions.APIError,
+            exceptions.UnexpectedError,
+        ) as err:
+            self._note_api_failure(err)
+            _LOGGER.debug("Device discovery failed: %s", _describe_api_error(err))
+            return
+
+        self._note_api_success()
+        self._poll_scheduler.record_requests(
+            time.monotonic(), kind=REQUEST_KIND_DISCOVERY
+        )
+        current = self.data
+        if current is None or self._refresh_in_progress:
+            # A poll started meanwhile; the next discovery round retries.
+            return
+
+        added = devices.keys() - current.keys()
+        # A device must be missing from several listings in a row to be removed.
+        missing_rounds = self._device_missing_rounds = {
+            device_id: self._device_missing_rounds.get(device_id, 0) + 1
+            for device_id in current.keys() - devices.keys()
+        }
+        removed = {
+            device_id
+            for device_id, rounds in missing_rounds.items()
+            if rounds >= DEVICE_REMOVAL_DISCOVERY_ROUNDS
+        }
+        if not added and not removed:
+            return
+
+        _LOGGER.debug(
+            "Discovered %s added and %s removed device(s)", len(added), len(removed)
+        )
+        snapshot = {
+            device_id: device
+            for device_id, device in current.items()
+            if device_id not in removed
+        }
+        now = time.time()
+        for device_id in added:
+            snapshot[device_id] = _device_record(devices[device_id])
+            self._device_polled_at[device_id] = now
+        for device_id in removed:
+            del missing_rounds[device_id]
+
+        self._async_remove_devices(removed)
+        if self.last_update_success:
+            self._device_changes = dict.fromkeys(added | removed, frozenset())
+        self.discovery_revision += 1
+        self.async_set_updated_data(snapshot)
+        self._async_schedule_snapshot_save()
+
+    @callback
+    def _async_remove_devices(self, device_ids: set[str]) -> None:
+        """Detach removed devices and their entities from the config entry."""
+        if not device_ids:
+            return
+        device_registry = dr.async_get(self.hass)
+        for device_id in device_ids:
+            # Diagnostics must not keep reporting devices that left the account.
+            self._device_polled_at.pop(device_id, None)
+            self._device_failures.pop(device_id, None)
+            device = device_registry.async_get_device(identifiers={(DOMAIN, device_id)})
+            if device is not None:
+                device_registry.async_update_device(
+                    device.id, remove_config_entry_id=self.config_entry.entry_id
+                )
+
+    def _serve_cached_snapshot(
+        self,
+        reason: str,
+        retry_after: float,
+    ) -> dict[str, dict[str, Any]] | None:
+        """Return the last good snapshot while polls fail, if it is recent enough."""
+        now = time.time()
+        if (
+            self.data is None
+            or self._last_good_poll_at is None
+            or now - self._last_good_poll_at > SNAPSHOT_CACHE_MAX_AGE
+        ):
+            return None
+
+        self._failed_polls += 1
+        self._failure_retry_after = retry_after
+        if self._failed_polls == DEGRADED_FAILURE_THRESHOLD:
+            self._degraded_since = now
+            _LOGGER.warning(
+                "%s; serving cached data and probing every %.0f seconds",
+                reason,
+                max(retry_after, DEGRADED_REFRESH_COOLDOWN),
+            )
+        else:
+            _LOGGER.debug("%s; serving cached data", reason)
+        return self.data
+
+    def _note_poll_recovered(self) -> None:
+        """Leave degraded mode after a successful poll."""
+        self._last_good_poll_at = time.time()
+        self._failed_polls = 0
+        self._failure_retry_after = None
+        if self._degraded_since is not None:
+            _LOGGER.info(
+                "Danfoss Ally API recovered after %.0f seconds in degraded mode",
+                self._last_good_poll_at - self._degraded_since,
+            )
+            self._degraded_since = None
+
+    @property
+    def degraded(self) -> bool:
+        """Return whether polls keep failing and cached data is being served."""
+        return self._degraded_since is not None
+
+    def device_data_age(self, device_id: str) -> float | None:
+        """Return how many seconds ago a poll last reported a device."""
+        polled_at = self._device_polled_at.get(device_id)
+        return None if polled_at is None else time.time() - polled_at
+
+    def _compact_snapshot(
+        self,
+        devices: dict[str, dict[str, Any]],
+    ) -> dict[str, dict[str, Any]]:
+        """Pack newly polled device records into compact shared-layout records."""
+        current = self.data or {}
+        return {
+            device_id: (
+                device if device is current.get(device_id) else _device_record(device)
+            )
+            for device_id, device in devices.items()
+        }
 
     async def async_request_refresh(self) -> None:
         """Request a refresh unless one is already in progress."""
@@ -274,6 +1665,7 @@ class DanfossAllyDataUpdateCoordinator(
         mode: str,
         *,
         optimistic_updates: dict[str, Any] | None = None,
+        priority: int = REQUEST_PRIORITY_USER_WRITE,
     ) -> None:
         """Write a device mode and refresh state."""
         await self._async_run_write(
@@ -281,6 +1673,7 @@ class DanfossAllyDataUpdateCoordinator(
             self.client.set_mode(device_id, mode),
             optimistic_updates=optimistic_updates,
             error_message=f"Failed to set mode for {device_id}",
+            priority=priority,
         )
 
     async def async_set_temperature(
@@ -291,12 +1684,11 @@ class DanfossAllyDataUpdateCoordinator(
         *,
         optimistic_updates: dict[str, Any] | None = None,
     ) -> None:
-        """Write a temperature setpoint and refresh state."""
-        await self._async_run_write(
+        """Queue a temperature setpoint write."""
+        await self._async_queue_commands(
             device_id,
-            self.client.set_temperature(device_id, temperature, code),
+            [(code, int(temperature * 10))],
             optimistic_updates=optimistic_updates,
-            error_message=f"Failed to set temperature for {device_id}",
         )
 
     async def async_set_temperature_for_mode(
@@ -306,6 +1698,7 @@ class DanfossAllyDataUpdateCoordinator(
         mode: str,
         *,
         optimistic_updates: dict[str, Any] | None = None,
+        priority: int = REQUEST_PRIORITY_USER_WRITE,
     ) -> None:
         """Write a mode-aware temperature setpoint and refresh state."""
         await self._async_run_write(
@@ -313,6 +1706,7 @@ class DanfossAllyDataUpdateCoordinator(
             self.client.set_temperature_for_mode(device_id, temperature, mode),
             optimistic_updates=optimistic_updates,
             error_message=f"Failed to set temperature for {device_id}",
+            priority=priority,
         )
 
     async def async_set_manual_temperature(
@@ -343,6 +1737,8 @@ class DanfossAllyDataUpdateCoordinator(
             self.client.set_external_temperature(device_id, temperature),
             optimistic_updates=optimistic_updates,
             error_message=f"Failed to set external temperature for {device_id}",
+            # Thermostats expect external readings to be re-sent periodically.
+            skip_unchanged=False,
         )
 
     async def async_set_upper_temp(
@@ -442,14 +1838,199 @@ class DanfossAllyDataUpdateCoordinator(
         *,
         optimistic_updates: dict[str, Any] | None = None,
     ) -> None:
-        """Send generic commands and refresh state."""
-        await self._async_run_write(
+        """Queue generic commands for the next batched write."""
+        await self._async_queue_commands(
             device_id,
-            self.client.send_command(device_id, commands),
+            commands,
             optimistic_updates=optimistic_updates,
-            error_message=f"Failed to send command for {device_id}",
         )
 
+    async def _async_queue_commands(
+        self,
+        device_id: str,
+        commands: list[tuple[str, Any]],
+        *,
+        optimistic_updates: dict[str, Any] | None,
+    ) -> None:
+        """Queue commands for one device and wait until their batch is sent."""
+        if self._circuit_breaker.is_open(time.monotonic()):
+            raise HomeAssistantError(
+                f"Failed to send command for {device_id}: {CIRCUIT_OPEN_MESSAGE}"
+            )
+
+        rollback = None
+        if optimistic_updates:
+            if self._is_unchanged_write(device_id, optimistic_updates):
+                self.write_queue_stats.skipped_writes += 1
+                return
+            rollback = self._capture_optimistic_rollback(device_id, optimistic_updates)
+            self._async_apply_optimistic_updates(device_id, optimistic_updates)
+
+        now = time.monotonic()
+        batch = self._write_queue.get(device_id)
+        if batch is None:
+            batch = self._write_queue[device_id] = QueuedDeviceWrite(
+                first_queued_at=now
+            )
+        if rollback is not None:
+            batch.rollbacks.append(rollback)
+
+        stats = self.write_queue_stats
+        for code, value in commands:
+            if code in batch.commands:
+                stats.superseded_commands += 1
+            batch.commands[code] = value
+            stats.queued_commands += 1
+
+        waiter: asyncio.Future[None] = self.hass.loop.create_future()
+        batch.waiters.append(waiter)
+        if batch.unsub_flush is not None:
+            batch.unsub_flush()
+
+        async def flush(_now: Any) -> None:
+            await self._async_flush_device_writes(device_id)
+
+        delay = min(
+            WRITE_COALESCE_DELAY, batch.first_queued_at + WRITE_MAX_LATENCY - now
+        )
+        batch.unsub_flush = async_call_later(self.hass, max(delay, 0.0), flush)
+        await waiter
+
+    async def _async_flush_device_writes(self, device_id: str) -> None:
+        """Send all queued commands for one device in a single request."""
+        batch = self._write_queue.pop(device_id, None)
+        if batch is None:
+            return
+
+        if batch.unsub_flush is not None:
+            batch.unsub_flush()
+            batch.unsub_flush = None
+
+        stats = self.write_queue_stats
+        latency = time.monotonic() - batch.first_queued_at
+        stats.flushes += 1
+        stats.flushed_commands += len(batch.commands)
+        stats.max_batch_size = max(stats.max_batch_size, len(batch.commands))
+        stats.last_flush_latency = latency
+        stats.max_flush_latency = max(stats.max_flush_latency, latency)
+
+        error: BaseException | None = None
+        try:
+            await self._async_run_write(
+                device_id,
+                self.client.send_command(device_id, list(batch.commands.items())),
+                optimistic_updates=None,
+                error_message=f"Failed to send command for {device_id}",
+            )
+        except HomeAssistantError as err:
+            error = err
+        except BaseException as err:
+            error = err
+            raise
+        finally:
+            if error is not None:
+                # Undo newest first so each rollback sees the state it replaced.
+                for rollback in reversed(batch.rollbacks):
+                    self._async_roll_back_optimistic_updates(device_id, rollback)
+            # Callers must never be left waiting on a batch that went nowhere.
+            _resolve_write_waiters(batch.waiters, device_id, error)
+
+    @callback
+    def async_cancel_queued_writes(self) -> None:
+        """Drop queued batches and fail the callers still waiting on them."""
+        write_queue = self._write_queue
+        self._write_queue = {}
+        for device_id, batch in write_queue.items():
+            if batch.unsub_flush is not None:
+                batch.unsub_flush()
+                batch.unsub_flush = None
+            _resolve_write_waiters(batch.waiters, device_id, asyncio.CancelledError())
+
+    @property
+    def pending_write_count(self) -> int:
+        """Return how many devices have writes awaiting confirmation."""
+        return len(self._pending_writes)
+
+    @callback
+    def async_add_telemetry_listener(
+        self, update_callback: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Listen for telemetry updates after every poll and write."""
+        self._telemetry_listeners.append(update_callback)
+
+        @callback
+        def remove() -> None:
+            self._telemetry_listeners.remove(update_callback)
+
+        return remove
+
+    @callback
+    def _async_update_telemetry_listeners(self) -> None:
+        """Notify telemetry listeners, even when a poll left the data unchanged."""
+        for update_callback in list(self._telemetry_listeners):
+            update_callback()
+
+    @property
+    def rate_limit_forecast(self) -> float | None:
+        """Return the seconds until the API budget runs out, if it is on track to."""
+        return self._poll_scheduler.seconds_until_limit(time.monotonic())
+
+    def get_api_budget_diagnostics(self) -> dict[str, Any]:
+        """Return rolling API usage per endpoint kind and the 429 forecast."""
+        return self._poll_scheduler.budget_diagnostics(time.monotonic())
+
+    def get_retry_backoff_diagnostics(self) -> dict[str, Any]:
+        """Return the current retry backoff per error class for diagnostics."""
+        return self._retry_backoff.diagnostics()
+
+    def get_degraded_diagnostics(self) -> dict[str, Any]:
+        """Return degraded mode state and per-device data age for diagnostics."""
+        now = time.time()
+        return {
+            "degraded": self.degraded,
+            "degraded_for": (
+                None if self._degraded_since is None else now - self._degraded_since
+            ),
+            "failed_polls": self._failed_polls,
+            "device_data_age": {
+                device_id: now - polled_at
+                for device_id, polled_at in sorted(self._device_polled_at.items())
+            },
+        }
+
+    def get_device_refresh_diagnostics(self) -> dict[str, Any]:
+        """Return per-device refresh failures and their backoff for diagnostics."""
+        now = time.monotonic()
+        return {
+            device_id: {
+                "failures": stats.failures,
+                "total_failures": stats.total_failures,
+                "last_error": stats.last_error,
+                "retry_in": max(0.0, stats.retry_at - now),
+            }
+            for device_id, stats in sorted(self._device_failures.items())
+        }
+
+    def get_circuit_diagnostics(self) -> dict[str, Any]:
+        """Return the cloud circuit breaker state for diagnostics."""
+        return self._circuit_breaker.diagnostics(time.monotonic())
+
+    def get_telemetry_diagnostics(self) -> dict[str, Any]:
+        """Return poll, write and retry telemetry for diagnostics."""
+        return self.telemetry.as_dict()
+
+    def get_write_queue_diagnostics(self) -> dict[str, Any]:
+        """Return queue depth and flush statistics for diagnostics."""
+        return {
+            "queued_devices": len(self._write_queue),
+            "queue_depth": sum(
+                len(batch.commands) for batch in self._write_queue.values()
+            ),
+            **asdict(self.write_queue_stats),
+            "pending_writes": len(self._pending_writes),
+            **asdict(self.pending_write_stats),
+        }
+
     @property
     def external_sensors_config(self) -> dict[str, str]:
         """Return configured external sensor entity IDs by device ID."""
@@ -472,29 +2053,130 @@ class DanfossAllyDataUpdateCoordinator(
         """Return configured window sensor entity ID for one device."""
         return self.window_sensors_config.get(device_id)
 
-    def get_temperature_entity_options(self) -> list[str]:
+    def get_temperature_entity_options(self) -> tuple[str, ...]:
         """Return entity IDs that can provide a temperature value."""
-        options: list[str] = []
-        for state in self.hass.states.async_all():
-            if not self._is_temperature_entity(state):
-                continue
-            if self._extract_temperature_celsius(state) is None:
-                continue
-            options.append(state.entity_id)
+        index = self._async_get_source_index()
+        if index.temperature_options is None:
+            index.temperature_options = tuple(sorted(index.temperature))
+        return index.temperature_options
 
-        options.sort()
-        return options
-
-    def get_window_entity_options(self) -> list[str]:
+    def get_window_entity_options(self) -> tuple[str, ...]:
         """Return entity IDs that can provide an open/closed window state."""
-        options: list[str] = []
+        index = self._async_get_source_index()
+        if index.window_options is None:
+            index.window_options = tuple(sorted(index.window))
+        return index.window_options
+
+    @callback
+    def _async_get_source_index(self) -> EntitySourceIndex:
+        """Build the source entity index once and keep it updated from events."""
+        if self._source_index is not None:
+            return self._source_index
+
+        index = self._source_index = EntitySourceIndex()
         for state in self.hass.states.async_all():
-            if not self._is_window_entity(state):
-                continue
-            options.append(state.entity_id)
+            self._async_index_source_state(state.entity_id, state)
+
+        @callback
+        def handle_state_changed(event: Event[Any]) -> None:
+            """Re-classify one entity after its state changed."""
+            if self._async_index_source_state(
+                event.data["entity_id"], event.data.get("new_state")
+            ):
+                self._async_update_source_option_listeners()
+
+        @callback
+        def handle_registry_updated(event: Event[Any]) -> None:
+            """Drop renamed or removed entity IDs from the index."""
+            action = event.data.get("action")
+            changed = False
+            if action == "remove":
+                changed = self._async_index_source_state(event.data["entity_id"], None)
+            elif action == "update" and (
+                old_entity_id := event.data.get("old_entity_id")
+            ):
+                changed = self._async_index_source_state(old_entity_id, None)
+                entity_id = event.data["entity_id"]
+                changed |= self._async_index_source_state(
+                    entity_id, self.hass.states.get(entity_id)
+                )
+            if changed:
+                self._async_update_source_option_listeners()
+
+        index.unsub_listeners = [
+            self.hass.bus.async_listen(
+                EVENT_STATE_CHANGED,
+                handle_state_changed,
+                event_filter=_is_source_domain_event,
+            ),
+            self.hass.bus.async_listen(
+                EVENT_ENTITY_REGISTRY_UPDATED,
+                handle_registry_updated,
+            ),
+        ]
+        return index
+
+    @callback
+    def _async_index_source_state(self, entity_id: str, state: Any) -> bool:
+        """Add or remove one entity from the cached source option lists."""
+        index = self._source_index
+        if index is None or entity_id.split(".", 1)[0] not in SOURCE_ENTITY_DOMAINS:
+            return False
+
+        changed = False
+
+        is_temperature = (
+            state is not None
+            and self._is_temperature_entity(state)
+            and self._extract_temperature_celsius(state) is not None
+        )
+        if is_temperature != (entity_id in index.temperature):
+            if is_temperature:
+                index.temperature.add(entity_id)
+            else:
+                index.temperature.discard(entity_id)
+            index.temperature_options = None
+            changed = True
+
+        is_window = self._is_window_entity(state)
+        if is_window != (entity_id in index.window):
+            if is_window:
+                index.window.add(entity_id)
+            else:
+                index.window.discard(entity_id)
+            index.window_options = None
+            changed = True
+
+        return changed
+
+    @callback
+    def async_add_source_options_listener(
+        self, update_callback: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Listen for changes to the source entity option lists."""
+        self._source_option_listeners.append(update_callback)
+
+        @callback
+        def remove() -> None:
+            self._source_option_listeners.remove(update_callback)
+
+        return remove
+
+    @callback
+    def _async_update_source_option_listeners(self) -> None:
+        """Notify source selects after an entity joined or left an option list."""
+        for update_callback in list(self._source_option_listeners):
+            update_callback()
+
+    @callback
+    def async_unload_source_index(self) -> None:
+        """Stop tracking source entities for the option lists."""
+        if self._source_index is None:
+            return
 
-        options.sort()
-        return options
+        for unsub in self._source_index.unsub_listeners:
+            unsub()
+        self._source_index = None
 
     async def async_set_external_sensor_entity(
         self,
@@ -555,7 +2237,6 @@ class DanfossAllyDataUpdateCoordinator(
 
     async def async_setup_external_temp_listeners(self) -> None:
         """Set up state change listeners for all configured external temperature sensors."""
-        from homeassistant.core import Event, callback
         from homeassistant.helpers.event import async_track_state_change_event
 
         # Clear any existing listeners
@@ -717,6 +2398,7 @@ class DanfossAllyDataUpdateCoordinator(
                 self.client.send_command(device_id, [("ext_measured_rs", temp_value)]),
                 optimistic_updates=None,
                 error_message=f"Failed to send external temperature to {device_id}",
+                priority=REQUEST_PRIORITY_EXTERNAL_TEMPERATURE,
             )
 
             # Update tracking after successful send
@@ -764,7 +2446,6 @@ class DanfossAllyDataUpdateCoordinator(
 
     async def async_setup_window_sensor_listeners(self) -> None:
         """Set up state change listeners for all configured window sensors."""
-        from homeassistant.core import Event, callback
         from homeassistant.helpers.event import async_track_state_change_event
 
         await self._async_load_window_restore_states()
@@ -975,6 +2656,7 @@ class DanfossAllyDataUpdateCoordinator(
             device_id,
             "pause",
             optimistic_updates={"mode": "pause"},
+            priority=REQUEST_PRIORITY_WINDOW,
         )
         self._window_restore_states[device_id] = snapshot
         await self._async_save_window_restore_states()
@@ -1003,17 +2685,61 @@ class DanfossAllyDataUpdateCoordinator(
                 snapshot.target_temperature,
                 snapshot.mode,
                 optimistic_updates=optimistic_updates,
+                priority=REQUEST_PRIORITY_WINDOW,
             )
         else:
             await self.async_set_mode(
                 device_id,
                 snapshot.mode,
                 optimistic_updates=optimistic_updates,
+                priority=REQUEST_PRIORITY_WINDOW,
             )
 
         self._window_restore_states.pop(device_id, None)
         await self._async_save_window_restore_states()
 
+    async def async_load_snapshot_cache(self) -> bool:
+        """Seed the coordinator with the last saved snapshot, if recent enough."""
+        stored = await self._snapshot_store.async_load()
+        if not stored:
+            return False
+
+        devices = stored.get("devices")
+        saved_at = stored.get("saved_at")
+        if (
+            not isinstance(devices, dict)
+            or not devices
+            or not isinstance(saved_at, int | float)
+            or time.time() - saved_at > SNAPSHOT_CACHE_MAX_AGE
+        ):
+            _LOGGER.debug("Ignoring missing or outdated %s snapshot cache", DOMAIN)
+            return False
+
+        _LOGGER.debug("Loaded %s cached devices for warm startup", len(devices))
+        self.data = {
+            device_id: _device_record(device) for device_id, device in devices.items()
+        }
+        # Data age counts from when the cached snapshot was saved.
+        self._last_good_poll_at = saved_at
+        self._device_polled_at = dict.fromkeys(devices, saved_at)
+        self.discovery_revision += 1
+        return True
+
+    @callback
+    def _async_schedule_snapshot_save(self) -> None:
+        """Persist the current snapshot after a short delay."""
+        saved_at = time.time()
+        devices = self.data or {}
+        self._snapshot_store.async_delay_save(
+            lambda: {
+                "saved_at": saved_at,
+                "devices": {
+                    device_id: dict(device) for device_id, device in devices.items()
+                },
+            },
+            SNAPSHOT_CACHE_SAVE_DELAY,
+        )
+
     async def _async_load_window_restore_states(self) -> None:
         """Load persisted window restore state from Home Assistant storage."""
         if self._window_restore_loaded:
@@ -1179,29 +2905,196 @@ class DanfossAllyDataUpdateCoordinator(
         *,
         optimistic_updates: dict[str, Any] | None,
         error_message: str,
+        priority: int = REQUEST_PRIORITY_USER_WRITE,
+        skip_unchanged: bool = True,
     ) -> None:
         """Execute a write request, apply optimistic state and refresh."""
+        if device_id in self._write_queue:
+            # Keep queued commands ordered before direct writes to the same device.
+            await self._async_flush_device_writes(device_id)
+
+        if (
+            skip_unchanged
+            and optimistic_updates
+            and self._is_unchanged_write(device_id, optimistic_updates)
+        ):
+            if isinstance(request, Coroutine):
+                request.close()
+            self.write_queue_stats.skipped_writes += 1
+            _LOGGER.debug("Skipping write to %s that changes nothing", device_id)
+            return
+
+        if not self._circuit_breaker.allow_request(time.monotonic()):
+            if isinstance(request, Coroutine):
+                request.close()
+            raise HomeAssistantError(f"{error_message}: {CIRCUIT_OPEN_MESSAGE}")
+
+        rollback = None
         if optimistic_updates:
+            rollback = self._capture_optimistic_rollback(device_id, optimistic_updates)
             self._async_apply_optimistic_updates(device_id, optimistic_updates)
 
         try:
-            result = await request
+            await self._async_send_write(request, error_message, priority)
+        except BaseException:
+            # A retry of the same value must not be skipped as already pending.
+            if rollback is not None:
+                self._async_roll_back_optimistic_updates(device_id, rollback)
+            raise
+
+        self._poll_scheduler.record_requests(time.monotonic())
+        self.async_note_activity()
+        if device_id in self._pending_writes:
+            # Read the device back soon instead of waiting for the next poll.
+            self._async_schedule_hot_refresh(device_id)
+        self._async_update_telemetry_listeners()
+
+    async def _async_send_write(
+        self,
+        request: Awaitable[bool],
+        error_message: str,
+        priority: int,
+    ) -> None:
+        """Send one write request and raise if the cloud did not accept it."""
+        method = getattr(request, "__name__", "request")
+        try:
+            await self._request_limiter.acquire(priority)
+            async with self._request_slots:
+                started = time.monotonic()
+                result = await request
         except exceptions.UnauthorizedError as err:
             raise ConfigEntryAuthFailed(AUTH_FAILED_MESSAGE) from err
+        except exceptions.RateLimitError as err:
+            self._request_limiter.note_rate_limited()
+            self._note_api_failure(err)
+            raise HomeAssistantError(
+                f"{error_message}: {_describe_api_error(err)}"
+            ) from err
         except (
             TimeoutError,
             ConnectionError,
             exceptions.APIError,
             exceptions.UnexpectedError,
         ) as err:
+            self._note_api_failure(err)
             raise HomeAssistantError(
                 f"{error_message}: {_describe_api_error(err)}"
             ) from err
 
+        self.telemetry.record_write(method, time.monotonic() - started)
+        self._note_api_success()
         if result is False:
             raise HomeAssistantError(error_message)
 
-        # Writes rely on optimistic state until the next scheduled poll.
+    @callback
+    def _async_schedule_hot_refresh(self, device_id: str, attempt: int = 0) -> None:
+        """Plan the next read-back of a written device until it is confirmed."""
+        if (unsub := self._hot_refresh_unsubs.pop(device_id, None)) is not None:
+            unsub()
+        if attempt >= len(HOT_REFRESH_DELAYS) or device_id not in self._pending_writes:
+            return
+
+        async def read_back(_now: Any) -> None:
+            self._hot_refresh_unsubs.pop(device_id, None)
+            await self._async_read_back_device(device_id, attempt)
+
+        self._hot_refresh_unsubs[device_id] = async_call_later(
+            self.hass, HOT_REFRESH_DELAYS[attempt], read_back
+        )
+
+    async def _async_read_back_device(self, device_id: str, attempt: int) -> None:
+        """Read one written device back and publish it once the cloud reflects it."""
+        current = self.data
+        if (
+            device_id not in self._pending_writes
+            or current is None
+            or device_id not in current
+        ):
+            return
+
+        # A running poll or an open circuit just postpones this attempt. The
+        # half-open probe is left to the poll, which reports to the breaker.
+        if not self._refresh_in_progress and not self._circuit_breaker.is_open(
+            time.monotonic()
+        ):
+            devices = {device_id: current[device_id]}
+            try:
+                requested = await self._async_refresh_single_devices(
+                    [device_id], devices
+                )
+            except exceptions.UnauthorizedError:
+                self.config_entry.async_start_reauth(self.hass)
+                return
+            if requested:
+                self._poll_scheduler.record_requests(
+                    time.monotonic(), requested, REQUEST_KIND_POLL
+                )
+            # A poll that started meanwhile publishes a newer fleet snapshot.
+            if (
+                not self._refresh_in_progress
+                and devices[device_id] is not current[device_id]
+            ):
+                self._async_apply_read_back(device_id, devices[device_id])
+
+        if device_id not in self._hot_refresh_unsubs:
+            # A newer write restarts the schedule on its own.
+            self._async_schedule_hot_refresh(device_id, attempt + 1)
+
+    @callback
+    def _async_apply_read_back(self, device_id: str, device: dict[str, Any]) -> None:
+        """Publish a read-back record, confirming the pending writes it reflects."""
+        current = self.data
+        if current is None or device_id not in current:
+            return
+
+        response_time = self._coerce_response_time(device.get("last_response_time"))
+        if response_time is not None:
+            if self._is_stale_device(device_id, response_time):
+                return
+            self._device_response_marks[device_id] = response_time
+            high_water = self._response_high_water
+            if high_water is None or response_time > high_water:
+                self._response_high_water = response_time
+        self._device_polled_at[device_id] = time.time()
+
+        device = self._apply_pending_writes({device_id: device})[device_id]
+        previous_device = current[device_id]
+        changed_keys = _diff_device(previous_device, device)
+        if not changed_keys:
+            return
+
+        if device.keys() != previous_device.keys():
+            self.discovery_revision += 1
+        if self.last_update_success:
+            self._device_changes = {device_id: changed_keys}
+        # Publish without async_set_updated_data so the fleet poll keeps its slot.
+        self.data = _snapshot_with_device(current, device_id, _device_record(device))
+        self.async_update_listeners()
+
+    @callback
+    def async_cancel_hot_refreshes(self) -> None:
+        """Cancel all scheduled read-backs of written devices."""
+        for unsub in self._hot_refresh_unsubs.values():
+            unsub()
+        self._hot_refresh_unsubs.clear()
+
+    def _note_api_success(self) -> None:
+        """Recover rate, circuit and backoff after the API answered a request."""
+        self._request_limiter.note_success()
+        self._circuit_breaker.record_success()
+        self._retry_backoff.reset()
+
+    def _note_api_failure(self, err: BaseException) -> float:
+        """Record a failed request and return how long to wait before retrying."""
+        error_class = _error_class(err)
+        self.telemetry.record_retry(error_class)
+        retry_after = self._retry_backoff.next_delay(error_class)
+        # Cloud outages count against the circuit; other errors prove it is up.
+        if error_class in CIRCUIT_ERROR_CLASSES:
+            self._circuit_breaker.record_failure(time.monotonic(), retry_after)
+        else:
+            self._circuit_breaker.record_success()
+        return retry_after
 
     def _async_apply_optimistic_updates(
         self,
@@ -1210,24 +3103,103 @@ class DanfossAllyDataUpdateCoordinator(
     ) -> None:
         """Update cached data immediately after a successful local write."""
         self._register_pending_write(device_id, updates)
+        self._async_set_device_values(device_id, updates)
+
+    def _capture_optimistic_rollback(
+        self, device_id: str, updates: dict[str, Any]
+    ) -> OptimisticRollback:
+        """Remember the pending and cached values a write is about to replace."""
+        pending_write = self._pending_writes.get(device_id)
+        pending = pending_write.updates if pending_write is not None else {}
+        device = (self.data or {}).get(device_id, {})
+        return OptimisticRollback(
+            updates=dict(updates),
+            pending={key: pending[key] for key in updates if key in pending},
+            values={key: device[key] for key in updates if key in device},
+        )
 
+    @callback
+    def _async_roll_back_optimistic_updates(
+        self, device_id: str, rollback: OptimisticRollback
+    ) -> None:
+        """Restore the state a failed write replaced, unless a newer write owns it."""
+        if (pending_write := self._pending_writes.get(device_id)) is not None:
+            for key, value in rollback.updates.items():
+                if pending_write.updates.get(key, _MISSING) != value:
+                    continue
+                if key in rollback.pending:
+                    pending_write.updates[key] = rollback.pending[key]
+                else:
+                    del pending_write.updates[key]
+            if not pending_write.updates:
+                del self._pending_writes[device_id]
+
+        device = (self.data or {}).get(device_id)
+        if device is None:
+            return
+        restored = {
+            key: rollback.values[key]
+            for key, value in rollback.updates.items()
+            if key in rollback.values and device.get(key, _MISSING) == value
+        }
+        if restored:
+            self._async_set_device_values(device_id, restored)
+
+    @callback
+    def _async_set_device_values(self, device_id: str, updates: dict[str, Any]) -> None:
+        """Publish new values for one device without waiting for a poll."""
         if self.data is None:
             return
 
-        new_data = {**self.data}
-        new_data[device_id] = {**self.data.get(device_id, {}), **updates}
-        self.async_set_updated_data(new_data)
+        previous_device = self.data.get(device_id, {})
+        device = _merge_device_record(previous_device, updates)
+        if self.last_update_success:
+            changed_keys = _diff_device(previous_device, device)
+            self._device_changes = {device_id: changed_keys} if changed_keys else {}
+        if device.keys() != previous_device.keys():
+            self.discovery_revision += 1
+        self.async_set_updated_data(_snapshot_with_device(self.data, device_id, device))
 
     def _register_pending_write(self, device_id: str, updates: dict[str, Any]) -> None:
         """Record optimistic updates until the polled state reflects them."""
         existing = self._pending_writes.get(device_id)
         combined_updates = {**(existing.updates if existing else {}), **updates}
         baseline_response_time = self._get_device_response_time(device_id)
+        now = time.monotonic()
+        expires_at = now + PENDING_WRITE_TIMEOUT
         self._pending_writes[device_id] = PendingWrite(
             updates=combined_updates,
-            expires_at=time.monotonic() + PENDING_WRITE_TIMEOUT,
+            expires_at=expires_at,
             baseline_response_time=baseline_response_time,
+            written_at=existing.written_at if existing else now,
         )
+        heapq.heappush(self._pending_expiry, (expires_at, device_id))
+
+    def _expire_pending_writes(self, now: float) -> None:
+        """Drop pending writes whose confirmation window has elapsed."""
+        expiry = self._pending_expiry
+        while expiry and expiry[0][0] <= now:
+            _, device_id = heapq.heappop(expiry)
+            pending_write = self._pending_writes.get(device_id)
+            # Heap entries are not removed on confirmation or re-registration,
+            # so only act when the entry still matches the live pending write.
+            if pending_write is not None and pending_write.expires_at <= now:
+                del self._pending_writes[device_id]
+                self.pending_write_stats.expired_writes += 1
+
+        if not self._pending_writes:
+            expiry.clear()
+
+    def _record_write_confirmation(
+        self, pending_write: PendingWrite, now: float
+    ) -> None:
+        """Record how long the cloud took to reflect an optimistic write."""
+        latency = max(0.0, now - pending_write.written_at)
+        stats = self.pending_write_stats
+        stats.confirmed_writes += 1
+        stats.last_confirmation_latency = latency
+        stats.max_confirmation_latency = max(stats.max_confirmation_latency, latency)
+        stats.total_confirmation_latency += latency
 
     def _apply_pending_writes(
         self,
@@ -1238,41 +3210,56 @@ class DanfossAllyDataUpdateCoordinator(
             return devices
 
         now = time.monotonic()
-        merged_devices = {**devices}
+        self._expire_pending_writes(now)
+        merged_devices: dict[str, dict[str, Any]] | None = None
 
         for device_id, pending_write in list(self._pending_writes.items()):
-            if pending_write.expires_at <= now:
-                self._pending_writes.pop(device_id, None)
+            device = devices.get(device_id)
+            if device is None:
                 continue
 
-            if device_id not in merged_devices:
-                continue
-
-            device = merged_devices[device_id]
             if not self._has_fresh_device_response(device, pending_write):
-                merged_devices[device_id] = {**device, **pending_write.updates}
-                continue
-
-            unresolved_updates: dict[str, Any] = {}
+                unresolved_updates = pending_write.updates
+            else:
+                unresolved_updates = {
+                    key: expected_value
+                    for key, expected_value in pending_write.updates.items()
+                    if not self._values_match(device.get(key), expected_value)
+                }
 
-            for key, expected_value in pending_write.updates.items():
-                if self._values_match(device.get(key), expected_value):
+                if not unresolved_updates:
+                    del self._pending_writes[device_id]
+                    self._record_write_confirmation(pending_write, now)
                     continue
 
-                unresolved_updates[key] = expected_value
+                if len(unresolved_updates) != len(pending_write.updates):
+                    pending_write.updates = unresolved_updates
 
-            if not unresolved_updates:
-                self._pending_writes.pop(device_id, None)
-                continue
+            if merged_devices is None:
+                merged_devices = {**devices}
+            merged_devices[device_id] = _merge_device_record(device, unresolved_updates)
 
-            merged_devices[device_id] = {**device, **unresolved_updates}
-            self._pending_writes[device_id] = PendingWrite(
-                updates=unresolved_updates,
-                expires_at=pending_write.expires_at,
-                baseline_response_time=pending_write.baseline_response_time,
-            )
+        return devices if merged_devices is None else merged_devices
 
-        return merged_devices
+    def _is_unchanged_write(self, device_id: str, updates: dict[str, Any]) -> bool:
+        """Return whether a device already reports or awaits every update."""
+        if self.data is None or self.degraded:
+            return False
+        device = self.data.get(device_id)
+        if device is None:
+            return False
+
+        # An expired write was never confirmed and must be sent again.
+        self._expire_pending_writes(time.monotonic())
+        pending_write = self._pending_writes.get(device_id)
+        pending = pending_write.updates if pending_write is not None else {}
+        return all(
+            self._values_match(
+                pending[key] if key in pending else device.get(key, _MISSING),
+                value,
+            )
+            for key, value in updates.items()
+        )
 
     def _values_match(self, actual: Any, expected: Any) -> bool:
         """Compare polled and optimistic values with tolerance for floats."""
@@ -1330,34 +3317,89 @@ class DanfossAllyDataUpdateCoordinator(
         return None
 
     def _is_stale_snapshot(self, devices: dict[str, dict[str, Any]]) -> bool:
-        """Return whether a polled snapshot should be ignored entirely."""
+        """Return whether no device in a polled snapshot reported anything newer."""
         if not self.data:
             return False
 
-        incoming_response_time = self._get_snapshot_response_time(devices)
-        current_response_time = self._get_snapshot_response_time(self.data)
+        high_water = self._get_response_high_water()
+        saw_response_time = False
+        for device_id, device in devices.items():
+            response_time = self._coerce_response_time(device.get("last_response_time"))
+            if response_time is None:
+                continue
+            if high_water is None or response_time > high_water:
+                return False
+            if not self._is_stale_device(device_id, response_time):
+                return False
+            saw_response_time = True
 
-        if incoming_response_time is None or current_response_time is None:
-            return False
+        return saw_response_time
 
-        return incoming_response_time <= current_response_time
+    def _keep_lagging_devices(
+        self,
+        devices: dict[str, dict[str, Any]],
+    ) -> dict[str, dict[str, Any]]:
+        """Keep the cached record of devices whose own response did not advance."""
+        if not self.data:
+            return devices
+
+        merged_devices: dict[str, dict[str, Any]] | None = None
+        for device_id, device in devices.items():
+            response_time = self._coerce_response_time(device.get("last_response_time"))
+            if response_time is None or not self._is_stale_device(
+                device_id, response_time
+            ):
+                continue
+            if (current_device := self.data.get(device_id)) is None:
+                continue
+            if merged_devices is None:
+                merged_devices = {**devices}
+            merged_devices[device_id] = current_device
+
+        return devices if merged_devices is None else merged_devices
+
+    def _is_stale_device(self, device_id: str, response_time: int) -> bool:
+        """Return whether one device response is not newer than the one we hold."""
+        mark = self._device_response_marks.get(device_id)
+        if mark is None and self.data is not None:
+            device = self.data.get(device_id)
+            if device is not None:
+                mark = self._coerce_response_time(device.get("last_response_time"))
+        return mark is not None and response_time <= mark
+
+    def _get_response_high_water(self) -> int | None:
+        """Return the newest response timestamp accepted so far."""
+        if self._response_high_water is None and self.data:
+            self._response_high_water = self._get_snapshot_response_time(self.data)
+        return self._response_high_water
+
+    def _advance_response_marks(self, devices: dict[str, dict[str, Any]]) -> None:
+        """Advance the per-device and fleet-wide response high-water marks."""
+        marks = self._device_response_marks
+        if len(marks) > len(devices):
+            for device_id in marks.keys() - devices.keys():
+                del marks[device_id]
+
+        high_water = self._response_high_water
+        for device_id, device in devices.items():
+            response_time = self._coerce_response_time(device.get("last_response_time"))
+            if response_time is None:
+                continue
+            mark = marks.get(device_id)
+            if mark is None or response_time > mark:
+                marks[device_id] = response_time
+            if high_water is None or response_time > high_water:
+                high_water = response_time
+        self._response_high_water = high_water
 
     def _get_snapshot_response_time(
         self,
-        devices: dict[str, dict[str, Any]],
+        devices: Mapping[str, Mapping[str, Any]],
     ) -> int | None:
         """Return the newest response timestamp found in one snapshot."""
-        response_times = [
-            response_time
-            for device in devices.values()
-            if (
-                response_time := self._coerce_response_time(
-                    device.get("last_response_time")
-                )
-            )
-            is not None
-        ]
-        if not response_times:
-            return None
-
-        return max(response_times)
+        newest: int | None = None
+        for device in devices.values():
+            response_time = self._coerce_response_time(device.get("last_response_time"))
+            if response_time is not None and (newest is None or response_time > newest):
+                newest = response_time
+        return newest
@@ -12,6 +12,7 @@ TO_REDACT = {CONF_KEY, CONF_SECRET, "token"}
 
 async def async_get_config_entry_diagnostics(hass, entry: DanfossConfigEntry) -> dict:
     """Return diagnostics for a config entry."""
+    coordinator = entry.runtime_data.coordinator
     return async_redact_data(
         {
             "entry": {
@@ -19,7 +20,14 @@ async def async_get_config_entry_diagnostics(hass, entry: DanfossConfigEntry) ->
                 "title": entry.title,
                 "data": dict(entry.data),
             },
-            "devices": entry.runtime_data.coordinator.data,
+            "devices": coordinator.data,
+            "write_queue": coordinator.get_write_queue_diagnostics(),
+            "telemetry": coordinator.get_telemetry_diagnostics(),
+            "api_budget": coordinator.get_api_budget_diagnostics(),
+            "circuit_breaker": coordinator.get_circuit_diagnostics(),
+            "retry_backoff": coordinator.get_retry_backoff_diagnostics(),
+            "degraded_mode": coordinator.get_degraded_diagnostics(),
+            "device_refresh": coordinator.get_device_refresh_diagnostics(),
         },
         TO_REDACT,
     )
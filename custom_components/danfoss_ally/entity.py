@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Mapping
 from typing import Any
 
 from homeassistant.core import callback
@@ -11,11 +11,16 @@ from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DEFAULT_NAME, DOMAIN
-from .coordinator import DanfossAllyDataUpdateCoordinator, DanfossConfigEntry
+from .coordinator import (
+    DanfossAllyDataUpdateCoordinator,
+    DanfossConfigEntry,
+    DeviceKeySubscription,
+)
 
+DEVICE_AVAILABILITY_KEYS = frozenset({"online"})
 
 type DanfossEntityFactory = Callable[
-    [DanfossAllyDataUpdateCoordinator],
+    [DanfossAllyDataUpdateCoordinator, Iterable[str]],
     Iterable[Entity],
 ]
 
@@ -27,17 +32,43 @@ def async_setup_dynamic_platform_entities(
 ) -> None:
     """Add entities now and whenever the coordinator discovers new devices."""
     coordinator = entry.runtime_data.coordinator
-    known_unique_ids: set[str] = set()
+    known_unique_ids: dict[str, set[str]] = {}
+    known_device_keys: dict[str, frozenset[str]] = {}
+    seen_revision: int | None = None
 
     @callback
     def async_add_new_entities() -> None:
-        new_entities: list[Entity] = []
+        nonlocal seen_revision
+        # Discovery only has work to do when devices or their keys changed.
+        if coordinator.discovery_revision == seen_revision:
+            return
+        seen_revision = coordinator.discovery_revision
+
+        devices = coordinator.data or {}
+        for device_id in known_device_keys.keys() - devices.keys():
+            # A removed device that comes back must get its entities again.
+            known_device_keys.pop(device_id)
+            known_unique_ids.pop(device_id, None)
+
+        device_ids = [
+            device_id
+            for device_id, device in devices.items()
+            if known_device_keys.get(device_id) != device.keys()
+        ]
+        if not device_ids:
+            return
+
+        for device_id in device_ids:
+            known_device_keys[device_id] = frozenset(devices[device_id])
 
-        for entity in entity_factory(coordinator):
-            if entity.unique_id is None or entity.unique_id in known_unique_ids:
-                continue
-            known_unique_ids.add(entity.unique_id)
-            new_entities.append(entity)
+        new_entities: list[Entity] = []
+        for device_id in device_ids:
+            device_unique_ids = known_unique_ids.setdefault(device_id, set())
+            for entity in entity_factory(coordinator, (device_id,)):
+                if entity.unique_id is None or entity.unique_id in device_unique_ids:
+                    continue
+                device_unique_ids.add(entity.unique_id)
+                new_entities.append(entity)
 
         if new_entities:
             async_add_entities(new_entities)
@@ -52,14 +83,29 @@ class DanfossAllyEntity(CoordinatorEntity[DanfossAllyDataUpdateCoordinator], Ent
     _attr_has_entity_name = True
 
     def __init__(
-        self, coordinator: DanfossAllyDataUpdateCoordinator, device_id: str
+        self,
+        coordinator: DanfossAllyDataUpdateCoordinator,
+        device_id: str,
+        device_keys: Iterable[str] | None = None,
     ) -> None:
         """Initialize the shared device entity state."""
-        super().__init__(coordinator, context=device_id)
+        # Only coordinator updates touching device_keys reach the entity;
+        # None subscribes the entity to every change on its device.
+        super().__init__(
+            coordinator,
+            context=DeviceKeySubscription(
+                device_id,
+                (
+                    None
+                    if device_keys is None
+                    else frozenset(device_keys) | DEVICE_AVAILABILITY_KEYS
+                ),
+            ),
+        )
         self._device_id = device_id
 
     @property
-    def device(self) -> dict[str, Any]:
+    def device(self) -> Mapping[str, Any]:
         """Return the latest cached device data."""
         if self.coordinator.data is None:
             return {}
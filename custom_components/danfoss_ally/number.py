@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass
 
 from homeassistant.components.number import NumberDeviceClass, NumberEntity
@@ -98,10 +99,11 @@ async def async_setup_entry(
     async_setup_dynamic_platform_entities(entry, async_add_entities, _build_entities)
 
 
-def _build_entities(coordinator) -> list[DanfossAllyNumber]:
-    """Build number entities for currently discovered devices."""
+def _build_entities(coordinator, device_ids: Iterable[str]) -> list[DanfossAllyNumber]:
+    """Build number entities for the given discovered devices."""
     entities: list[DanfossAllyNumber] = []
-    for device_id, device in (coordinator.data or {}).items():
+    for device_id in device_ids:
+        device = coordinator.data[device_id]
         for description in NUMBERS:
             if description.key in device:
                 entities.append(DanfossAllyNumber(coordinator, device_id, description))
@@ -117,7 +119,7 @@ class DanfossAllyNumber(DanfossAllyEntity, NumberEntity):
         self, coordinator, device_id: str, description: DanfossAllyNumberDescription
     ) -> None:
         """Initialize the number entity."""
-        super().__init__(coordinator, device_id)
+        super().__init__(coordinator, device_id, (description.key,))
         self.entity_description = description
         self._attr_translation_key = description.translation_key
         self._attr_unique_id = f"{description.unique_prefix}_{device_id}_ally"
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+
 from homeassistant.components.select import SelectEntity, SelectEntityDescription
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import EntityCategory
@@ -38,18 +40,20 @@ async def async_setup_entry(
 
 def _build_entities(
     coordinator,
+    device_ids: Iterable[str],
 ) -> list[
     DanfossAllyHcsSelect
     | DanfossAllyExternalTemperatureSensorSelect
     | DanfossAllyWindowSensorSelect
 ]:
-    """Build select entities for currently discovered devices."""
+    """Build select entities for the given discovered devices."""
     entities: list[
         DanfossAllyHcsSelect
         | DanfossAllyExternalTemperatureSensorSelect
         | DanfossAllyWindowSensorSelect
     ] = []
-    for device_id, device in (coordinator.data or {}).items():
+    for device_id in device_ids:
+        device = coordinator.data[device_id]
         if "ctrl_alg" in device:
             entities.append(DanfossAllyHcsSelect(coordinator, device_id))
 
@@ -69,7 +73,7 @@ class DanfossAllyHcsSelect(DanfossAllyEntity, SelectEntity):
 
     def __init__(self, coordinator, device_id: str) -> None:
         """Initialize the select."""
-        super().__init__(coordinator, device_id)
+        super().__init__(coordinator, device_id, (HCS_SELECT.key,))
         self._attr_translation_key = HCS_SELECT.translation_key
         self._attr_unique_id = f"{{}} heating control scaling_{device_id}_ally"
 
@@ -107,7 +111,7 @@ class DanfossAllyExternalTemperatureSensorSelect(DanfossAllyEntity, SelectEntity
 
     def __init__(self, coordinator, device_id: str) -> None:
         """Initialize the external temperature sensor source select."""
-        super().__init__(coordinator, device_id)
+        super().__init__(coordinator, device_id, ())
         self._attr_unique_id = f"external_temperature_sensor_source_{device_id}_ally"
 
     @property
@@ -141,6 +145,15 @@ class DanfossAllyExternalTemperatureSensorSelect(DanfossAllyEntity, SelectEntity
         )
         self.async_write_ha_state()
 
+    async def async_added_to_hass(self) -> None:
+        """Re-render the options whenever a temperature source appears or goes."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_source_options_listener(
+                self.async_write_ha_state
+            )
+        )
+
 
 class DanfossAllyWindowSensorSelect(DanfossAllyEntity, SelectEntity):
     """Select which HA entity should pause heating when a window is open."""
@@ -152,7 +165,7 @@ class DanfossAllyWindowSensorSelect(DanfossAllyEntity, SelectEntity):
 
     def __init__(self, coordinator, device_id: str) -> None:
         """Initialize the window sensor source select."""
-        super().__init__(coordinator, device_id)
+        super().__init__(coordinator, device_id, ())
         self._attr_unique_id = f"window_sensor_source_{device_id}_ally"
 
     @property
@@ -185,3 +198,12 @@ class DanfossAllyWindowSensorSelect(DanfossAllyEntity, SelectEntity):
             entity_id,
         )
         self.async_write_ha_state()
+
+    async def async_added_to_hass(self) -> None:
+        """Re-render the options whenever a window source appears or goes."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_source_options_listener(
+                self.async_write_ha_state
+            )
+        )
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 
 from homeassistant.components.sensor import (
@@ -11,11 +11,13 @@ from homeassistant.components.sensor import (
     SensorEntityDescription,
     SensorStateClass,
 )
-from homeassistant.const import PERCENTAGE, UnitOfTemperature
+from homeassistant.const import PERCENTAGE, UnitOfTemperature, UnitOfTime
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.entity import EntityCategory
 
-from .coordinator import DanfossConfigEntry
+from .const import DEFAULT_NAME, DOMAIN
+from .coordinator import DanfossAllyDataUpdateCoordinator, DanfossConfigEntry
 from .entity import DanfossAllyEntity, async_setup_dynamic_platform_entities
 
 
@@ -25,6 +27,7 @@ class DanfossAllySensorDescription(SensorEntityDescription):
 
     exists_fn: Callable[[dict[str, object]], bool]
     value_fn: Callable[[dict[str, object]], object]
+    device_keys: tuple[str, ...]
     unique_prefix: str
 
 
@@ -41,6 +44,7 @@ SENSORS: tuple[DanfossAllySensorDescription, ...] = (
         value_fn=lambda device: device.get(
             "local_temperature", device.get("temperature")
         ),
+        device_keys=("local_temperature", "temperature"),
         unique_prefix="temperature",
     ),
     DanfossAllySensorDescription(
@@ -52,6 +56,7 @@ SENSORS: tuple[DanfossAllySensorDescription, ...] = (
         entity_category=EntityCategory.DIAGNOSTIC,
         exists_fn=lambda device: "battery" in device,
         value_fn=lambda device: device["battery"],
+        device_keys=("battery",),
         unique_prefix="battery",
     ),
     DanfossAllySensorDescription(
@@ -62,6 +67,7 @@ SENSORS: tuple[DanfossAllySensorDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         exists_fn=lambda device: "humidity" in device,
         value_fn=lambda device: device["humidity"],
+        device_keys=("humidity",),
         unique_prefix="humidity",
     ),
     DanfossAllySensorDescription(
@@ -72,6 +78,7 @@ SENSORS: tuple[DanfossAllySensorDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         exists_fn=lambda device: "floor_temperature" in device,
         value_fn=lambda device: device["floor_temperature"],
+        device_keys=("floor_temperature",),
         unique_prefix="floor temperature",
     ),
     DanfossAllySensorDescription(
@@ -82,6 +89,7 @@ SENSORS: tuple[DanfossAllySensorDescription, ...] = (
         icon="mdi:pipe-valve",
         exists_fn=lambda device: "valve_opening" in device or "valveOpening" in device,
         value_fn=lambda device: device.get("valve_opening", device.get("valveOpening")),
+        device_keys=("valve_opening", "valveOpening"),
         unique_prefix="valve opening",
     ),
     DanfossAllySensorDescription(
@@ -92,6 +100,7 @@ SENSORS: tuple[DanfossAllySensorDescription, ...] = (
         entity_registry_enabled_default=False,
         exists_fn=lambda device: "load_room_mean" in device,
         value_fn=lambda device: device["load_room_mean"],
+        device_keys=("load_room_mean",),
         unique_prefix="load room mean",
     ),
     DanfossAllySensorDescription(
@@ -106,11 +115,78 @@ SENSORS: tuple[DanfossAllySensorDescription, ...] = (
         value_fn=lambda device: device.get(
             "ext_measured_rs", device.get("external_sensor_temperature")
         ),
+        device_keys=("ext_measured_rs", "external_sensor_temperature"),
         unique_prefix="external sensor temperature",
     ),
 )
 
 
+@dataclass(frozen=True, kw_only=True)
+class DanfossAllyTelemetrySensorDescription(SensorEntityDescription):
+    """Describe a coordinator telemetry sensor entity."""
+
+    value_fn: Callable[[DanfossAllyDataUpdateCoordinator], float | int | None]
+
+
+TELEMETRY_SENSORS: tuple[DanfossAllyTelemetrySensorDescription, ...] = (
+    DanfossAllyTelemetrySensorDescription(
+        key="poll_duration",
+        translation_key="poll_duration",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+        value_fn=lambda coordinator: coordinator.telemetry.poll_duration.last,
+    ),
+    DanfossAllyTelemetrySensorDescription(
+        key="poll_api_calls",
+        translation_key="poll_api_calls",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: coordinator.telemetry.last_poll_api_calls,
+    ),
+    DanfossAllyTelemetrySensorDescription(
+        key="poll_devices_changed",
+        translation_key="poll_devices_changed",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: coordinator.telemetry.last_poll_devices_changed,
+    ),
+    DanfossAllyTelemetrySensorDescription(
+        key="pending_writes",
+        translation_key="pending_writes",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: coordinator.pending_write_count,
+    ),
+    DanfossAllyTelemetrySensorDescription(
+        key="write_confirmation_latency",
+        translation_key="write_confirmation_latency",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: (
+            coordinator.pending_write_stats.last_confirmation_latency
+        ),
+    ),
+    DanfossAllyTelemetrySensorDescription(
+        key="rate_limit_forecast",
+        translation_key="rate_limit_forecast",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_unit_of_measurement=UnitOfTime.MINUTES,
+        value_fn=lambda coordinator: coordinator.rate_limit_forecast,
+    ),
+    DanfossAllyTelemetrySensorDescription(
+        key="api_retries",
+        translation_key="api_retries",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda coordinator: sum(coordinator.telemetry.retry_events.values()),
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: DanfossConfigEntry,
@@ -118,12 +194,20 @@ async def async_setup_entry(
 ) -> None:
     """Set up Danfoss Ally sensor entities."""
     async_setup_dynamic_platform_entities(entry, async_add_entities, _build_entities)
+    coordinator = entry.runtime_data.coordinator
+    async_add_entities(
+        [
+            DanfossAllyTelemetrySensor(coordinator, entry, description)
+            for description in TELEMETRY_SENSORS
+        ]
+    )
 
 
-def _build_entities(coordinator) -> list[DanfossAllySensor]:
-    """Build sensor entities for currently discovered devices."""
+def _build_entities(coordinator, device_ids: Iterable[str]) -> list[DanfossAllySensor]:
+    """Build sensor entities for the given discovered devices."""
     entities: list[DanfossAllySensor] = []
-    for device_id, device in (coordinator.data or {}).items():
+    for device_id in device_ids:
+        device = coordinator.data[device_id]
         for description in SENSORS:
             if description.exists_fn(device):
                 entities.append(DanfossAllySensor(coordinator, device_id, description))
@@ -139,7 +223,7 @@ class DanfossAllySensor(DanfossAllyEntity, SensorEntity):
         self, coordinator, device_id: str, description: DanfossAllySensorDescription
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator, device_id)
+        super().__init__(coordinator, device_id, description.device_keys)
         self.entity_description = description
         self._attr_translation_key = description.translation_key
         self._attr_unique_id = f"{description.unique_prefix}_{device_id}_ally"
@@ -159,3 +243,40 @@ class DanfossAllySensor(DanfossAllyEntity, SensorEntity):
             value = self.native_value
             return super().available and value not in (-80, -80.0)
         return super().available
+
+
+class DanfossAllyTelemetrySensor(SensorEntity):
+    """Diagnostic sensor reporting coordinator performance telemetry."""
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    entity_description: DanfossAllyTelemetrySensorDescription
+
+    def __init__(
+        self,
+        coordinator: DanfossAllyDataUpdateCoordinator,
+        entry: DanfossConfigEntry,
+        description: DanfossAllyTelemetrySensorDescription,
+    ) -> None:
+        """Initialize the telemetry sensor."""
+        self.coordinator = coordinator
+        self.entity_description = description
+        self._attr_unique_id = f"{description.key}_{entry.entry_id}_ally"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            manufacturer=DEFAULT_NAME,
+            name=entry.title,
+            entry_type=DeviceEntryType.SERVICE,
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Refresh the sensor after every poll and write."""
+        self.async_on_remove(
+            self.coordinator.async_add_telemetry_listener(self.async_write_ha_state)
+        )
+
+    @property
+    def native_value(self) -> float | int | None:
+        """Return the current telemetry value."""
+        return self.entity_description.value_fn(self.coordinator)
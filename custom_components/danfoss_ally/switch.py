@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass
 
 from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
@@ -72,10 +73,11 @@ async def async_setup_entry(
     async_setup_dynamic_platform_entities(entry, async_add_entities, _build_entities)
 
 
-def _build_entities(coordinator) -> list[DanfossAllySwitch]:
-    """Build switch entities for currently discovered devices."""
+def _build_entities(coordinator, device_ids: Iterable[str]) -> list[DanfossAllySwitch]:
+    """Build switch entities for the given discovered devices."""
     entities: list[DanfossAllySwitch] = []
-    for device_id, device in (coordinator.data or {}).items():
+    for device_id in device_ids:
+        device = coordinator.data[device_id]
         if str(device.get("model", "")).lower() == "icon zigbee module":
             continue
         for description in SWITCHES:
@@ -93,7 +95,7 @@ class DanfossAllySwitch(DanfossAllyEntity, SwitchEntity):
         self, coordinator, device_id: str, description: DanfossAllySwitchDescription
     ) -> None:
         """Initialize the switch."""
-        super().__init__(coordinator, device_id)
+        super().__init__(coordinator, device_id, (description.key,))
         self.entity_description = description
         self._attr_translation_key = description.translation_key
         self._attr_unique_id = f"{description.unique_prefix}_{device_id}_ally"
@@ -2,29 +2,52 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
-from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, EVENT_STATE_CHANGED
 from homeassistant.core import CoreState, State
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.helpers.update_coordinator import UpdateFailed
 from pydanfossally import exceptions
 from custom_components.danfoss_ally.coordinator import (
+    API_FORECAST_WINDOW,
+    AdaptivePollScheduler,
+    CircuitBreaker,
+    CoordinatorTelemetry,
     CONNECTION_RETRY_AFTER,
     RATE_LIMIT_ERROR_MESSAGE,
     DanfossAllyDataUpdateCoordinator,
+    DanfossAllyTransport,
+    DeviceRefreshStats,
+    DeviceKeySubscription,
     FORBIDDEN_RETRY_AFTER,
     GENERIC_API_RETRY_AFTER,
     PendingWrite,
+    PendingWriteStats,
+    PENDING_WRITE_TIMEOUT,
     RATE_LIMIT_RETRY_AFTER,
+    REQUEST_PRIORITY_POLL,
+    REQUEST_PRIORITY_USER_WRITE,
+    REQUEST_PRIORITY_WINDOW,
+    RETRY_AFTER_BY_ERROR_CLASS,
+    RequestLimiter,
+    RetryBackoff,
     SERVER_ERROR_RETRY_AFTER,
     TIMEOUT_RETRY_AFTER,
     WindowRestoreState,
+    WriteQueueStats,
     _CoordinatorLoggerAdapter,
+    DeviceRecord,
+    _device_record,
+    _diff_device_snapshots,
+    _merge_device_record,
+    _snapshot_with_device,
 )
 from custom_components.danfoss_ally.const import DOMAIN
 
@@ -32,6 +55,8 @@ from custom_components.danfoss_ally.const import DOMAIN
 def test_apply_pending_writes_overlays_stale_polled_values() -> None:
     """Pending writes should mask stale server values until they are observed."""
     coordinator = object.__new__(DanfossAllyDataUpdateCoordinator)
+    coordinator._pending_expiry = []
+    coordinator.pending_write_stats = PendingWriteStats()
     coordinator._pending_writes = {
         "device-1": PendingWrite(
             updates={"mode": "manual", "manual_mode_fast": 23.0},
@@ -58,6 +83,8 @@ def test_apply_pending_writes_overlays_stale_polled_values() -> None:
 def test_apply_pending_writes_clears_confirmed_values() -> None:
     """Pending writes should clear once polling reflects the expected values."""
     coordinator = object.__new__(DanfossAllyDataUpdateCoordinator)
+    coordinator._pending_expiry = []
+    coordinator.pending_write_stats = PendingWriteStats()
     coordinator._pending_writes = {
         "device-1": PendingWrite(
             updates={"mode": "manual", "manual_mode_fast": 23.0},
@@ -84,6 +111,8 @@ def test_apply_pending_writes_clears_confirmed_values() -> None:
 def test_apply_pending_writes_waits_for_new_response_timestamp() -> None:
     """Stale poll snapshots should not override pending values."""
     coordinator = object.__new__(DanfossAllyDataUpdateCoordinator)
+    coordinator._pending_expiry = []
+    coordinator.pending_write_stats = PendingWriteStats()
     coordinator._pending_writes = {
         "device-1": PendingWrite(
             updates={"mode": "manual", "manual_mode_fast": 23.0},
@@ -112,6 +141,8 @@ def test_apply_pending_writes_waits_for_new_response_timestamp() -> None:
 def test_apply_pending_writes_uses_new_response_timestamp_for_confirmation() -> None:
     """A newer poll may clear pending values once it matches the write."""
     coordinator = object.__new__(DanfossAllyDataUpdateCoordinator)
+    coordinator._pending_expiry = []
+    coordinator.pending_write_stats = PendingWriteStats()
     coordinator._pending_writes = {
         "device-1": PendingWrite(
             updates={"mode": "manual", "manual_mode_fast": 23.0},
@@ -136,6 +167,61 @@ def test_apply_pending_writes_uses_new_response_timestamp_for_confirmation() ->
     assert coordinator._pending_writes == {}
 
 
+def test_pending_writes_expire_from_heap() -> None:
+    """Only due heap entries should expire the live pending write for a device."""
+    coordinator = object.__new__(DanfossAllyDataUpdateCoordinator)
+    coordinator._pending_expiry = []
+    coordinator.pending_write_stats = PendingWriteStats()
+    coordinator._pending_writes = {}
+    coordinator.data = None
+
+    with patch("custom_components.danfoss_ally.coordinator.time.monotonic") as clock:
+        clock.return_value = 1000.0
+        coordinator._register_pending_write("device-1", {"mode": "manual"})
+        coordinator._register_pending_write("device-2", {"mode": "at_home"})
+        clock.return_value = 1010.0
+        coordinator._register_pending_write("device-1", {"manual_mode_fast": 22.0})
+
+    coordinator._expire_pending_writes(1000.0 + PENDING_WRITE_TIMEOUT)
+
+    assert list(coordinator._pending_writes) == ["device-1"]
+    assert coordinator._pending_writes["device-1"].updates == {
+        "mode": "manual",
+        "manual_mode_fast": 22.0,
+    }
+    assert coordinator._pending_writes["device-1"].written_at == 1000.0
+    assert coordinator.pending_write_stats.expired_writes == 1
+    assert coordinator._pending_expiry == [(1010.0 + PENDING_WRITE_TIMEOUT, "device-1")]
+
+
+def test_apply_pending_writes_records_confirmation_latency() -> None:
+    """Confirmed writes should report how long the cloud took to reflect them."""
+    coordinator = object.__new__(DanfossAllyDataUpdateCoordinator)
+    coordinator._pending_expiry = []
+    coordinator.pending_write_stats = PendingWriteStats()
+    coordinator._pending_writes = {
+        "device-1": PendingWrite(
+            updates={"mode": "manual"},
+            expires_at=time.monotonic() + 60,
+            baseline_response_time=100,
+            written_at=time.monotonic() - 5,
+        )
+    }
+    devices = {
+        "device-1": {"mode": "manual", "last_response_time": 101},
+        "device-2": {"mode": "at_home", "last_response_time": 101},
+    }
+
+    merged = coordinator._apply_pending_writes(devices)
+
+    assert merged is devices
+    assert coordinator._pending_writes == {}
+    stats = coordinator.pending_write_stats
+    assert stats.confirmed_writes == 1
+    assert 5 <= stats.last_confirmation_latency < 10
+    assert stats.max_confirmation_latency == stats.last_confirmation_latency
+
+
 def test_is_stale_snapshot_rejects_unchanged_response_timestamp() -> None:
     """Coordinator snapshots should be ignored until the API timestamp changes."""
     coordinator = object.__new__(DanfossAllyDataUpdateCoordinator)
@@ -145,6 +231,8 @@ def test_is_stale_snapshot_rejects_unchanged_response_timestamp() -> None:
             "last_response_time": 101,
         }
     }
+    coordinator._device_response_marks = {}
+    coordinator._response_high_water = None
 
     assert coordinator._is_stale_snapshot(
         {
@@ -156,109 +244,1311 @@ def test_is_stale_snapshot_rejects_unchanged_response_timestamp() -> None:
     )
 
 
-def test_is_stale_snapshot_accepts_newer_response_timestamp() -> None:
-    """Coordinator snapshots should be accepted once the API timestamp advances."""
-    coordinator = object.__new__(DanfossAllyDataUpdateCoordinator)
-    coordinator.data = {
-        "device-1": {
-            "mode": "manual",
-            "last_response_time": 101,
-        }
-    }
+def test_is_stale_snapshot_accepts_newer_response_timestamp() -> None:
+    """Coordinator snapshots should be accepted once the API timestamp advances."""
+    coordinator = object.__new__(DanfossAllyDataUpdateCoordinator)
+    coordinator.data = {
+        "device-1": {
+            "mode": "manual",
+            "last_response_time": 101,
+        }
+    }
+    coordinator._device_response_marks = {}
+    coordinator._response_high_water = None
+
+    assert not coordinator._is_stale_snapshot(
+        {
+            "device-1": {
+                "mode": "at_home",
+                "last_response_time": 102,
+            }
+        }
+    )
+
+
+def test_is_stale_snapshot_accepts_device_advancing_below_fleet_high_water() -> None:
+    """A device catching up should not be discarded behind a newer neighbour."""
+    coordinator = object.__new__(DanfossAllyDataUpdateCoordinator)
+    coordinator.data = {
+        "device-1": {"mode": "manual", "last_response_time": 100},
+        "device-2": {"mode": "manual", "last_response_time": 105},
+    }
+    coordinator._device_response_marks = {}
+    coordinator._response_high_water = None
+
+    assert not coordinator._is_stale_snapshot(
+        {
+            "device-1": {"mode": "at_home", "last_response_time": 103},
+            "device-2": {"mode": "manual", "last_response_time": 105},
+        }
+    )
+    assert coordinator._response_high_water == 105
+
+    coordinator._advance_response_marks(
+        {
+            "device-1": {"mode": "at_home", "last_response_time": 103},
+            "device-2": {"mode": "manual", "last_response_time": 104},
+        }
+    )
+
+    assert coordinator._device_response_marks == {"device-1": 103, "device-2": 104}
+    assert coordinator._response_high_water == 105
+    assert coordinator._is_stale_snapshot(
+        {
+            "device-1": {"mode": "at_home", "last_response_time": 103},
+            "device-2": {"mode": "manual", "last_response_time": 104},
+        }
+    )
+
+
+def make_circuit_breaker() -> CircuitBreaker:
+    """Create a closed circuit breaker with the default threshold."""
+    return CircuitBreaker(failure_threshold=3, probe_timeout=30.0)
+
+
+def make_retry_backoff() -> RetryBackoff:
+    """Create a retry backoff using the per-class base delays."""
+    return RetryBackoff(RETRY_AFTER_BY_ERROR_CLASS, max_delay=3600.0, jitter=0.2)
+
+
+def make_request_limiter() -> RequestLimiter:
+    """Create a request limiter that never makes tests wait."""
+    return RequestLimiter(rate=1000.0, burst=1000, min_rate=1.0)
+
+
+@pytest.mark.asyncio
+async def test_update_data_uses_bulk_fetch_for_first_refresh() -> None:
+    """First refresh should discover devices via the bulk endpoint."""
+    coordinator = object.__new__(DanfossAllyDataUpdateCoordinator)
+    coordinator.telemetry = CoordinatorTelemetry()
+    coordinator._circuit_breaker = make_circuit_breaker()
+    coordinator._retry_backoff = make_retry_backoff()
+    coordinator.client = AsyncMock()
+    coordinator.client.get_devices.return_value = {
+        "device-1": {"mode": "manual", "last_response_time": 100}
+    }
+    coordinator.client.refresh_devices.return_value = {}
+    coordinator.data = None
+    coordinator._pending_expiry = []
+    coordinator.pending_write_stats = PendingWriteStats()
+    coordinator._pending_writes = {}
+    coordinator._request_limiter = make_request_limiter()
+    coordinator._request_slots = asyncio.Semaphore(8)
+    coordinator._devices_discovered = False
+    coordinator._device_polled_at = {}
+    coordinator._device_failures = {}
+    coordinator._last_good_poll_at = None
+    coordinator._failed_polls = 0
+    coordinator._failure_retry_after = None
+    coordinator._degraded_since = None
+    coordinator._device_response_marks = {}
+    coordinator._response_high_water = None
+    coordinator.stale_device_merge = True
+
+    devices = await coordinator._async_update_data()
+
+    assert devices["device-1"]["mode"] == "manual"
+    coordinator.client.get_devices.assert_awaited_once()
+    coordinator.client.refresh_devices.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_update_data_polls_bulk_listing_after_initial_load() -> None:
+    """Subsequent refreshes without writes should need no per-device reads."""
+    coordinator = object.__new__(DanfossAllyDataUpdateCoordinator)
+    coordinator.telemetry = CoordinatorTelemetry()
+    coordinator._circuit_breaker = make_circuit_breaker()
+    coordinator._retry_backoff = make_retry_backoff()
+    coordinator.client = AsyncMock()
+    coordinator.client.get_devices.return_value = {
+        "device-1": {"mode": "manual", "last_response_time": 101}
+    }
+    coordinator.data = {"device-1": {"mode": "manual", "last_response_time": 100}}
+    coordinator._pending_expiry = []
+    coordinator.pending_write_stats = PendingWriteStats()
+    coordinator._pending_writes = {}
+    coordinator._request_limiter = make_request_limiter()
+    coordinator._request_slots = asyncio.Semaphore(8)
+    coordinator._devices_discovered = False
+    coordinator._device_polled_at = {}
+    coordinator._device_failures = {}
+    coordinator._last_good_poll_at = None
+    coordinator._failed_polls = 0
+    coordinator._failure_retry_after = None
+    coordinator._degraded_since = None
+    coordinator._device_response_marks = {}
+    coordinator._response_high_water = None
+    coordinator._window_restore_states = {}
+    coordinator.stale_device_merge = True
+
+    devices = await coordinator._async_update_data()
+
+    assert devices["device-1"]["last_response_time"] == 101
+    coordinator.client.get_devices.assert_awaited_once()
+    coordinator.client.refresh_device.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_update_data_keeps_lagging_devices_and_accepts_fresh_ones() -> None:
+    """A lagging device should keep its record without discarding the others."""
+    coordinator = object.__new__(DanfossAllyDataUpdateCoordinator)
+    coordinator.telemetry = CoordinatorTelemetry()
+    coordinator._circuit_breaker = make_circuit_breaker()
+    coordinator._retry_backoff = make_retry_backoff()
+    coordinator.client = AsyncMock()
+    coordinator.client.get_devices.return_value = {
+        "device-1": {"mode": "pause", "last_response_time": 103},
+        "device-2": {"mode": "at_home", "last_response_time": 104},
+    }
+    coordinator.data = {
+        "device-1": {"mode": "manual", "last_response_time": 100},
+        "device-2": {"mode": "manual", "last_response_time": 105},
+    }
+    coordinator._pending_expiry = []
+    coordinator.pending_write_stats = PendingWriteStats()
+    coordinator._pending_writes = {}
+    coordinator._request_limiter = make_request_limiter()
+    coordinator._request_slots = asyncio.Semaphore(8)
+    coordinator._devices_discovered = False
+    coordinator._device_polled_at = {}
+    coordinator._device_failures = {}
+    coordinator._last_good_poll_at = None
+    coordinator._failed_polls = 0
+    coordinator._failure_retry_after = None
+    coordinator._degraded_since = None
+    coordinator._device_response_marks = {}
+    coordinator._response_high_water = None
+    coordinator._window_restore_states = {}
+    coordinator.stale_device_merge = True
+
+    devices = await coordinator._async_update_data()
+
+    assert devices["device-1"]["mode"] == "pause"
+    assert devices["device-2"] is coordinator.data["device-2"]
+    assert coordinator._device_response_marks == {"device-1": 103, "device-2": 105}
+
+
+@pytest.mark.asyncio
+async def test_update_data_leaves_device_list_changes_to_discovery() -> None:
+    """Status polls should neither add nor drop devices once discovery ran."""
+    coordinator = object.__new__(DanfossAllyDataUpdateCoordinator)
+    coordinator.telemetry = CoordinatorTelemetry()
+    coordinator._circuit_breaker = make_circuit_breaker()
+    coordinator._retry_backoff = make_retry_backoff()
+    coordinator.client = AsyncMock()
+    coordinator.client.get_devices.return_value = {
+        "device-1": {"mode": "pause", "last_response_time": 101},
+        "device-3": {"mode": "manual", "last_response_time": 101},
+    }
+    coordinator.data = {
+        "device-1": {"mode": "manual", "last_response_time": 100},
+        "device-2": {"mode": "manual", "last_response_time": 100},
+    }
+    coordinator._pending_expiry = []
+    coordinator.pending_write_stats = PendingWriteStats()
+    coordinator._pending_writes = {}
+    coordinator._request_limiter = make_request_limiter()
+    coordinator._request_slots = asyncio.Semaphore(8)
+    coordinator._devices_discovered = True
+    coordinator._device_polled_at = {}
+    coordinator._device_failures = {}
+    coordinator._last_good_poll_at = None
+    coordinator._failed_polls = 0
+    coordinator._failure_retry_after = None
+    coordinator._degraded_since = None
+    coordinator._device_response_marks = {}
+    coordinator._response_high_water = None
+    coordinator._window_restore_states = {}
+    coordinator.stale_device_merge = True
+
+    devices = await coordinator._async_update_data()
+
+    assert devices.keys() == {"device-1", "device-2"}
+    assert devices["device-1"]["mode"] == "pause"
+    assert devices["device-2"] is coordinator.data["device-2"]
+
+
+@pytest.mark.asyncio
+async def test_device_discovery_applies_only_the_device_list_delta() -> None:
+    """Discovery should add new devices and detach the removed ones."""
+    coordinator = object.__new__(DanfossAllyDataUpdateCoordinator)
+    coordinator.hass = Mock()
+    coordinator.config_entry = SimpleNamespace(entry_id="entry-1")
+    coordinator.telemetry = CoordinatorTelemetry()
+    coordinator._circuit_breaker = make_circuit_breaker()
+    coordinator._retry_backoff = make_retry_backoff()
+    coordinator._request_limiter = make_request_limiter()
+    coordinator._request_slots = asyncio.Semaphore(8)
+    coordinator._poll_scheduler = make_poll_scheduler()
+    coordinator._refresh_in_progress = False
+    coordinator.last_update_success = True
+    coordinator.discovery_revision = 0
+    coordinator._device_polled_at = {}
+    coordinator._device_failures = {"device-2": DeviceRefreshStats(failures=2)}
+    coordinator._device_missing_rounds = {"device-2": 2}
+    coordinator.client = AsyncMock()
+    coordinator.client.get_devices.return_value = {
+        "device-1": {"mode": "pause"},
+        "device-3": {"mode": "manual"},
+    }
+    kept = {"mode": "manual"}
+    coordinator.data = {"device-1": kept, "device-2": {"mode": "manual"}}
+    coordinator.async_set_updated_data = Mock()
+    coordinator._async_schedule_snapshot_save = Mock()
+    device_registry = Mock()
+    device_registry.async_get_device.return_value = SimpleNamespace(id="registry-2")
+
+    with patch(
+        "custom_components.danfoss_ally.coordinator.dr.async_get",
+        return_value=device_registry,
+    ):
+        await coordinator._async_discover_devices()
+
+    snapshot = coordinator.async_set_updated_data.call_args.args[0]
+    assert snapshot.keys() == {"device-1", "device-3"}
+    assert snapshot["device-1"] is kept
+    assert coordinator._device_changes == {
+        "device-2": frozenset(),
+        "device-3": frozenset(),
+    }
+    assert coordinator.discovery_revision == 1
+    device_registry.async_update_device.assert_called_once_with(
+        "registry-2", remove_config_entry_id="entry-1"
+    )
+    assert coordinator._device_missing_rounds == {}
+    assert coordinator.get_device_refresh_diagnostics() == {}
+
+
+@pytest.mark.asyncio
+async def test_device_discovery_keeps_briefly_missing_devices() -> None:
+    """A device missing from one listing should not be removed yet."""
+    coordinator = object.__new__(DanfossAllyDataUpdateCoordinator)
+    coordinator._circuit_breaker = make_circuit_breaker()
+    coordinator._retry_backoff = make_retry_backoff()
+    coordinator._request_limiter = make_request_limiter()
+    coordinator._request_slots = asyncio.Semaphore(8)
+    coordinator._poll_scheduler = make_poll_scheduler()
+    coordinator._refresh_in_progress = False
+    coordinator._device_missing_rounds = {"device-3": 1}
+    coordinator.client = AsyncMock()
+    coordinator.client.get_devices.return_value = {"device-1": {"mode": "manual"}}
+    coordinator.data = {
+        "device-1": {"mode": "manual"},
+        "device-2": {"mode": "manual"},
+        "device-3": {"mode": "manual"},
+    }
+    coordinator.async_set_updated_data = Mock()
+
+    await coordinator._async_discover_devices()
+    coordinator.client.get_devices.return_value = {
+        "device-1": {"mode": "manual"},
+        "device-3": {"mode": "manual"},
+    }
+    await coordinator._async_discover_devices()
+
+    coordinator.async_set_updated_data.assert_not_called()
+    assert coordinator._device_missing_rounds == {"device-2": 2}
+
+
+@pytest.mark.asyncio
+async def test_single_device_refresh_isolates_and_backs_off_failed_devices() -> None:
+    """One failing device should keep its record without failing the others."""
+    coordinator = object.__new__(DanfossAllyDataUpdateCoordinator)
+    coordinator._request_limiter = make_request_limiter()
+    coordinator._request_slots = asyncio.Semaphore(8)
+    coordinator._device_failures = {}
+    coordinator._poll_requests = 1
+    coordinator.client = AsyncMock()
+
+    async def refresh_device(device_id: str) -> dict[str, object]:
+        if device_id == "device-2":
+            raise TimeoutError
+        return {"mode": "pause"}
+
+    coordinator.client.refresh_device.side_effect = refresh_device
+    listed = {"mode": "manual"}
+    devices = {"device-1": {"mode": "manual"}, "device-2": listed}
+
+    await coordinator._async_refresh_single_devices(["device-1", "device-2"], devices)
+
+    assert devices["device-1"] == {"mode": "pause"}
+    assert devices["device-2"] is listed
+    diagnostics = coordinator.get_device_refresh_diagnostics()
+    assert diagnostics["device-2"]["failures"] == 1
+    assert diagnostics["device-2"]["last_error"] == "timeout"
+    assert 0 < diagnostics["device-2"]["retry_in"] <= 30.0
+
+    coordinator.client.refresh_device.reset_mock()
+    await coordinator._async_refresh_single_devices(["device-1", "device-2"], devices)
+
+    coordinator.client.refresh_device.assert_awaited_once_with("device-1")
+    assert coordinator._poll_requests == 4
+
+
+@pytest.mark.asyncio
+async def test_poll_reads_only_written_devices_individually() -> None:
+    """Window-paused devices are covered by the listing and cost no extra read."""
+    coordinator = make_write_queue_coordinator()
+    coordinator.data = {
+        "device-1": {"mode": "pause", "last_response_time": 100},
+        "device-2": {"mode": "at_home", "last_response_time": 100},
+    }
+    coordinator.client.get_devices.return_value = {
+        "device-1": {"mode": "pause", "last_response_time": 101},
+        "device-2": {"mode": "at_home", "last_response_time": 100},
+    }
+    coordinator.client.refresh_device.return_value = {
+        "mode": "manual",
+        "last_response_time": 102,
+    }
+    coordinator._pending_expiry = []
+    coordinator._pending_writes = {
+        "device-2": PendingWrite(
+            updates={"mode": "manual"},
+            expires_at=time.monotonic() + PENDING_WRITE_TIMEOUT,
+            baseline_response_time=100,
+        )
+    }
+    coordinator._window_restore_states = {
+        "device-1": WindowRestoreState(mode="at_home", target_temperature=21.0)
+    }
+    coordinator._device_response_marks = {}
+    coordinator._response_high_water = None
+    coordinator.stale_device_merge = True
+    coordinator._devices_discovered = True
+
+    await coordinator._async_update_data()
+
+    coordinator.client.refresh_device.assert_awaited_once_with("device-2")
+
+
+def test_written_devices_with_a_newer_listed_report_are_not_read_again() -> None:
+    """Only written devices whose listed timestamp did not advance need a read."""
+    coordinator = object.__new__(DanfossAllyDataUpdateCoordinator)
+    coordinator._pending_writes = {
+        device_id: PendingWrite(
+            updates={"mode": "manual"},
+            expires_at=time.monotonic() + PENDING_WRITE_TIMEOUT,
+            baseline_response_time=baseline,
+        )
+        for device_id, baseline in (
+            ("advanced", 100),
+            ("lagging", 100),
+            ("unknown", None),
+        )
+    }
+
+    assert coordinator._hot_device_ids(
+        {
+            "advanced": {"mode": "manual", "last_response_time": 101},
+            "lagging": {"mode": "at_home", "last_response_time": 100},
+            "unknown": {"mode": "at_home", "last_response_time": 101},
+            "idle": {"mode": "at_home", "last_response_time": 90},
+        }
+    ) == ["lagging", "unknown"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("side_effect", "expected_retry_after"),
+    [
+        (TimeoutError(), TIMEOUT_RETRY_AFTER),
+        (ConnectionError(), CONNECTION_RETRY_AFTER),
+        (exceptions.ForbiddenError(), FORBIDDEN_RETRY_AFTER),
+        (exceptions.RateLimitError(), RATE_LIMIT_RETRY_AFTER),
+        (exceptions.InternalServerError(), SERVER_ERROR_RETRY_AFTER),
+        (exceptions.APIError("boom"), GENERIC_API_RETRY_AFTER),
+        (exceptions.UnexpectedError(), GENERIC_API_RETRY_AFTER),
+    ],
+)
+async def test_update_data_sets_retry_after_by_error_type(
+    side_effect: BaseException,
+    expected_retry_after: float,
+) -> None:
+    """Coordinator retries should back off differently by failure type."""
+    coordinator = object.__new__(DanfossAllyDataUpdateCoordinator)
+    coordinator.telemetry = CoordinatorTelemetry()
+    coordinator._circuit_breaker = make_circuit_breaker()
+    coordinator._retry_backoff = make_retry_backoff()
+    coordinator.client = AsyncMock()
+    coordinator.client.get_devices.side_effect = side_effect
+    coordinator.data = None
+    coordinator._pending_expiry = []
+    coordinator.pending_write_stats = PendingWriteStats()
+    coordinator._pending_writes = {}
+    coordinator._request_limiter = make_request_limiter()
+    coordinator._request_slots = asyncio.Semaphore(8)
+    coordinator._devices_discovered = False
+    coordinator._device_polled_at = {}
+    coordinator._device_failures = {}
+    coordinator._last_good_poll_at = None
+    coordinator._failed_polls = 0
+    coordinator._failure_retry_after = None
+    coordinator._degraded_since = None
+
+    with pytest.raises(UpdateFailed) as err_info:
+        await coordinator._async_update_data()
+
+    assert (
+        expected_retry_after <= err_info.value.retry_after <= expected_retry_after * 1.2
+    )
+    assert sum(coordinator.telemetry.retry_events.values()) == 1
+    assert coordinator.telemetry.polls == 1
+
+
+def make_read_back_coordinator() -> DanfossAllyDataUpdateCoordinator:
+    """Create a coordinator stub with one written device awaiting read-back."""
+    coordinator = object.__new__(DanfossAllyDataUpdateCoordinator)
+    coordinator.hass = Mock()
+    coordinator.telemetry = CoordinatorTelemetry()
+    coordinator._circuit_breaker = make_circuit_breaker()
+    coordinator._request_limiter = make_request_limiter()
+    coordinator._request_slots = asyncio.Semaphore(8)
+    coordinator._poll_scheduler = make_poll_scheduler()
+    coordinator._refresh_in_progress = False
+    coordinator._poll_requests = 1
+    coordinator._device_failures = {}
+    coordinator._device_polled_at = {}
+    coordinator._device_response_marks = {"device-1": 100}
+    coordinator._response_high_water = 100
+    coordinator._hot_refresh_unsubs = {}
+    coordinator._pending_expiry = []
+    coordinator.pending_write_stats = PendingWriteStats()
+    coordinator.last_update_success = True
+    coordinator.discovery_revision = 0
+    coordinator.async_update_listeners = Mock()
+    coordinator.data = {
+        "device-1": {"mode": "pause", "temperature": 20.0, "last_response_time": 100}
+    }
+    coordinator._pending_writes = {
+        "device-1": PendingWrite(
+            updates={"mode": "pause"},
+            expires_at=time.monotonic() + PENDING_WRITE_TIMEOUT,
+            baseline_response_time=100,
+            written_at=time.monotonic(),
+        )
+    }
+    coordinator.client = AsyncMock()
+    return coordinator
+
+
+@pytest.mark.asyncio
+async def test_read_back_confirms_write_or_schedules_the_next_attempt() -> None:
+    """Written devices should be read back on a growing delay until confirmed."""
+    coordinator = make_read_back_coordinator()
+    coordinator.client.refresh_device.return_value = {
+        "mode": "manual",
+        "temperature": 20.0,
+        "last_response_time": 100,
+    }
+
+    with patch(
+        "custom_components.danfoss_ally.coordinator.async_call_later"
+    ) as call_later:
+        await coordinator._async_read_back_device("device-1", 0)
+
+    assert call_later.call_args.args[1] == 3.0
+    assert "device-1" in coordinator._pending_writes
+
+    coordinator._hot_refresh_unsubs.clear()
+    coordinator.client.refresh_device.return_value = {
+        "mode": "pause",
+        "temperature": 21.0,
+        "last_response_time": 101,
+    }
+    await coordinator._async_read_back_device("device-1", 1)
+
+    assert coordinator._pending_writes == {}
+    assert coordinator.pending_write_stats.confirmed_writes == 1
+    assert coordinator.data["device-1"]["temperature"] == 21.0
+    assert coordinator._device_changes == {"device-1": frozenset({"temperature"})}
+    coordinator.async_update_listeners.assert_called_once()
+    assert coordinator._hot_refresh_unsubs == {}
+    assert coordinator.get_api_budget_diagnostics()["used_by_kind"] == {"poll": 2}
+
+
+@pytest.mark.asyncio
+async def test_read_back_leaves_the_half_open_probe_to_the_poll() -> None:
+    """A read-back must not take the probe slot it never reports back on."""
+    coordinator = make_read_back_coordinator()
+    coordinator.client.refresh_device.return_value = {
+        "mode": "pause",
+        "temperature": 20.0,
+        "last_response_time": 101,
+    }
+    breaker = coordinator._circuit_breaker
+    opened_at = time.monotonic() - 120.0
+    for _ in range(3):
+        breaker.record_failure(opened_at, 60.0)
+
+    with patch("custom_components.danfoss_ally.coordinator.async_call_later"):
+        await coordinator._async_read_back_device("device-1", 0)
+
+    coordinator.client.refresh_device.assert_awaited_once_with("device-1")
+    assert breaker.allow_request(time.monotonic())
+
+
+@pytest.mark.asyncio
+async def test_read_back_starts_reauth_when_the_token_is_rejected() -> None:
+    """An expired token during a read-back should start reauth, not escape."""
+    coordinator = make_read_back_coordinator()
+    coordinator.config_entry = Mock()
+    coordinator.client.refresh_device.side_effect = exceptions.UnauthorizedError()
+
+    with patch(
+        "custom_components.danfoss_ally.coordinator.async_call_later"
+    ) as call_later:
+        await coordinator._async_read_back_device("device-1", 0)
+
+    coordinator.config_entry.async_start_reauth.assert_called_once_with(
+        coordinator.hass
+    )
+    call_later.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_read_back_yields_to_a_poll_started_meanwhile() -> None:
+    """A read-back must not overwrite the snapshot a running poll will publish."""
+    coordinator = make_read_back_coordinator()
+    cached = coordinator.data
+
+    async def refresh_device(_device_id: str) -> dict[str, object]:
+        coordinator._refresh_in_progress = True
+        return {"mode": "pause", "temperature": 21.0, "last_response_time": 101}
+
+    coordinator.client.refresh_device.side_effect = refresh_device
+
+    with patch("custom_components.danfoss_ally.coordinator.async_call_later"):
+        await coordinator._async_read_back_device("device-1", 0)
+
+    assert coordinator.data is cached
+    assert "device-1" in coordinator._pending_writes
+    coordinator.async_update_listeners.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_run_write_does_not_request_refresh_after_success() -> None:
+    """Writes should rely on optimistic state instead of forcing a full refresh."""
+    coordinator = object.__new__(DanfossAllyDataUpdateCoordinator)
+    coordinator.telemetry = CoordinatorTelemetry()
+    coordinator._circuit_breaker = make_circuit_breaker()
+    coordinator._retry_backoff = make_retry_backoff()
+    coordinator._telemetry_listeners = []
+    coordinator._async_apply_optimistic_updates = lambda *_args, **_kwargs: None
+    coordinator.async_request_refresh = AsyncMock()
+    coordinator._poll_scheduler = make_poll_scheduler()
+    coordinator._unsub_refresh = None
+    coordinator._polling = False
+    coordinator._request_limiter = make_request_limiter()
+    coordinator._request_slots = asyncio.Semaphore(8)
+    coordinator._devices_discovered = False
+    coordinator._device_polled_at = {}
+    coordinator._device_failures = {}
+    coordinator._last_good_poll_at = None
+    coordinator._failed_polls = 0
+    coordinator._failure_retry_after = None
+    coordinator._degraded_since = None
+    coordinator._write_queue = {}
+    coordinator._pending_writes = {}
+
+    await coordinator._async_run_write(
+        "device-1",
+        AsyncMock(return_value=True)(),
+        optimistic_updates=None,
+        error_message="boom",
+    )
+
+    coordinator.async_request_refresh.assert_not_awaited()
+    assert coordinator._poll_scheduler.fast_until > time.monotonic()
+
+
+def test_telemetry_histograms_bucket_durations() -> None:
+    """Telemetry should bucket durations and count retries per error class."""
+    telemetry = CoordinatorTelemetry()
+
+    telemetry.record_poll(0.3, api_calls=1, values_parsed=40)
+    telemetry.record_poll(4.0, api_calls=3, values_parsed=40)
+    telemetry.record_devices_changed(2)
+    telemetry.record_write("set_mode", 0.2)
+    telemetry.record_retry("timeout")
+    telemetry.record_retry("timeout")
+
+    diagnostics = telemetry.as_dict()
+
+    assert diagnostics["poll_duration"]["count"] == 2
+    assert diagnostics["poll_duration"]["max"] == 4.0
+    assert diagnostics["poll_duration"]["buckets"]["le_0.5"] == 1
+    assert diagnostics["poll_duration"]["buckets"]["le_5"] == 1
+    assert diagnostics["api_calls"] == 4
+    assert diagnostics["last_poll_api_calls"] == 3
+    assert diagnostics["values_parsed"] == 80
+    assert diagnostics["last_poll_devices_changed"] == 2
+    assert diagnostics["write_latency"]["set_mode"]["count"] == 1
+    assert diagnostics["retry_events"] == {"timeout": 2}
+
+
+def make_write_queue_coordinator() -> DanfossAllyDataUpdateCoordinator:
+    """Create a coordinator stub that can queue and send writes."""
+    coordinator = object.__new__(DanfossAllyDataUpdateCoordinator)
+    coordinator.telemetry = CoordinatorTelemetry()
+    coordinator._circuit_breaker = make_circuit_breaker()
+    coordinator._retry_backoff = make_retry_backoff()
+    coordinator._telemetry_listeners = []
+    coordinator.hass = SimpleNamespace(loop=asyncio.get_running_loop())
+    coordinator.client = AsyncMock()
+    coordinator.client.send_command.return_value = True
+    coordinator.client.set_mode.return_value = True
+    coordinator._write_queue = {}
+    coordinator.write_queue_stats = WriteQueueStats()
+    coordinator._pending_writes = {}
+    coordinator._pending_expiry = []
+    coordinator.pending_write_stats = PendingWriteStats()
+    coordinator._poll_scheduler = make_poll_scheduler()
+    coordinator._unsub_refresh = None
+    coordinator._polling = False
+    coordinator._request_limiter = make_request_limiter()
+    coordinator._request_slots = asyncio.Semaphore(8)
+    coordinator._devices_discovered = False
+    coordinator._device_polled_at = {}
+    coordinator._device_failures = {}
+    coordinator._last_good_poll_at = None
+    coordinator._failed_polls = 0
+    coordinator._failure_retry_after = None
+    coordinator._degraded_since = None
+    return coordinator
+
+
+@pytest.mark.asyncio
+async def test_queued_commands_are_coalesced_per_device() -> None:
+    """Commands for one device should be merged into one request."""
+    coordinator = make_write_queue_coordinator()
+
+    with patch(
+        "custom_components.danfoss_ally.coordinator.async_call_later",
+        return_value=Mock(),
+    ) as call_later:
+        writes = [
+            asyncio.create_task(
+                coordinator.async_send_commands("device-1", [("child_lock", True)])
+            ),
+            asyncio.create_task(
+                coordinator.async_set_temperature(
+                    "device-1", 21.0, optimistic_updates=None
+                )
+            ),
+            asyncio.create_task(
+                coordinator.async_send_commands("device-1", [("child_lock", False)])
+            ),
+        ]
+        await asyncio.sleep(0)
+
+    assert coordinator.get_write_queue_diagnostics()["queue_depth"] == 2
+    flush = call_later.call_args.args[2]
+    await flush(None)
+    await asyncio.gather(*writes)
+
+    coordinator.client.send_command.assert_awaited_once_with(
+        "device-1",
+        [("child_lock", False), ("manual_mode_fast", 210)],
+    )
+    diagnostics = coordinator.get_write_queue_diagnostics()
+    assert diagnostics["queue_depth"] == 0
+    assert diagnostics["queued_commands"] == 3
+    assert diagnostics["superseded_commands"] == 1
+    assert diagnostics["flushes"] == 1
+    assert diagnostics["max_batch_size"] == 2
+
+
+@pytest.mark.asyncio
+async def test_queued_command_failures_reach_every_caller() -> None:
+    """A failed batch should fail every write that was merged into it."""
+    coordinator = make_write_queue_coordinator()
+    coordinator.client.send_command.return_value = False
+
+    with patch(
+        "custom_components.danfoss_ally.coordinator.async_call_later",
+        return_value=Mock(),
+    ) as call_later:
+        writes = [
+            asyncio.create_task(
+                coordinator.async_send_commands("device-1", [("child_lock", True)])
+            ),
+            asyncio.create_task(
+                coordinator.async_send_commands("device-1", [("switch", True)])
+            ),
+        ]
+        await asyncio.sleep(0)
+
+    await call_later.call_args.args[2](None)
+    results = await asyncio.gather(*writes, return_exceptions=True)
+
+    assert all(isinstance(result, HomeAssistantError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_unexpected_batch_errors_still_release_callers() -> None:
+    """Errors outside the API error family should not leave callers waiting."""
+    coordinator = make_write_queue_coordinator()
+    coordinator.client.send_command.side_effect = ValueError("bad payload")
+
+    with patch(
+        "custom_components.danfoss_ally.coordinator.async_call_later",
+        return_value=Mock(),
+    ) as call_later:
+        write = asyncio.create_task(
+            coordinator.async_send_commands("device-1", [("child_lock", True)])
+        )
+        await asyncio.sleep(0)
+
+    with pytest.raises(ValueError):
+        await call_later.call_args.args[2](None)
+    with pytest.raises(ValueError):
+        await write
+
+
+@pytest.mark.asyncio
+async def test_cancel_queued_writes_fails_waiting_callers() -> None:
+    """Unloading should drop queued batches and release their callers."""
+    coordinator = make_write_queue_coordinator()
+    unsub_flush = Mock()
+
+    with patch(
+        "custom_components.danfoss_ally.coordinator.async_call_later",
+        return_value=unsub_flush,
+    ):
+        write = asyncio.create_task(
+            coordinator.async_send_commands("device-1", [("child_lock", True)])
+        )
+        await asyncio.sleep(0)
+
+    coordinator.async_cancel_queued_writes()
+
+    unsub_flush.assert_called_once_with()
+    assert coordinator._write_queue == {}
+    with pytest.raises(HomeAssistantError, match="cancelled"):
+        await write
+    coordinator.client.send_command.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_direct_write_flushes_queued_commands_first() -> None:
+    """Queued commands should be sent before a direct write to the same device."""
+    coordinator = make_write_queue_coordinator()
+    calls: list[str] = []
+    coordinator.client.send_command.side_effect = lambda *_args: (
+        calls.append("send_command") or True
+    )
+    coordinator.client.set_mode.side_effect = lambda *_args: (
+        calls.append("set_mode") or True
+    )
+
+    with patch(
+        "custom_components.danfoss_ally.coordinator.async_call_later",
+        return_value=Mock(),
+    ):
+        queued = asyncio.create_task(
+            coordinator.async_send_commands("device-1", [("child_lock", True)])
+        )
+        await asyncio.sleep(0)
+        await coordinator.async_set_mode("device-1", "manual")
+        await queued
+
+    assert calls == ["send_command", "set_mode"]
+    assert coordinator._write_queue == {}
+
+
+@pytest.mark.asyncio
+async def test_writes_matching_current_or_pending_state_are_skipped() -> None:
+    """No-op writes should not reach the cloud."""
+    coordinator = make_write_queue_coordinator()
+    coordinator.data = {"device-1": {"mode": "manual", "child_lock": False}}
+    coordinator._pending_writes = {
+        "device-1": PendingWrite(
+            updates={"child_lock": True},
+            expires_at=time.monotonic() + PENDING_WRITE_TIMEOUT,
+            baseline_response_time=None,
+        )
+    }
+
+    await coordinator.async_set_mode(
+        "device-1", "manual", optimistic_updates={"mode": "manual"}
+    )
+    await coordinator.async_send_commands(
+        "device-1", [("child_lock", True)], optimistic_updates={"child_lock": True}
+    )
+
+    coordinator.client.set_mode.assert_not_awaited()
+    assert coordinator._write_queue == {}
+    assert coordinator.write_queue_stats.skipped_writes == 2
+    assert not coordinator._is_unchanged_write("device-1", {"mode": "pause"})
+    assert not coordinator._is_unchanged_write("device-1", {"window_open": False})
+
+
+def make_optimistic_write_coordinator() -> DanfossAllyDataUpdateCoordinator:
+    """Create a write queue stub that publishes optimistic updates."""
+    coordinator = make_write_queue_coordinator()
+    coordinator.data = {"device-1": {"mode": "manual", "child_lock": False}}
+    coordinator.last_update_success = True
+    coordinator.discovery_revision = 0
+    coordinator._pending_expiry = []
+    coordinator._hot_refresh_unsubs = {}
+    coordinator._device_response_marks = {}
+    coordinator._response_high_water = None
+
+    def set_updated_data(data: object) -> None:
+        coordinator.data = data
+
+    coordinator.async_set_updated_data = set_updated_data
+    return coordinator
+
+
+@pytest.mark.asyncio
+async def test_expired_pending_write_does_not_suppress_a_resend() -> None:
+    """A write the cloud never confirmed in time should be sent again."""
+    coordinator = make_optimistic_write_coordinator()
+    expires_at = time.monotonic() - 1.0
+    coordinator.data = {"device-1": {"mode": "manual", "child_lock": False}}
+    coordinator._pending_writes = {
+        "device-1": PendingWrite(
+            updates={"mode": "pause"},
+            expires_at=expires_at,
+            baseline_response_time=None,
+        )
+    }
+    coordinator._pending_expiry = [(expires_at, "device-1")]
+
+    with patch("custom_components.danfoss_ally.coordinator.async_call_later"):
+        await coordinator.async_set_mode(
+            "device-1", "pause", optimistic_updates={"mode": "pause"}
+        )
+
+    coordinator.client.set_mode.assert_awaited_once()
+    assert coordinator.write_queue_stats.skipped_writes == 0
+    assert coordinator.pending_write_stats.expired_writes == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_direct_write_can_be_retried_with_the_same_value() -> None:
+    """A failed write should roll back so retrying it is not skipped."""
+    coordinator = make_optimistic_write_coordinator()
+    coordinator.client.set_mode.side_effect = [TimeoutError, True]
+
+    with pytest.raises(HomeAssistantError):
+        await coordinator.async_set_mode(
+            "device-1", "pause", optimistic_updates={"mode": "pause"}
+        )
+
+    assert coordinator._pending_writes == {}
+    assert coordinator.data["device-1"]["mode"] == "manual"
+
+    with patch("custom_components.danfoss_ally.coordinator.async_call_later"):
+        await coordinator.async_set_mode(
+            "device-1", "pause", optimistic_updates={"mode": "pause"}
+        )
+
+    assert coordinator.client.set_mode.await_count == 2
+    assert coordinator.write_queue_stats.skipped_writes == 0
+    assert coordinator._pending_writes["device-1"].updates == {"mode": "pause"}
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_rolls_back_to_the_last_accepted_pending_value() -> None:
+    """A failed batch should restore earlier pending values and allow a retry."""
+    coordinator = make_optimistic_write_coordinator()
+    coordinator._pending_writes = {
+        "device-1": PendingWrite(
+            updates={"child_lock": True},
+            expires_at=time.monotonic() + PENDING_WRITE_TIMEOUT,
+            baseline_response_time=None,
+        )
+    }
+    coordinator.data = {"device-1": {"mode": "manual", "child_lock": True}}
+    coordinator.client.send_command.return_value = False
+
+    with patch(
+        "custom_components.danfoss_ally.coordinator.async_call_later",
+        return_value=Mock(),
+    ) as call_later:
+        write = asyncio.create_task(
+            coordinator.async_send_commands(
+                "device-1",
+                [("child_lock", False)],
+                optimistic_updates={"child_lock": False},
+            )
+        )
+        await asyncio.sleep(0)
+    assert coordinator.data["device-1"]["child_lock"] is False
+
+    await call_later.call_args.args[2](None)
+    with pytest.raises(HomeAssistantError):
+        await write
+
+    assert coordinator._pending_writes["device-1"].updates == {"child_lock": True}
+    assert coordinator.data["device-1"]["child_lock"] is True
+    assert not coordinator._is_unchanged_write("device-1", {"child_lock": False})
+
+
+@pytest.mark.asyncio
+async def test_request_limiter_serves_waiters_by_priority() -> None:
+    """Queued requests should be released highest priority first."""
+    limiter = RequestLimiter(rate=100.0, burst=1, min_rate=1.0)
+    await limiter.acquire(REQUEST_PRIORITY_POLL)
+    order: list[int] = []
+
+    async def acquire(priority: int) -> None:
+        await limiter.acquire(priority)
+        order.append(priority)
+
+    waiters = [
+        asyncio.create_task(acquire(REQUEST_PRIORITY_POLL)),
+        asyncio.create_task(acquire(REQUEST_PRIORITY_WINDOW)),
+        asyncio.create_task(acquire(REQUEST_PRIORITY_USER_WRITE)),
+    ]
+    await asyncio.sleep(0)
+    assert limiter.queued == 3
+
+    await asyncio.wait_for(asyncio.gather(*waiters), timeout=1)
+
+    assert order == [
+        REQUEST_PRIORITY_USER_WRITE,
+        REQUEST_PRIORITY_WINDOW,
+        REQUEST_PRIORITY_POLL,
+    ]
+
+
+def test_request_limiter_halves_rate_on_rate_limit_and_recovers() -> None:
+    """HTTP 429 responses should lower the rate until requests succeed again."""
+    limiter = RequestLimiter(rate=2.0, burst=5, min_rate=0.5)
+
+    limiter.note_rate_limited()
+    limiter.note_rate_limited()
+    limiter.note_rate_limited()
+
+    assert limiter.rate == 0.5
+    assert limiter.rate_limited == 3
 
-    assert not coordinator._is_stale_snapshot(
-        {
-            "device-1": {
-                "mode": "at_home",
-                "last_response_time": 102,
-            }
-        }
-    )
+    limiter.note_success()
+
+    assert limiter.rate == pytest.approx(0.55)
 
 
 @pytest.mark.asyncio
-async def test_update_data_uses_bulk_fetch_for_first_refresh() -> None:
-    """First refresh should discover devices via the bulk endpoint."""
+async def test_update_data_keeps_snapshot_and_slows_down_on_rate_limit() -> None:
+    """A rate-limited poll should not fail the refresh once data is loaded."""
     coordinator = object.__new__(DanfossAllyDataUpdateCoordinator)
+    coordinator.telemetry = CoordinatorTelemetry()
+    coordinator._circuit_breaker = make_circuit_breaker()
+    coordinator._retry_backoff = make_retry_backoff()
     coordinator.client = AsyncMock()
-    coordinator.client.get_devices.return_value = {
-        "device-1": {"mode": "manual", "last_response_time": 100}
-    }
-    coordinator.client.refresh_devices.return_value = {}
-    coordinator.data = None
+    coordinator.client.get_devices.side_effect = exceptions.RateLimitError()
+    coordinator.data = {"device-1": {"mode": "manual", "last_response_time": 100}}
+    coordinator._pending_expiry = []
+    coordinator.pending_write_stats = PendingWriteStats()
     coordinator._pending_writes = {}
+    coordinator._request_limiter = RequestLimiter(rate=2.0, burst=5, min_rate=0.5)
+    coordinator._request_slots = asyncio.Semaphore(8)
+    coordinator._devices_discovered = False
+    coordinator._device_polled_at = {}
+    coordinator._device_failures = {}
+    coordinator._last_good_poll_at = time.time()
+    coordinator._failed_polls = 0
+    coordinator._failure_retry_after = None
+    coordinator._degraded_since = None
 
     devices = await coordinator._async_update_data()
 
-    assert devices["device-1"]["mode"] == "manual"
-    coordinator.client.get_devices.assert_awaited_once()
-    coordinator.client.refresh_devices.assert_not_called()
+    assert devices is coordinator.data
+    assert coordinator._request_limiter.rate == 1.0
+    # The next poll waits out the server's Retry-After instead of the interval.
+    assert coordinator._failed_polls == 1
+    assert coordinator._failure_retry_after >= RATE_LIMIT_RETRY_AFTER * 0.8
 
 
 @pytest.mark.asyncio
-async def test_update_data_uses_per_device_refresh_after_initial_load() -> None:
-    """Subsequent refreshes should use per-device reads."""
-    coordinator = object.__new__(DanfossAllyDataUpdateCoordinator)
-    coordinator.client = AsyncMock()
-    coordinator.client.get_devices.return_value = {}
-    coordinator.client.refresh_devices.return_value = {
-        "device-1": {"mode": "manual", "last_response_time": 101}
+async def test_transport_shares_one_session_across_entry_clients() -> None:
+    """Every entry gets its own client on one session kept until the last unload."""
+    transport = DanfossAllyTransport(Mock(), max_requests=8)
+    session = Mock()
+
+    with (
+        patch(
+            "custom_components.danfoss_ally.coordinator.async_create_clientsession",
+            return_value=session,
+        ) as create_session,
+        patch("custom_components.danfoss_ally.coordinator.DanfossAllyAPI") as api_class,
+        patch(
+            "custom_components.danfoss_ally.coordinator.DanfossAlly",
+            side_effect=lambda **_kwargs: Mock(aclose=AsyncMock()),
+        ),
+    ):
+        first = transport.async_create_client("entry-1")
+        second = transport.async_create_client("entry-2")
+
+    assert first is not second
+    create_session.assert_called_once()
+    assert [call.kwargs["client"] for call in api_class.call_args_list] == [
+        session,
+        session,
+    ]
+
+    await transport.async_release_client("entry-1", first)
+    first.aclose.assert_awaited_once()
+    session.detach.assert_not_called()
+
+    await transport.async_release_client("entry-2", second)
+    second.aclose.assert_awaited_once()
+    session.detach.assert_called_once()
+
+
+def test_retry_backoff_grows_per_class_until_capped_and_resets() -> None:
+    """Repeated failures double the jittered delay up to the cap."""
+    backoff = RetryBackoff({"timeout": 60.0, "server_error": 900.0}, 1000.0, 0.2)
+
+    first = backoff.next_delay("timeout")
+    second = backoff.next_delay("timeout")
+
+    assert 60.0 <= first <= 72.0
+    assert 120.0 <= second <= 144.0
+    assert 900.0 <= backoff.next_delay("server_error") <= 1000.0
+    assert backoff.next_delay("server_error") == 1000.0
+    assert backoff.diagnostics()["classes"]["timeout"] == {
+        "attempts": 2,
+        "last_delay": second,
     }
-    coordinator.data = {"device-1": {"mode": "manual", "last_response_time": 100}}
+
+    backoff.reset()
+
+    assert 60.0 <= backoff.next_delay("timeout") <= 72.0
+
+
+def test_circuit_breaker_opens_and_probes_once_half_open() -> None:
+    """Repeated outages should open the circuit and admit a single probe later."""
+    breaker = make_circuit_breaker()
+
+    for _ in range(3):
+        assert breaker.allow_request(1000.0)
+        breaker.record_failure(1000.0, 60.0)
+
+    assert breaker.state == "open"
+    assert breaker.is_open(1030.0)
+    assert not breaker.allow_request(1030.0)
+    assert breaker.retry_in(1030.0) == 30.0
+    # Checking the window must neither consume the probe nor count a rejection.
+    assert not breaker.is_open(1060.0)
+    assert breaker.state == "open"
+
+    assert breaker.allow_request(1060.0)
+    assert breaker.state == "half_open"
+    assert not breaker.allow_request(1061.0)
+
+    breaker.record_failure(1062.0, 60.0)
+    assert breaker.state == "open"
+    assert breaker.allow_request(1122.0)
+
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.diagnostics(1122.0)["opened"] == 2
+    assert breaker.rejected == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_polls_serve_cached_data_and_degrade_until_recovery() -> None:
+    """Repeated poll failures should keep the snapshot and slow down probing."""
+    coordinator = make_write_queue_coordinator()
+    coordinator._poll_scheduler = make_poll_scheduler()
+    cached = {"device-1": {"mode": "manual", "last_response_time": 100}}
+    coordinator.data = cached
     coordinator._pending_writes = {}
+    coordinator._device_response_marks = {}
+    coordinator._response_high_water = None
+    coordinator._window_restore_states = {}
+    coordinator.stale_device_merge = True
+    coordinator._last_good_poll_at = time.time()
+    coordinator.client.get_devices.side_effect = exceptions.APIError("boom")
 
+    for _ in range(3):
+        assert await coordinator._async_update_data() is cached
+
+    assert coordinator.degraded
+    assert coordinator.get_degraded_diagnostics()["failed_polls"] == 3
+
+    coordinator.client.get_devices.side_effect = None
+    coordinator.client.get_devices.return_value = {
+        "device-1": {"mode": "pause", "last_response_time": 101}
+    }
     devices = await coordinator._async_update_data()
 
-    assert devices["device-1"]["last_response_time"] == 101
-    coordinator.client.refresh_devices.assert_awaited_once()
-    coordinator.client.get_devices.assert_not_called()
+    # The degraded probe is a single bulk request.
+    assert coordinator.client.get_devices.await_count == 4
+    coordinator.client.refresh_device.assert_not_called()
+    assert devices["device-1"]["mode"] == "pause"
+    assert not coordinator.degraded
+    assert coordinator.device_data_age("device-1") < 1.0
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_fails_polls_and_writes_fast() -> None:
+    """While the circuit is open no request should reach the client."""
+    coordinator = make_write_queue_coordinator()
+    coordinator.data = {"device-1": {"mode": "manual"}}
+    coordinator._pending_writes = {}
+    for _ in range(3):
+        coordinator._circuit_breaker.record_failure(time.monotonic(), 600.0)
+
+    with pytest.raises(UpdateFailed) as err_info:
+        await coordinator._async_update_data()
+    assert 0 < err_info.value.retry_after <= 600.0
+
+    with pytest.raises(HomeAssistantError):
+        await coordinator.async_set_mode("device-1", "manual")
+    with pytest.raises(HomeAssistantError):
+        await coordinator.async_send_commands("device-1", [("child_lock", True)])
+
+    coordinator.client.refresh_devices.assert_not_called()
+    coordinator.client.send_command.assert_not_called()
+    assert coordinator._write_queue == {}
+
+
+@pytest.mark.asyncio
+async def test_elapsed_open_circuit_lets_queued_writes_through() -> None:
+    """Queued writes should not be refused once the open window has elapsed."""
+    coordinator = make_write_queue_coordinator()
+    for _ in range(3):
+        coordinator._circuit_breaker.record_failure(time.monotonic() - 120.0, 60.0)
+
+    with patch(
+        "custom_components.danfoss_ally.coordinator.async_call_later",
+        return_value=Mock(),
+    ) as call_later:
+        write = asyncio.create_task(
+            coordinator.async_send_commands("device-1", [("child_lock", True)])
+        )
+        await asyncio.sleep(0)
+
+    assert coordinator._write_queue.keys() == {"device-1"}
+    await call_later.call_args.args[2](None)
+    await write
+    coordinator.client.send_command.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_load_snapshot_cache_seeds_data_for_warm_startup() -> None:
+    """A recent cached snapshot should be served before the first poll."""
+    coordinator = object.__new__(DanfossAllyDataUpdateCoordinator)
+    coordinator.data = None
+    coordinator.discovery_revision = 0
+    devices = {"device-1": {"name": "Living room", "mode": "manual"}}
+    coordinator._snapshot_store = Mock(
+        async_load=AsyncMock(
+            return_value={"saved_at": time.time() - 60, "devices": devices}
+        )
+    )
+
+    assert await coordinator.async_load_snapshot_cache() is True
+    assert coordinator.data == devices
+    assert coordinator.discovery_revision == 1
 
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    ("side_effect", "expected_retry_after"),
+    "stored",
     [
-        (TimeoutError(), TIMEOUT_RETRY_AFTER),
-        (ConnectionError(), CONNECTION_RETRY_AFTER),
-        (exceptions.ForbiddenError(), FORBIDDEN_RETRY_AFTER),
-        (exceptions.RateLimitError(), RATE_LIMIT_RETRY_AFTER),
-        (exceptions.InternalServerError(), SERVER_ERROR_RETRY_AFTER),
-        (exceptions.APIError("boom"), GENERIC_API_RETRY_AFTER),
-        (exceptions.UnexpectedError(), GENERIC_API_RETRY_AFTER),
+        None,
+        {"saved_at": time.time(), "devices": {}},
+        {"saved_at": time.time() - 2 * 86400, "devices": {"device-1": {}}},
+        {"devices": {"device-1": {}}},
     ],
 )
-async def test_update_data_sets_retry_after_by_error_type(
-    side_effect: BaseException,
-    expected_retry_after: float,
+async def test_load_snapshot_cache_ignores_empty_or_outdated_snapshots(
+    stored: dict[str, object] | None,
 ) -> None:
-    """Coordinator retries should back off differently by failure type."""
+    """Missing, empty or outdated caches should fall back to a live refresh."""
     coordinator = object.__new__(DanfossAllyDataUpdateCoordinator)
-    coordinator.client = AsyncMock()
-    coordinator.client.get_devices.side_effect = side_effect
     coordinator.data = None
-    coordinator._pending_writes = {}
-
-    with pytest.raises(UpdateFailed) as err_info:
-        await coordinator._async_update_data()
+    coordinator.discovery_revision = 0
+    coordinator._snapshot_store = Mock(async_load=AsyncMock(return_value=stored))
 
-    assert err_info.value.retry_after == expected_retry_after
+    assert await coordinator.async_load_snapshot_cache() is False
+    assert coordinator.data is None
 
 
-@pytest.mark.asyncio
-async def test_run_write_does_not_request_refresh_after_success() -> None:
-    """Writes should rely on optimistic state instead of forcing a full refresh."""
+def test_schedule_snapshot_save_persists_current_snapshot() -> None:
+    """Successful refreshes should be saved through a delayed store write."""
     coordinator = object.__new__(DanfossAllyDataUpdateCoordinator)
-    coordinator._async_apply_optimistic_updates = lambda *_args, **_kwargs: None
-    coordinator.async_request_refresh = AsyncMock()
+    coordinator.data = {"device-1": {"mode": "manual"}}
+    coordinator._snapshot_store = Mock()
 
-    await coordinator._async_run_write(
-        "device-1",
-        AsyncMock(return_value=True)(),
-        optimistic_updates=None,
-        error_message="boom",
+    coordinator._async_schedule_snapshot_save()
+
+    data_func, delay = coordinator._snapshot_store.async_delay_save.call_args.args
+    assert delay == 300.0
+    assert data_func()["devices"] == {"device-1": {"mode": "manual"}}
+
+
+def make_poll_scheduler(requests_per_hour: int = 600) -> AdaptivePollScheduler:
+    """Create a poll scheduler with the default intervals."""
+    return AdaptivePollScheduler(
+        base_interval=60.0,
+        fast_interval=15.0,
+        max_interval=600.0,
+        requests_per_hour=requests_per_hour,
     )
 
-    coordinator.async_request_refresh.assert_not_awaited()
+
+def test_poll_scheduler_polls_fast_after_activity() -> None:
+    """Local activity should shorten the interval for a limited window."""
+    scheduler = make_poll_scheduler()
+    scheduler.idle_polls = 3
+
+    scheduler.note_activity(1000.0, 120.0)
+
+    assert scheduler.next_interval(1000.0) == 15.0
+    assert scheduler.next_interval(1121.0) == 60.0
+
+
+def test_poll_scheduler_backs_off_on_unchanged_polls() -> None:
+    """Unchanged snapshots should back off exponentially up to the cap."""
+    scheduler = make_poll_scheduler()
+
+    intervals = []
+    for step in range(6):
+        scheduler.record_poll(1000.0 + step, changed=False, requests=1)
+        intervals.append(scheduler.next_interval(1000.0 + step))
+    scheduler.record_poll(1010.0, changed=True, requests=1)
+
+    assert intervals == [120.0, 240.0, 480.0, 600.0, 600.0, 600.0]
+    assert scheduler.next_interval(1010.0) == 60.0
+
+
+def test_poll_scheduler_stays_inside_hourly_budget() -> None:
+    """The interval should stretch so requests stay within the hourly budget."""
+    scheduler = make_poll_scheduler(requests_per_hour=120)
+    scheduler.note_activity(1000.0, 120.0)
+
+    assert scheduler.next_interval(1000.0) == 30.0
+
+    scheduler.record_requests(1000.0, 119)
+    scheduler.record_poll(1100.0, changed=True, requests=2)
+
+    assert scheduler.next_interval(1100.0) == 3500.0
+
+
+def test_poll_scheduler_stretches_polls_before_forecast_rate_limit() -> None:
+    """A write burst heading for HTTP 429 should slow polling before the limit."""
+    scheduler = make_poll_scheduler(requests_per_hour=600)
+
+    assert scheduler.seconds_until_limit(1000.0) is None
+
+    scheduler.record_requests(1000.0, 300)
+    scheduler.record_poll(1000.0, changed=True, requests=2)
+
+    assert scheduler.seconds_until_limit(1000.0) == pytest.approx(298 * 600 / 302)
+    assert scheduler.next_interval(1000.0) == pytest.approx(120.0)
+    assert scheduler.budget_diagnostics(1000.0)["used_by_kind"] == {
+        "poll": 2,
+        "write": 300,
+    }
+    assert scheduler.seconds_until_limit(1000.0 + API_FORECAST_WINDOW) is None
 
 
 @pytest.mark.asyncio
@@ -381,11 +1671,16 @@ class FakeBus:
 
     def __init__(self) -> None:
         self.listen_once_calls: list[tuple[str, object]] = []
+        self.listen_calls: list[tuple[str, object]] = []
 
     def async_listen_once(self, event_type: str, callback) -> Mock:
         self.listen_once_calls.append((event_type, callback))
         return Mock()
 
+    def async_listen(self, event_type: str, callback, event_filter=None) -> Mock:
+        self.listen_calls.append((event_type, callback))
+        return Mock()
+
 
 def make_window_coordinator(
     *,
@@ -398,6 +1693,8 @@ def make_window_coordinator(
     coordinator.data = {
         "device-1": device or {"mode": "manual", "manual_mode_fast": 21.0}
     }
+    coordinator._pending_expiry = []
+    coordinator.pending_write_stats = PendingWriteStats()
     coordinator._pending_writes = {}
     coordinator._external_temp_states = {}
     coordinator._window_sensor_states = {}
@@ -433,6 +1730,7 @@ async def test_pause_device_for_open_window_stores_previous_state() -> None:
         "device-1",
         "pause",
         optimistic_updates={"mode": "pause"},
+        priority=REQUEST_PRIORITY_WINDOW,
     )
     assert coordinator._window_restore_states == {
         "device-1": WindowRestoreState(mode="manual", target_temperature=21.0)
@@ -462,6 +1760,7 @@ async def test_restore_window_paused_device_restores_previous_mode_and_temperatu
         21.0,
         "manual",
         optimistic_updates={"mode": "manual", "manual_mode_fast": 21.0},
+        priority=REQUEST_PRIORITY_WINDOW,
     )
     coordinator.async_set_mode.assert_not_called()
     assert coordinator._window_restore_states == {}
@@ -573,3 +1872,401 @@ async def test_set_window_sensor_entity_updates_runtime_listeners_immediately()
     )
 
     coordinator.async_update_listeners.assert_called_once()
+
+
+def test_diff_device_snapshots_reports_changed_keys_per_device() -> None:
+    """Only devices with changed values should appear in the snapshot diff."""
+    unchanged = {"mode": "manual", "battery": 90}
+    previous = {
+        "device-1": {"mode": "manual", "temperature": 20.5, "last_response_time": 1},
+        "device-2": unchanged,
+        "device-3": {"mode": "at_home"},
+    }
+    current = {
+        "device-1": {"mode": "manual", "temperature": 21.0, "last_response_time": 2},
+        "device-2": unchanged,
+        "device-4": {"mode": "pause"},
+    }
+
+    assert _diff_device_snapshots(previous, current) == {
+        "device-1": frozenset({"temperature"}),
+        "device-3": frozenset({"mode"}),
+        "device-4": frozenset({"mode"}),
+    }
+
+
+def test_diff_device_snapshots_ignores_response_time_only_changes() -> None:
+    """A new response timestamp alone should not count as a device change."""
+    previous = {"device-1": {"mode": "manual", "last_response_time": 1}}
+    current = {"device-1": {"mode": "manual", "last_response_time": 2}}
+
+    assert _diff_device_snapshots(previous, current) == {}
+
+
+def test_device_records_share_layouts_and_read_like_dicts() -> None:
+    """Compact records should behave like read-only device dicts."""
+    first = _device_record({"mode": "manual", "temperature": 20.5})
+    second = _device_record({"mode": "pause", "temperature": 18.0})
+
+    assert isinstance(first, DeviceRecord)
+    assert first._layout is second._layout
+    assert first == {"mode": "manual", "temperature": 20.5}
+    assert first.get("mode") == "manual"
+    assert first.get("missing", "default") == "default"
+    assert "temperature" in first
+    assert {**first, "mode": "at_home"} == {"mode": "at_home", "temperature": 20.5}
+    assert _device_record(first) is first
+
+
+def test_merge_device_record_reuses_layout_for_known_keys() -> None:
+    """Updating known keys should not allocate a new layout."""
+    record = _device_record({"mode": "manual", "temperature": 20.5})
+
+    updated = _merge_device_record(record, {"mode": "pause"})
+    extended = _merge_device_record(record, {"window_open": True})
+
+    assert updated._layout is record._layout
+    assert updated == {"mode": "pause", "temperature": 20.5}
+    assert record["mode"] == "manual"
+    assert extended == {"mode": "manual", "temperature": 20.5, "window_open": True}
+
+
+def test_diff_device_snapshots_compares_records_by_layout() -> None:
+    """Records with a shared layout should diff value by value."""
+    previous = {
+        "device-1": _device_record(
+            {"mode": "manual", "temperature": 20.5, "last_response_time": 1}
+        )
+    }
+    current = {
+        "device-1": _device_record(
+            {"mode": "manual", "temperature": 21.0, "last_response_time": 2}
+        )
+    }
+
+    assert _diff_device_snapshots(previous, current) == {
+        "device-1": frozenset({"temperature"})
+    }
+
+
+@pytest.mark.asyncio
+async def test_update_data_stores_compact_records() -> None:
+    """Polled devices should be stored as compact records."""
+    coordinator = object.__new__(DanfossAllyDataUpdateCoordinator)
+    coordinator.telemetry = CoordinatorTelemetry()
+    coordinator._circuit_breaker = make_circuit_breaker()
+    coordinator._retry_backoff = make_retry_backoff()
+    coordinator.client = AsyncMock()
+    coordinator.client.get_devices.return_value = {
+        "device-1": {"mode": "manual", "last_response_time": 100}
+    }
+    coordinator.data = None
+    coordinator._pending_expiry = []
+    coordinator.pending_write_stats = PendingWriteStats()
+    coordinator._pending_writes = {}
+    coordinator._request_limiter = make_request_limiter()
+    coordinator._request_slots = asyncio.Semaphore(8)
+    coordinator._devices_discovered = False
+    coordinator._device_polled_at = {}
+    coordinator._device_failures = {}
+    coordinator._last_good_poll_at = None
+    coordinator._failed_polls = 0
+    coordinator._failure_retry_after = None
+    coordinator._degraded_since = None
+    coordinator._device_response_marks = {}
+    coordinator._response_high_water = None
+    coordinator.stale_device_merge = True
+
+    devices = await coordinator._async_update_data()
+
+    assert isinstance(devices["device-1"], DeviceRecord)
+    assert devices["device-1"] == {"mode": "manual", "last_response_time": 100}
+
+
+def test_snapshot_with_device_shares_unchanged_devices() -> None:
+    """Replacing one device should not copy the rest of the snapshot."""
+    base = {"device-1": {"mode": "manual"}, "device-2": {"mode": "pause"}}
+
+    first = _snapshot_with_device(base, "device-1", {"mode": "at_home"})
+    second = _snapshot_with_device(first, "device-3", {"mode": "manual"})
+
+    assert first._base is base
+    assert second._base is base
+    assert base["device-1"] == {"mode": "manual"}
+    assert first == {"device-1": {"mode": "at_home"}, "device-2": {"mode": "pause"}}
+    assert list(second) == ["device-1", "device-2", "device-3"]
+    assert len(second) == 3
+    assert second.get("device-3") == {"mode": "manual"}
+    assert second.get("device-4") is None
+
+
+def make_optimistic_burst_coordinator(
+    device_count: int,
+) -> DanfossAllyDataUpdateCoordinator:
+    """Create a coordinator with a fleet of devices and bound listeners."""
+    coordinator = object.__new__(DanfossAllyDataUpdateCoordinator)
+    coordinator.data = {
+        f"device-{index}": _device_record(
+            {"mode": "manual", "manual_mode_fast": 20.0, "last_response_time": 1}
+        )
+        for index in range(device_count)
+    }
+    coordinator.last_update_success = True
+    coordinator.discovery_revision = 0
+    coordinator._pending_expiry = []
+    coordinator.pending_write_stats = PendingWriteStats()
+    coordinator._pending_writes = {}
+    coordinator._listener_index = None
+    coordinator._listeners = {
+        index: (
+            lambda: None,
+            DeviceKeySubscription(f"device-{index}", frozenset({"mode"})),
+        )
+        for index in range(device_count)
+    }
+
+    def set_updated_data(data: object) -> None:
+        coordinator.data = data
+        coordinator.async_update_listeners()
+
+    coordinator.async_set_updated_data = set_updated_data
+    return coordinator
+
+
+def test_optimistic_write_burst_cost_is_flat_in_device_count() -> None:
+    """A burst of optimistic writes should not copy the fleet per write."""
+    coordinator = make_optimistic_burst_coordinator(10_000)
+    fleet = coordinator.data
+
+    for index in range(50):
+        coordinator._async_apply_optimistic_updates(
+            f"device-{index}", {"mode": "pause"}
+        )
+        # Every write shares the polled fleet and copies only written devices.
+        assert coordinator.data._base is fleet
+        assert len(coordinator.data._changes) == index + 1
+
+    assert len(coordinator.data) == 10_000
+    assert coordinator.data["device-49"]["mode"] == "pause"
+    assert coordinator.data["device-50"] is fleet["device-50"]
+
+
+def make_listener_coordinator() -> tuple[
+    DanfossAllyDataUpdateCoordinator, SimpleNamespace
+]:
+    """Create a coordinator stub with one device-bound and one global listener."""
+    coordinator = object.__new__(DanfossAllyDataUpdateCoordinator)
+    coordinator.telemetry = CoordinatorTelemetry()
+    device_1 = Mock()
+    device_2 = Mock()
+    global_listener = Mock()
+    coordinator.discovery_revision = 0
+    coordinator._listener_index = None
+    coordinator._listeners = {
+        1: (device_1, "device-1"),
+        2: (device_2, "device-2"),
+        3: (global_listener, None),
+    }
+    return coordinator, SimpleNamespace(
+        device_1=device_1,
+        device_2=device_2,
+        global_listener=global_listener,
+    )
+
+
+def test_update_listeners_only_notifies_changed_devices() -> None:
+    """Device-bound listeners should be skipped when their device is unchanged."""
+    coordinator, listeners = make_listener_coordinator()
+    coordinator.last_update_success = True
+    coordinator._refresh_previous_success = True
+    coordinator._refresh_previous_data = {
+        "device-1": {"temperature": 20.5},
+        "device-2": {"temperature": 19.0},
+    }
+    coordinator.data = {
+        "device-1": {"temperature": 21.0},
+        "device-2": {"temperature": 19.0},
+    }
+
+    coordinator._async_refresh_finished()
+    coordinator.async_update_listeners()
+
+    listeners.device_1.assert_called_once()
+    listeners.device_2.assert_not_called()
+    listeners.global_listener.assert_called_once()
+    assert coordinator._device_changes is None
+
+
+def test_update_listeners_notifies_everyone_after_recovery() -> None:
+    """Recovering from a failed refresh should refresh availability everywhere."""
+    coordinator, listeners = make_listener_coordinator()
+    coordinator.last_update_success = True
+    coordinator._refresh_previous_success = False
+    coordinator._refresh_previous_data = {"device-1": {"temperature": 20.5}}
+    coordinator.data = {"device-1": {"temperature": 20.5}}
+
+    coordinator._async_refresh_finished()
+    coordinator.async_update_listeners()
+
+    listeners.device_1.assert_called_once()
+    listeners.device_2.assert_called_once()
+    listeners.global_listener.assert_called_once()
+
+
+def test_update_listeners_filters_key_subscriptions() -> None:
+    """Key subscriptions should only fire when one of their keys changed."""
+    coordinator = object.__new__(DanfossAllyDataUpdateCoordinator)
+    battery_listener = Mock()
+    climate_listener = Mock()
+    coordinator._listener_index = None
+    coordinator._listeners = {
+        1: (
+            battery_listener,
+            DeviceKeySubscription("device-1", frozenset({"battery"})),
+        ),
+        2: (
+            climate_listener,
+            DeviceKeySubscription("device-1", frozenset({"mode", "work_state"})),
+        ),
+    }
+    coordinator.data = {"device-1": {"battery": 80, "mode": "manual"}}
+    coordinator._device_changes = {"device-1": frozenset({"battery"})}
+
+    coordinator.async_update_listeners()
+
+    battery_listener.assert_called_once()
+    climate_listener.assert_not_called()
+
+
+def test_update_listeners_notifies_subscriptions_of_removed_devices() -> None:
+    """Entities of a removed device should update so they become unavailable."""
+    coordinator = object.__new__(DanfossAllyDataUpdateCoordinator)
+    listener = Mock()
+    coordinator._listener_index = None
+    coordinator._listeners = {
+        1: (listener, DeviceKeySubscription("device-1", frozenset({"battery"}))),
+    }
+    coordinator.data = {}
+    coordinator._device_changes = {"device-1": frozenset({"mode"})}
+
+    coordinator.async_update_listeners()
+
+    listener.assert_called_once()
+
+
+def test_refresh_finished_bumps_discovery_revision_for_new_keys() -> None:
+    """Discovery should only be triggered when devices or their keys change."""
+    coordinator, _listeners = make_listener_coordinator()
+    coordinator.last_update_success = True
+    coordinator._refresh_previous_success = True
+    coordinator._refresh_previous_data = {"device-1": {"temperature": 20.5}}
+    coordinator.data = {"device-1": {"temperature": 21.0}}
+
+    coordinator._async_refresh_finished()
+
+    assert coordinator.discovery_revision == 0
+
+    coordinator._refresh_previous_data = coordinator.data
+    coordinator.data = {"device-1": {"temperature": 21.0, "battery": 80}}
+
+    coordinator._async_refresh_finished()
+
+    assert coordinator.discovery_revision == 1
+
+
+def make_source_index_coordinator(
+    states: list[State],
+) -> DanfossAllyDataUpdateCoordinator:
+    """Create a coordinator stub for source option index tests."""
+    coordinator = object.__new__(DanfossAllyDataUpdateCoordinator)
+    coordinator._source_index = None
+    coordinator._source_option_listeners = []
+    coordinator.hass = SimpleNamespace(
+        states=FakeStates({state.entity_id: state for state in states}),
+        bus=FakeBus(),
+    )
+    return coordinator
+
+
+def test_source_options_are_indexed_once_and_shared() -> None:
+    """Option lists should come from a cached index instead of a state scan."""
+    coordinator = make_source_index_coordinator(
+        [
+            State("sensor.kitchen", "21.5", {"device_class": "temperature"}),
+            State("sensor.attic", "19.0", {"unit_of_measurement": "°C"}),
+            State("sensor.power", "12", {"unit_of_measurement": "W"}),
+            State("binary_sensor.window", "off", {"device_class": "window"}),
+            State("binary_sensor.motion", "off", {"device_class": "motion"}),
+        ]
+    )
+
+    temperature_options = coordinator.get_temperature_entity_options()
+
+    assert temperature_options == ("sensor.attic", "sensor.kitchen")
+    assert coordinator.get_window_entity_options() == ("binary_sensor.window",)
+    assert coordinator.get_temperature_entity_options() is temperature_options
+    assert [call[0] for call in coordinator.hass.bus.listen_calls] == [
+        EVENT_STATE_CHANGED,
+        "entity_registry_updated",
+    ]
+
+
+def test_source_index_follows_state_changes() -> None:
+    """State change events should update the cached option lists incrementally."""
+    coordinator = make_source_index_coordinator(
+        [State("sensor.kitchen", "21.5", {"device_class": "temperature"})]
+    )
+    previous_options = coordinator.get_temperature_entity_options()
+    _event_type, handle_state_changed = coordinator.hass.bus.listen_calls[0]
+
+    handle_state_changed(
+        SimpleNamespace(
+            data={
+                "entity_id": "sensor.bedroom",
+                "new_state": State(
+                    "sensor.bedroom", "20.0", {"device_class": "temperature"}
+                ),
+            }
+        )
+    )
+    handle_state_changed(
+        SimpleNamespace(data={"entity_id": "sensor.kitchen", "new_state": None})
+    )
+
+    assert previous_options == ("sensor.kitchen",)
+    assert coordinator.get_temperature_entity_options() == ("sensor.bedroom",)
+
+
+def test_source_option_listeners_only_hear_membership_changes() -> None:
+    """Source selects should re-render when an option appears, not on readings."""
+    coordinator = make_source_index_coordinator(
+        [State("sensor.kitchen", "21.5", {"device_class": "temperature"})]
+    )
+    calls: list[str] = []
+    coordinator.async_add_source_options_listener(lambda: calls.append("options"))
+    coordinator.get_temperature_entity_options()
+    _event_type, handle_state_changed = coordinator.hass.bus.listen_calls[0]
+
+    handle_state_changed(
+        SimpleNamespace(
+            data={
+                "entity_id": "sensor.kitchen",
+                "new_state": State(
+                    "sensor.kitchen", "22.0", {"device_class": "temperature"}
+                ),
+            }
+        )
+    )
+    assert calls == []
+
+    handle_state_changed(
+        SimpleNamespace(
+            data={
+                "entity_id": "binary_sensor.window",
+                "new_state": State(
+                    "binary_sensor.window", "off", {"device_class": "window"}
+                ),
+            }
+        )
+    )
+    assert calls == ["options"]
@@ -19,7 +19,16 @@ async def test_diagnostics_redacts_secrets() -> None:
         title="Danfoss Ally",
         data={"key": "secret-key", "secret": "secret-value"},
         runtime_data=SimpleNamespace(
-            coordinator=SimpleNamespace(data={"device-1": {"name": "Living room"}})
+            coordinator=SimpleNamespace(
+                data={"device-1": {"name": "Living room"}},
+                get_write_queue_diagnostics=lambda: {"queue_depth": 0},
+                get_telemetry_diagnostics=lambda: {"polls": 3},
+                get_api_budget_diagnostics=lambda: {"used": 12},
+                get_circuit_diagnostics=lambda: {"state": "closed"},
+                get_retry_backoff_diagnostics=lambda: {"classes": {}},
+                get_degraded_diagnostics=lambda: {"degraded": False},
+                get_device_refresh_diagnostics=lambda: {},
+            )
         ),
     )
 
@@ -27,3 +36,10 @@ async def test_diagnostics_redacts_secrets() -> None:
 
     assert diagnostics["entry"]["data"]["key"] == "**REDACTED**"
     assert diagnostics["entry"]["data"]["secret"] == "**REDACTED**"
+    assert diagnostics["write_queue"] == {"queue_depth": 0}
+    assert diagnostics["telemetry"] == {"polls": 3}
+    assert diagnostics["api_budget"] == {"used": 12}
+    assert diagnostics["circuit_breaker"] == {"state": "closed"}
+    assert diagnostics["retry_backoff"] == {"classes": {}}
+    assert diagnostics["degraded_mode"] == {"degraded": False}
+    assert diagnostics["device_refresh"] == {}
@@ -17,6 +17,7 @@ class FakeCoordinator:
 
     def __init__(self, data):
         self.data = data
+        self.discovery_revision = 0
         self._listeners = []
 
     def async_add_listener(self, listener):
@@ -27,8 +28,10 @@ class FakeCoordinator:
 
         return remove_listener
 
-    def fire_update(self) -> None:
+    def fire_update(self, *, devices_changed: bool = True) -> None:
         """Run registered update listeners."""
+        if devices_changed:
+            self.discovery_revision += 1
         for listener in list(self._listeners):
             listener()
 
@@ -60,8 +63,8 @@ def test_dynamic_platform_setup_adds_new_entities_on_coordinator_updates() -> No
     def async_add_entities(entities):
         added_batches.append([entity.unique_id for entity in entities])
 
-    def entity_factory(coordinator):
-        return [DummyEntity(f"entity-{device_id}") for device_id in coordinator.data]
+    def entity_factory(coordinator, device_ids):
+        return [DummyEntity(f"entity-{device_id}") for device_id in device_ids]
 
     async_setup_dynamic_platform_entities(entry, async_add_entities, entity_factory)
 
@@ -77,6 +80,57 @@ def test_dynamic_platform_setup_adds_new_entities_on_coordinator_updates() -> No
     assert added_batches == [["entity-device-1"], ["entity-device-2"]]
 
 
+def test_dynamic_platform_setup_only_builds_entities_for_new_devices() -> None:
+    """Discovery should skip the factory unless devices or their keys changed."""
+    coordinator = FakeCoordinator({"device-1": {"online": True}})
+    entry = SimpleNamespace(
+        runtime_data=SimpleNamespace(coordinator=coordinator),
+        async_on_unload=lambda func: None,
+    )
+    factory_calls: list[list[str]] = []
+
+    def entity_factory(coordinator, device_ids):
+        factory_calls.append(list(device_ids))
+        return [
+            DummyEntity(f"entity-{device_id}-{key}")
+            for device_id in device_ids
+            for key in coordinator.data[device_id]
+        ]
+
+    async_setup_dynamic_platform_entities(entry, lambda entities: None, entity_factory)
+    coordinator.fire_update(devices_changed=False)
+    coordinator.data["device-1"] = {"online": True, "battery": 90}
+    coordinator.fire_update()
+    coordinator.data["device-2"] = {"online": True}
+    coordinator.fire_update()
+
+    assert factory_calls == [["device-1"], ["device-1"], ["device-2"]]
+
+
+def test_dynamic_platform_setup_recreates_entities_of_returning_devices() -> None:
+    """A device removed and later rediscovered should get its entities back."""
+    coordinator = FakeCoordinator({"device-1": {"online": True}})
+    entry = SimpleNamespace(
+        runtime_data=SimpleNamespace(coordinator=coordinator),
+        async_on_unload=lambda func: None,
+    )
+    added_batches: list[list[str]] = []
+
+    def async_add_entities(entities):
+        added_batches.append([entity.unique_id for entity in entities])
+
+    def entity_factory(coordinator, device_ids):
+        return [DummyEntity(f"entity-{device_id}") for device_id in device_ids]
+
+    async_setup_dynamic_platform_entities(entry, async_add_entities, entity_factory)
+    coordinator.data = {}
+    coordinator.fire_update()
+    coordinator.data = {"device-1": {"online": True}}
+    coordinator.fire_update()
+
+    assert added_batches == [["entity-device-1"], ["entity-device-1"]]
+
+
 def test_danfoss_entity_becomes_unavailable_when_device_disappears() -> None:
     """Entities should not crash when a previously known device disappears."""
     coordinator = FakeCoordinator(
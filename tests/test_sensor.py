@@ -2,11 +2,22 @@
 
 from __future__ import annotations
 
+from types import SimpleNamespace
+
 from custom_components.danfoss_ally.binary_sensor import (
     BINARY_SENSORS,
     DanfossAllyBinarySensor,
 )
-from custom_components.danfoss_ally.sensor import DanfossAllySensor, SENSORS
+from custom_components.danfoss_ally.coordinator import (
+    CoordinatorTelemetry,
+    PendingWriteStats,
+)
+from custom_components.danfoss_ally.sensor import (
+    DanfossAllySensor,
+    DanfossAllyTelemetrySensor,
+    SENSORS,
+    TELEMETRY_SENSORS,
+)
 
 
 class FakeCoordinator:
@@ -82,6 +93,31 @@ def test_sensor_handles_missing_device_after_discovery() -> None:
     assert entity.native_value is None
 
 
+def test_telemetry_sensors_report_coordinator_counters() -> None:
+    """Telemetry sensors should read their values from the coordinator."""
+    coordinator = FakeCoordinator({})
+    coordinator.telemetry = CoordinatorTelemetry()
+    coordinator.telemetry.record_poll(1.25, api_calls=3, values_parsed=12)
+    coordinator.telemetry.record_retry("timeout")
+    coordinator.pending_write_stats = PendingWriteStats()
+    coordinator.pending_write_count = 2
+    coordinator.rate_limit_forecast = None
+    entry = SimpleNamespace(entry_id="entry-1", title="Danfoss Ally")
+
+    values = {
+        description.key: DanfossAllyTelemetrySensor(
+            coordinator, entry, description
+        ).native_value
+        for description in TELEMETRY_SENSORS
+    }
+
+    assert values["poll_duration"] == 1.25
+    assert values["poll_api_calls"] == 3
+    assert values["pending_writes"] == 2
+    assert values["api_retries"] == 1
+    assert values["rate_limit_forecast"] is None
+
+
 def test_open_window_binary_sensor_becomes_unavailable_when_window_source_is_configured() -> (
     None
 ):
@@ -122,3 +158,13 @@ def test_open_window_binary_sensor_becomes_unavailable_when_window_detection_is_
     entity = DanfossAllyBinarySensor(coordinator, "device-1", description)
 
     assert entity.available is False
+
+
+def test_sensor_subscribes_to_its_device_keys() -> None:
+    """Sensors should only subscribe to the device values they read."""
+    coordinator = FakeCoordinator({"device-1": {"battery": 95}})
+    description = next(item for item in SENSORS if item.key == "battery")
+    entity = DanfossAllySensor(coordinator, "device-1", description)
+
+    assert entity.coordinator_context.device_id == "device-1"
+    assert entity.coordinator_context.keys == frozenset({"battery", "online"})